@@ -0,0 +1,92 @@
+# Copyright 2008-2021 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the dataelem module."""
+
+from io import BytesIO
+import tracemalloc
+
+from pydicom import dcmread
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.uid import ExplicitVRLittleEndian, generate_uid
+
+
+def _multiframe_header(nr_frames):
+    """Return an encoded enhanced multi-frame style header with per-frame
+    functional groups.
+    """
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = '1.2.840.10008.5.1.4.1.1.4.1'
+    ds.file_meta.MediaStorageSOPInstanceUID = generate_uid()
+    ds.is_little_endian = True
+    ds.is_implicit_VR = False
+    ds.SOPClassUID = ds.file_meta.MediaStorageSOPClassUID
+    ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID
+    ds.PatientName = 'CITIZEN^Jan'
+    ds.NumberOfFrames = nr_frames
+    frames = []
+    for ii in range(nr_frames):
+        item = Dataset()
+        content = Dataset()
+        content.FrameAcquisitionNumber = ii
+        content.InStackPositionNumber = ii + 1
+        content.StackID = '1'
+        content.DimensionIndexValues = [1, ii + 1]
+        item.FrameContentSequence = [content]
+        position = Dataset()
+        position.ImagePositionPatient = [-100.0, -100.0, ii * 1.5]
+        item.PlanePositionSequence = [position]
+        orientation = Dataset()
+        orientation.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+        item.PlaneOrientationSequence = [orientation]
+        frame_type = Dataset()
+        frame_type.FrameType = ['ORIGINAL', 'PRIMARY', 'M', 'NONE']
+        frame_type.PixelPresentation = 'MONOCHROME'
+        frame_type.VolumetricProperties = 'VOLUME'
+        item.MRImageFrameTypeSequence = [frame_type]
+        voi = Dataset()
+        voi.WindowCenter = 400
+        voi.WindowWidth = 800
+        item.FrameVOILUTSequence = [voi]
+        frames.append(item)
+
+    ds.PerFrameFunctionalGroupsSequence = frames
+    fp = BytesIO()
+    ds.save_as(fp, write_like_original=False)
+    return fp.getvalue()
+
+
+def _read_all(data):
+    """Return the dataset read from `data` with all elements converted."""
+    ds = dcmread(BytesIO(data))
+    for elem in ds.iterall():
+        pass
+
+    return ds
+
+
+class TimeMultiFrameHeader:
+    """Time and memory tests for a large multi-frame header."""
+    def setup(self):
+        """Setup the test"""
+        self.data = _multiframe_header(2000)
+
+    def time_read(self):
+        """Time reading and converting the elements."""
+        _read_all(self.data)
+
+    def peakmem_read(self):
+        """Peak memory reading and converting the elements."""
+        _read_all(self.data)
+
+    def track_memory(self):
+        """Memory used by the dataset once all elements are converted."""
+        tracemalloc.start()
+        ds = _read_all(self.data)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        # The dataset is only kept so it's included in the traced memory
+        del ds
+        return size
+
+    track_memory.unit = "bytes"
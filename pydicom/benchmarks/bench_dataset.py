@@ -0,0 +1,358 @@
+# Copyright 2008-2021 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the dataset module."""
+
+import copy
+from io import BytesIO
+import os
+import tempfile
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+from pydicom.dataset import Dataset, FileMetaDataset
+from pydicom.filebase import DicomBytesIO, DicomFileLike
+from pydicom.filewriter import write_dataset, patch_in_place
+from pydicom.uid import DeflatedExplicitVRLittleEndian
+
+
+def _functional_group(index):
+    """Return a per-frame functional group item for frame `index`."""
+    item = Dataset()
+    content = Dataset()
+    content.FrameAcquisitionNumber = index
+    content.InStackPositionNumber = index + 1
+    content.StackID = '1'
+    content.DimensionIndexValues = [1, index + 1]
+    item.FrameContentSequence = [content]
+    position = Dataset()
+    position.ImagePositionPatient = [-100.0, -100.0, index * 1.5]
+    item.PlanePositionSequence = [position]
+    voi = Dataset()
+    voi.WindowCenter = 400
+    voi.WindowWidth = 800
+    item.FrameVOILUTSequence = [voi]
+
+    return item
+
+
+def _large_dataset(nr_elements, nr_frames):
+    """Return a dataset with `nr_elements` private top-level elements and a
+    per-frame functional groups sequence with `nr_frames` items.
+    """
+    ds = Dataset()
+    ds.is_little_endian = True
+    ds.is_implicit_VR = False
+    ds.PatientName = 'CITIZEN^Jan'
+    ds.NumberOfFrames = nr_frames
+    ds.PerFrameFunctionalGroupsSequence = [
+        _functional_group(ii) for ii in range(nr_frames)
+    ]
+    for group in range(0x0009, 0x0009 + 2 * (nr_elements // 0xFF + 1), 2):
+        ds.add_new((group, 0x0010), 'LO', 'ACME')
+        for elem in range(0x1000, 0x10FF):
+            ds.add_new((group, elem), 'US', elem)
+            if len(ds) >= nr_elements:
+                return ds
+
+    return ds
+
+
+class TimeIterateDataset:
+    """Time tests for repeatedly iterating a large dataset."""
+    def setup(self):
+        """Setup the test"""
+        self.ds = _large_dataset(5000, 500)
+        self.no_runs = 20
+
+    def time_iterate(self):
+        """Time iterating through the top-level elements."""
+        for ii in range(self.no_runs):
+            for elem in self.ds:
+                pass
+
+    def time_elements(self):
+        """Time iterating through the unconverted top-level elements."""
+        for ii in range(self.no_runs):
+            for elem in self.ds.elements():
+                pass
+
+    def time_iterall(self):
+        """Time iterating through all the elements."""
+        for ii in range(self.no_runs):
+            for elem in self.ds.iterall():
+                pass
+
+
+class TimeWriteDataset:
+    """Time tests for repeatedly writing a large dataset."""
+    def setup(self):
+        """Setup the test"""
+        self.ds = _large_dataset(5000, 500)
+        fp = BytesIO()
+        self.ds.save_as(fp, write_like_original=True)
+        self.data = fp.getvalue()
+        self.no_runs = 5
+
+    def time_write(self):
+        """Time writing the dataset."""
+        for ii in range(self.no_runs):
+            fp = DicomBytesIO()
+            fp.is_little_endian = True
+            fp.is_implicit_VR = False
+            write_dataset(fp, self.ds)
+
+    def time_read_write(self):
+        """Time reading the dataset and writing it twice."""
+        ds = dcmread(BytesIO(self.data), force=True)
+        for ii in range(2):
+            ds.save_as(BytesIO(), write_like_original=True)
+
+
+class TimeWritePixelData:
+    """Time and memory tests for writing a dataset with large pixel data."""
+    def setup(self):
+        """Setup the test"""
+        self.ds = _large_dataset(100, 10)
+        self.ds.BitsAllocated = 16
+        self.ds.PixelData = b'\x00\x01' * 64 * 1024 * 1024
+
+    def _write(self):
+        with open(os.devnull, 'wb') as f:
+            fp = DicomFileLike(f)
+            fp.is_little_endian = True
+            fp.is_implicit_VR = False
+            write_dataset(fp, self.ds)
+
+    def time_write(self):
+        """Time writing the dataset."""
+        self._write()
+
+    def peakmem_write(self):
+        """Peak memory writing the dataset."""
+        self._write()
+
+
+KEYWORDS = [
+    'PatientName', 'PatientID', 'PatientBirthDate', 'PatientSex',
+    'StudyInstanceUID', 'SeriesInstanceUID', 'SOPInstanceUID', 'Modality',
+    'StudyDate', 'SeriesNumber', 'InstanceNumber', 'Rows', 'Columns',
+    'BitsAllocated', 'BitsStored', 'PixelRepresentation',
+]
+
+
+class TimeKeywordAccess:
+    """Time tests for getting and setting element values by keyword."""
+    def setup(self):
+        """Setup the test"""
+        self.ds = dcmread(get_testdata_file("CT_small.dcm"))
+        for keyword in KEYWORDS:
+            getattr(self.ds, keyword, None)
+
+        self.values = [
+            (keyword, getattr(self.ds, keyword)) for keyword in KEYWORDS
+            if keyword in self.ds
+        ]
+        self.no_runs = 10000
+
+    def time_getattr(self):
+        """Time getting element values by keyword."""
+        ds = self.ds
+        for ii in range(self.no_runs):
+            for keyword, _ in self.values:
+                getattr(ds, keyword)
+
+    def time_getattr_missing(self):
+        """Time getting the values of absent elements by keyword."""
+        ds = self.ds
+        for ii in range(self.no_runs):
+            getattr(ds, 'AccessionNumber', None)
+            getattr(ds, 'ReferringPhysicianName', None)
+
+    def time_setattr(self):
+        """Time setting element values by keyword."""
+        ds = self.ds
+        for ii in range(self.no_runs):
+            for keyword, value in self.values:
+                setattr(ds, keyword, value)
+
+
+class TimeDecodeAll:
+    """Time tests for converting all the raw elements."""
+    def setup(self):
+        """Setup the test"""
+        fp = BytesIO()
+        _large_dataset(5000, 500).save_as(fp, write_like_original=True)
+        self.data = fp.getvalue()
+
+    def time_decode_all(self):
+        """Time converting the elements with decode_all()."""
+        ds = dcmread(BytesIO(self.data), force=True)
+        ds.decode_all()
+
+    def time_iterall(self):
+        """Time converting the elements by accessing them."""
+        ds = dcmread(BytesIO(self.data), force=True)
+        for elem in ds.iterall():
+            pass
+
+
+class TimeCloneDataset:
+    """Time tests for copying a large dataset."""
+    def setup(self):
+        """Setup the test"""
+        fp = BytesIO()
+        _large_dataset(5000, 500).save_as(fp, write_like_original=True)
+        self.ds = dcmread(BytesIO(fp.getvalue()), force=True)
+        self.ds.decode_all()
+
+    def time_deepcopy(self):
+        """Time a deep copy and changing an element."""
+        ds = copy.deepcopy(self.ds)
+        ds.PatientName = 'ANON'
+
+    def time_clone(self):
+        """Time a copy-on-write clone and changing an element."""
+        ds = self.ds.clone()
+        ds.PatientName = 'ANON'
+
+    def time_clone_write(self):
+        """Time a copy-on-write clone, changing an element and writing."""
+        ds = self.ds.clone()
+        ds.PatientName = 'ANON'
+        ds.save_as(BytesIO(), write_like_original=True)
+
+
+class TimeTraverse:
+    """Time tests for traversing a dataset with nested sequences."""
+    def setup(self):
+        """Setup the test"""
+        fp = BytesIO()
+        _large_dataset(100, 2000).save_as(fp, write_like_original=True)
+        self.data = fp.getvalue()
+
+    def time_iterall(self):
+        """Time finding the PN, DA, UI and LO elements with iterall()."""
+        ds = dcmread(BytesIO(self.data), force=True)
+        VRs = ('PN', 'DA', 'UI', 'LO')
+        [elem for elem in ds.iterall() if elem.VR in VRs]
+
+    def time_traverse(self):
+        """Time finding the PN, DA, UI and LO elements with traverse()."""
+        ds = dcmread(BytesIO(self.data), force=True)
+        list(ds.traverse(VRs=['PN', 'DA', 'UI', 'LO']))
+
+    def time_traverse_raw(self):
+        """Time finding the raw PN, DA, UI and LO elements."""
+        ds = dcmread(BytesIO(self.data), force=True)
+        list(ds.traverse(VRs=['PN', 'DA', 'UI', 'LO'], convert=False))
+
+
+class TimeDigest:
+    """Time tests for Dataset.digest()."""
+    def setup(self):
+        """Setup the test"""
+        fp = BytesIO()
+        _large_dataset(100, 2000).save_as(fp, write_like_original=True)
+        self.data = fp.getvalue()
+
+    def time_digest_raw(self):
+        """Time the digest of a dataset with raw elements."""
+        dcmread(BytesIO(self.data), force=True).digest()
+
+    def time_digest_converted(self):
+        """Time the digest of a dataset with converted elements."""
+        ds = dcmread(BytesIO(self.data), force=True)
+        ds.decode_all()
+        ds.digest()
+
+
+class TimePatchInPlace:
+    """Time tests for changing an element in a file with large pixel data."""
+    def setup(self):
+        """Setup the test"""
+        ds = _large_dataset(100, 10)
+        ds.PatientID = '12345678'
+        ds.BitsAllocated = 16
+        ds.PixelData = b'\x00\x01' * 64 * 1024 * 1024
+        fd, self.path = tempfile.mkstemp(suffix='.dcm')
+        os.close(fd)
+        ds.save_as(self.path, write_like_original=True)
+
+    def teardown(self):
+        """Remove the test file"""
+        os.remove(self.path)
+
+    def time_patch_in_place(self):
+        """Time patching the Patient ID in place."""
+        patch_in_place(self.path, {'PatientID': 'ANON'})
+
+    def time_read_write(self):
+        """Time changing the Patient ID by reading and writing the file."""
+        ds = dcmread(self.path, force=True)
+        ds.PatientID = 'ANON'
+        ds.save_as(self.path, write_like_original=True)
+
+
+def _structured_report(nr_items):
+    """Return a Comprehensive SR dataset with `nr_items` content items."""
+    ds = Dataset()
+    ds.file_meta = FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = DeflatedExplicitVRLittleEndian
+    ds.is_little_endian = True
+    ds.is_implicit_VR = False
+    ds.SOPClassUID = '1.2.840.10008.5.1.4.1.1.88.33'
+    ds.PatientName = 'CITIZEN^Jan'
+    ds.ValueType = 'CONTAINER'
+    items = []
+    for ii in range(nr_items):
+        item = Dataset()
+        item.RelationshipType = 'CONTAINS'
+        item.ValueType = 'NUM'
+        concept = Dataset()
+        concept.CodeValue = f'{ii:06d}'
+        concept.CodingSchemeDesignator = 'DCM'
+        concept.CodeMeaning = f'Measurement {ii}'
+        item.ConceptNameCodeSequence = [concept]
+        value = Dataset()
+        value.NumericValue = f'{ii * 0.25:.2f}'
+        unit = Dataset()
+        unit.CodeValue = 'mm'
+        unit.CodingSchemeDesignator = 'UCUM'
+        unit.CodeMeaning = 'millimeter'
+        value.MeasurementUnitsCodeSequence = [unit]
+        item.MeasuredValueSequence = [value]
+        items.append(item)
+
+    ds.ContentSequence = items
+    ds['ContentSequence'].is_undefined_length = True
+    return ds
+
+
+class TimeWriteDeflated:
+    """Time, memory and compression ratio tests for writing a large
+    structured report with the Deflated Explicit VR Little Endian transfer
+    syntax.
+    """
+    def setup(self):
+        """Setup the test"""
+        self.ds = _structured_report(10000)
+
+    def _write(self):
+        fp = BytesIO()
+        self.ds.save_as(fp, write_like_original=True)
+        return fp
+
+    def time_write(self):
+        """Time writing the dataset."""
+        self._write()
+
+    def peakmem_write(self):
+        """Peak memory writing the dataset."""
+        self._write()
+
+    def track_ratio(self):
+        """Track the ratio of the uncompressed and deflated lengths."""
+        fp = BytesIO()
+        self.ds.file_meta.TransferSyntaxUID = '1.2.840.10008.1.2.1'
+        self.ds.save_as(fp, write_like_original=True)
+        self.ds.file_meta.TransferSyntaxUID = DeflatedExplicitVRLittleEndian
+        return len(fp.getvalue()) / len(self._write().getvalue())
@@ -1,6 +1,9 @@
 # Copyright 2008-2018 pydicom authors. See LICENSE file for details.
 """Benchmarks for the encaps module."""
 
+import os
+import tempfile
+
 from pydicom import dcmread
 from pydicom.data import get_testdata_file
 from pydicom.encaps import (
@@ -9,6 +12,7 @@ from pydicom.encaps import (
     encapsulate,
     decode_data_sequence
 )
+from pydicom.filewriter import EncapsulatedFrameWriter
 
 
 JP2K_10FRAME = get_testdata_file('emri_small_jpeg_2k_lossless.dcm')
@@ -86,3 +90,37 @@ class TimeEncapsulate:
         """Time encapsulating frames with 10 fragments per frame."""
         for ii in range(self.no_runs):
             encapsulate(self.test_data, 10, has_bot=False)
+
+
+class TimeEncapsulatedFrameWriter:
+    """Time and memory tests for writing many frames."""
+    def setup(self):
+        """Setup the test"""
+        self.ds = dcmread(JP2K_10FRAME)
+        del self.ds.PixelData
+        self.ds.NumberOfFrames = 200
+        fd, self.path = tempfile.mkstemp(suffix='.dcm')
+        os.close(fd)
+
+    def teardown(self):
+        """Remove the test file"""
+        os.remove(self.path)
+
+    def _frames(self):
+        for ii in range(200):
+            yield bytes([ii % 256]) * 1024 * 1024
+
+    def time_frame_writer(self):
+        """Time writing the frames one at a time."""
+        with EncapsulatedFrameWriter(self.path, self.ds) as writer:
+            writer.write_frames(self._frames())
+
+    def peakmem_frame_writer(self):
+        """Peak memory writing the frames one at a time."""
+        with EncapsulatedFrameWriter(self.path, self.ds) as writer:
+            writer.write_frames(self._frames())
+
+    def peakmem_encapsulate(self):
+        """Peak memory encapsulating the frames and writing the dataset."""
+        self.ds.add_new('PixelData', 'OB', encapsulate(list(self._frames())))
+        self.ds.save_as(self.path, write_like_original=True)
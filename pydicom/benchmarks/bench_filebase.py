@@ -0,0 +1,35 @@
+# Copyright 2008-2021 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the filebase module."""
+
+from pydicom import dcmread
+from pydicom.data import get_testdata_file
+from pydicom.filebase import DicomBufferedReader
+
+
+CT = get_testdata_file("CT_small.dcm")
+RTPLAN = get_testdata_file("rtplan.dcm")
+
+
+class TimeDicomBufferedReader:
+    """Time tests for reading unbuffered files with DicomBufferedReader."""
+    def time_unbuffered_ct(self):
+        """Time reading an unbuffered file without read-ahead."""
+        with open(CT, 'rb', buffering=0) as f:
+            dcmread(f, stop_before_pixels=True)
+
+    def time_buffered_ct(self):
+        """Time reading an unbuffered file with read-ahead."""
+        with open(CT, 'rb', buffering=0) as f:
+            dcmread(DicomBufferedReader(f), stop_before_pixels=True)
+
+    def time_unbuffered_rtplan(self):
+        """Time reading an unbuffered file with sequences without
+        read-ahead.
+        """
+        with open(RTPLAN, 'rb', buffering=0) as f:
+            dcmread(f)
+
+    def time_buffered_rtplan(self):
+        """Time reading an unbuffered file with sequences with read-ahead."""
+        with open(RTPLAN, 'rb', buffering=0) as f:
+            dcmread(DicomBufferedReader(f))
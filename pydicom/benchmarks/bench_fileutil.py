@@ -0,0 +1,85 @@
+# Copyright 2008-2021 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the fileutil module."""
+
+from io import BytesIO
+import os
+import tempfile
+
+from pydicom import dcmread
+from pydicom.dataset import Dataset
+from pydicom.fileutil import find_bytes, read_undefined_length_value
+from pydicom.tag import SequenceDelimiterTag
+from pydicom.uid import ExplicitVRLittleEndian
+
+
+# (FFFE,E0DD) Sequence Delimitation Item, little endian
+DELIMITER = b"\xFE\xFF\xDD\xE0\x00\x00\x00\x00"
+# A value that isn't encapsulated pixel data, so has to be scanned
+BLOB_32MB = b"\x01\x02\x03\x04\x05\x06\x07\x08" * (4 * 1024 * 1024)
+
+
+class TimeFindBytes:
+    """Time tests for fileutil.find_bytes."""
+    def setup(self):
+        """Setup the test"""
+        self.fp = BytesIO(BLOB_32MB + DELIMITER)
+
+    def time_find_32mb(self):
+        """Time finding a delimiter after 32 MB."""
+        self.fp.seek(0)
+        find_bytes(self.fp, DELIMITER[:4])
+
+
+class TimeReadUndefinedLengthValue:
+    """Time tests for fileutil.read_undefined_length_value."""
+    def setup(self):
+        """Setup the test"""
+        self.fp = BytesIO(BLOB_32MB + DELIMITER)
+
+    def time_read_32mb(self):
+        """Time reading a 32 MB undefined length value."""
+        self.fp.seek(0)
+        read_undefined_length_value(self.fp, True, SequenceDelimiterTag)
+
+    def time_defer_32mb(self):
+        """Time skipping a deferred 32 MB undefined length value."""
+        self.fp.seek(0)
+        read_undefined_length_value(
+            self.fp, True, SequenceDelimiterTag, defer_size=1024
+        )
+
+
+class TimeReadUndefinedLengthBlob:
+    """Time reading a dataset with a large undefined length private blob."""
+    def setup(self):
+        """Setup the test"""
+        ds = Dataset()
+        ds.is_little_endian = True
+        ds.is_implicit_VR = False
+        ds.PatientName = "Citizen^Jan"
+        ds.add_new(0x00091010, 'LO', 'PRIVATE')
+        ds.add_new(0x00091001, 'OB', BLOB_32MB)
+        ds[0x00091001].is_undefined_length = True
+        ds.file_meta = Dataset()
+        ds.file_meta.TransferSyntaxUID = ExplicitVRLittleEndian
+        ds.preamble = b"\x00" * 128
+
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        ds.save_as(self.path)
+
+    def teardown(self):
+        """Remove the test file"""
+        os.remove(self.path)
+
+    def time_dcmread(self):
+        """Time reading the dataset."""
+        dcmread(self.path)
+
+    def time_dcmread_mmap(self):
+        """Time reading the memory-mapped dataset."""
+        dcmread(self.path, mmap=True)
+
+    def time_dcmread_deferred(self):
+        """Time reading the dataset with the blob deferred."""
+        dcmread(self.path, defer_size=1024)
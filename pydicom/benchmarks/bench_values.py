@@ -0,0 +1,77 @@
+# Copyright 2008-2021 pydicom authors. See LICENSE file for details.
+"""Benchmarks for the values module."""
+
+from pydicom import config
+from pydicom.values import (
+    convert_numbers, convert_DS_string, convert_IS_string
+)
+
+
+class TimeConvertNumbers:
+    """Time tests for converting large binary numeric values."""
+    def setup(self):
+        """Setup the test"""
+        self.original = config.use_numbers_numpy
+        self.data = b'\x00\x01\x02\x03\x04\x05\x06\x07' * 500000
+
+    def teardown(self):
+        """Restore the config"""
+        config.use_numbers_numpy = self.original
+
+    def time_convert_us(self):
+        """Time converting US values to a list."""
+        config.use_numbers_numpy = False
+        convert_numbers(self.data, True, 'H')
+
+    def time_convert_fd(self):
+        """Time converting FD values to a list."""
+        config.use_numbers_numpy = False
+        convert_numbers(self.data, True, 'd')
+
+    def time_convert_us_numpy(self):
+        """Time converting US values to an ndarray view."""
+        config.use_numbers_numpy = True
+        convert_numbers(self.data, True, 'H')
+
+    def time_convert_fd_numpy(self):
+        """Time converting FD values to an ndarray view."""
+        config.use_numbers_numpy = True
+        convert_numbers(self.data, True, 'd')
+
+
+class TimeConvertDSIS:
+    """Time tests for converting large DS and IS values, such as the
+    Contour Data in an RT Structure Set.
+    """
+    def setup(self):
+        """Setup the test"""
+        self.original = (config.use_DS_numpy, config.use_IS_numpy)
+        self.ds = b"\\".join(
+            [b"%.4f" % (ii / 7 - 500) for ii in range(300000)]
+        )
+        self.is_ = b"\\".join([b"%d" % (ii - 500) for ii in range(300000)])
+
+    def teardown(self):
+        """Restore the config"""
+        config.DS_numpy(self.original[0])
+        config.use_IS_numpy = self.original[1]
+
+    def time_convert_ds(self):
+        """Time converting DS values to a MultiValue."""
+        config.DS_numpy(False)
+        convert_DS_string(self.ds, True)
+
+    def time_convert_ds_numpy(self):
+        """Time converting DS values to an ndarray."""
+        config.DS_numpy(True)
+        convert_DS_string(self.ds, True)
+
+    def time_convert_is(self):
+        """Time converting IS values to a MultiValue."""
+        config.use_IS_numpy = False
+        convert_IS_string(self.is_, True)
+
+    def time_convert_is_numpy(self):
+        """Time converting IS values to an ndarray."""
+        config.use_IS_numpy = True
+        convert_IS_string(self.is_, True)
@@ -131,6 +131,16 @@ Default: ``False``.
 .. versionadded:: 2.0
 """
 
+use_numbers_numpy = False
+"""Set to ``True`` to have multi-valued elements with a VR of **FD**, **FL**,
+**SL**, **SS**, **SV**, **UL**, **US** or **UV** returned as read-only
+:class:`numpy.ndarray` views of the encoded values rather than copied into a
+:class:`list`. Single values are still returned as :class:`int` or
+:class:`float`. Default: ``False``.
+
+.. versionadded:: 2.2
+"""
+
 allow_DS_float = False
 """Set to ``True`` to allow :class:`~pydicom.valuerep.DSdecimal`
 instances to be created using :class:`floats<float>`; otherwise, they must be
@@ -190,6 +200,28 @@ of :class:`~pydicom.dataset.Dataset` begin with a separate section
 displaying the file meta information data elements
 """
 
+deferred_read_cache_size = 0
+"""The maximum number of files kept open for reading deferred elements.
+
+.. versionadded:: 2.2
+
+If greater than ``0`` then the files used to read the values of deferred
+elements (see the `defer_size` parameter of
+:func:`~pydicom.filereader.dcmread`) are kept open in a least recently used
+cache, rather than being opened and closed for every element read. Use
+:func:`~pydicom.filereader.clear_deferred_read_cache` to close the cached
+files. Default ``0``.
+"""
+
+deflate_level = -1
+"""The :mod:`zlib` compression level used when writing datasets with the
+*Deflated Explicit VR Little Endian* transfer syntax, from ``0`` (no
+compression) to ``9`` (most compression). Default ``-1``, which uses
+:mod:`zlib`'s default level (currently ``6``).
+
+.. versionadded:: 2.2
+"""
+
 # Logging system and debug function to change logging level
 logger = logging.getLogger("pydicom")
 logger.addHandler(logging.NullHandler())
@@ -151,6 +151,9 @@ def add_dict_entries(
 
     # Update the reverse mapping from name to tag
     keyword_dict.update({val[4]: tag for tag, val in new_entries_dict.items()})
+    _keyword_tags.update(
+        {val[4]: BaseTag(tag) for tag, val in new_entries_dict.items()}
+    )
 
 
 def add_private_dict_entry(
@@ -448,6 +451,12 @@ keyword_dict: Dict[str, int] = {
     dictionary_keyword(tag): tag for tag in DicomDictionary
 }
 
+# The same lookup with the tags as BaseTag, used by Dataset for element
+#   access by keyword so the tag doesn't need converting each time
+_keyword_tags: Dict[str, BaseTag] = {
+    keyword: BaseTag(tag) for keyword, tag in keyword_dict.items()
+}
+
 
 def tag_for_keyword(keyword: str) -> Optional[int]:
     """Return the tag of the element corresponding to `keyword`.
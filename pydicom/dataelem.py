@@ -13,6 +13,7 @@ from typing import (
     Optional, Any, Optional, Tuple, Callable, Union, TYPE_CHECKING, Dict,
     TypeVar, Type, List, NamedTuple
 )
+import copyreg
 import warnings
 
 from pydicom import config  # don't import datetime_conversion directly
@@ -34,6 +35,13 @@ from pydicom.valuerep import PersonName
 if config.have_numpy:
     import numpy
 
+try:
+    from pickle import PickleBuffer
+    HAVE_PICKLE_BUFFER = True
+except ImportError:
+    # Python < 3.8
+    HAVE_PICKLE_BUFFER = False
+
 if TYPE_CHECKING:
     from pydicom.dataset import Dataset
 
@@ -43,6 +51,13 @@ BINARY_VR_VALUES = [
     'OB or OW', 'US or OW', 'US or SS or OW', 'FL', 'FD', 'OF', 'OD'
 ]
 
+# VRs whose values may be returned as a view of a memory-mapped file rather
+#   than copied, as their values are never decoded
+_ZERO_COPY_VRS = {'OB', 'OD', 'OF', 'OL', 'OV', 'OW', 'OB or OW'}
+
+# The minimum length of the values pickled as out-of-band buffers
+_PICKLE_BUFFER_MIN_LENGTH = 1024
+
 
 def empty_value_for_VR(
     VR: str, raw: bool = False
@@ -93,6 +108,33 @@ def _is_bytes(val: object) -> bool:
     return isinstance(val, bytes)
 
 
+def _to_pickle_buffer(VR: Optional[str], value: object) -> object:
+    """Return `value` as a :class:`pickle.PickleBuffer` if it should be
+    pickled out-of-band when using pickle protocol 5.
+
+    Large bulk binary values are pickled out-of-band so they can be passed
+    to another process without being copied. :class:`memoryview` values,
+    such as those of a memory-mapped dataset, can only be pickled this way
+    and are otherwise pickled as :class:`bytes`.
+    """
+    if isinstance(value, memoryview) or (
+        VR in _ZERO_COPY_VRS
+        and isinstance(value, (bytes, bytearray))
+        and len(value) >= _PICKLE_BUFFER_MIN_LENGTH
+    ):
+        return PickleBuffer(value)
+
+    return value
+
+
+def _from_pickle_buffer(value: object) -> object:
+    """Return an out-of-band `value` as a :class:`memoryview`."""
+    if HAVE_PICKLE_BUFFER and isinstance(value, PickleBuffer):
+        return value.raw()
+
+    return value
+
+
 # double '\' because it is used as escape chr in Python
 _backslash_str = "\\"
 _backslash_byte = b"\\"
@@ -158,6 +200,15 @@ class DataElement:
         The element's Value Representation.
     """
 
+    # Large datasets may contain many thousands of elements, so store the
+    #   per-element attributes in slots rather than an instance dict. The
+    #   __dict__ slot is only used if other attributes are set on an
+    #   instance, such as overriding the display options below
+    __slots__ = (
+        'tag', 'VR', '_value', 'file_tell', 'is_undefined_length',
+        'private_creator', 'parent', '__dict__'
+    )
+
     descripWidth = 35
     maxBytesToDisplay = 16
     showVR = True
@@ -227,6 +278,36 @@ class DataElement:
         self.private_creator: Optional[str] = None
         self.parent: Optional["Dataset"] = None
 
+    # Add pickling support for the slots
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for cls in type(self).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                if name not in ('__dict__', '__weakref__') and hasattr(
+                    self, name
+                ):
+                    state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        if '_value' in state:
+            state['_value'] = _from_pickle_buffer(state['_value'])
+
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, ...]:
+        """Pickle large bulk binary values out-of-band with protocol 5."""
+        state = self.__getstate__()
+        if protocol >= 5 and HAVE_PICKLE_BUFFER:
+            state['_value'] = _to_pickle_buffer(self.VR, self._value)
+        elif isinstance(self._value, memoryview):
+            # Also used by copy.deepcopy()
+            state['_value'] = self._value.tobytes()
+
+        return copyreg.__newobj__, (type(self), ), state
+
     @classmethod
     def from_json(
         cls: Type[_DataElement],
@@ -362,6 +443,9 @@ class DataElement:
             if not self.is_empty:
                 if self.VM > 1:
                     value = self.value
+                    if config.have_numpy and isinstance(value, numpy.ndarray):
+                        # Convert to the corresponding Python numbers
+                        value = value.tolist()
                 else:
                     value = [self.value]
                 json_element['Value'] = [v for v in value]
@@ -443,7 +527,7 @@ class DataElement:
         """Return the value multiplicity of the element as :class:`int`."""
         if self.value is None:
             return 0
-        if isinstance(self.value, (str, bytes, PersonName)):
+        if isinstance(self.value, (str, bytes, memoryview, PersonName)):
             return 1 if self.value else 0
         try:
             iter(self.value)
@@ -709,6 +793,34 @@ class RawDataElement(NamedTuple):
     is_little_endian: bool
     is_raw: bool = True
 
+    def __reduce_ex__(self, protocol: int) -> Tuple[Any, ...]:
+        """Pickle large bulk binary values out-of-band with protocol 5."""
+        if protocol >= 5 and HAVE_PICKLE_BUFFER:
+            VR = self.VR
+            if VR is None:
+                try:
+                    VR = dictionary_VR(self.tag)
+                except KeyError:
+                    pass
+
+            value = _to_pickle_buffer(VR, self.value)
+            if value is not self.value:
+                return _raw_data_element, tuple(self._replace(value=value))
+        elif isinstance(self.value, memoryview):
+            # Also used by copy.deepcopy()
+            return RawDataElement, tuple(
+                self._replace(value=self.value.tobytes())
+            )
+
+        return RawDataElement, tuple(self)
+
+
+def _raw_data_element(*args: Any) -> RawDataElement:
+    """Return a :class:`RawDataElement` unpickled with an out-of-band value.
+    """
+    raw = RawDataElement(*args)
+    return raw._replace(value=_from_pickle_buffer(raw.value))
+
 
 # The first and third values of the following elements are always US
 #   even if the VR is SS (PS3.3 C.7.6.3.1.5, C.11.1, C.11.2).
@@ -809,10 +921,15 @@ def DataElement_from_raw(
                 "pydicom.config.convert_wrong_length_to_UN = True."
             )
 
-    if raw.tag in _LUT_DESCRIPTOR_TAGS and value:
+    if raw.tag in _LUT_DESCRIPTOR_TAGS:
+        # A read-only ndarray from config.use_numbers_numpy can't be fixed
+        #   in place, and the values are too few to be worth keeping as one
+        if hasattr(value, 'tolist'):
+            value = value.tolist()
+
         # We only fix the first value as the third value is 8 or 16
         try:
-            if value[0] < 0:
+            if len(value) and value[0] < 0:
                 value[0] += 65536
         except TypeError:
             pass
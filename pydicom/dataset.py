@@ -16,6 +16,7 @@ Dataset (dict subclass)
 """
 import copy
 from bisect import bisect_left
+import hashlib
 import io
 from importlib.util import find_spec as have_package
 import inspect  # for __dir__
@@ -24,11 +25,12 @@ import json
 import os
 import os.path
 import re
+from struct import pack
 from types import ModuleType, TracebackType
 from typing import (
     TYPE_CHECKING, Optional, Tuple, Union, List, Any, ItemsView,
     KeysView, Dict, ValuesView, Iterator, BinaryIO, AnyStr,
-    Callable, TypeVar, Type, overload
+    Callable, TypeVar, Type, overload, Set, Iterable
 )
 import warnings
 import weakref
@@ -47,10 +49,12 @@ from pydicom._version import __version_info__
 from pydicom.charset import default_encoding, convert_encodings
 from pydicom.config import logger
 from pydicom.datadict import (
-    dictionary_VR, tag_for_keyword, keyword_for_tag, repeater_has_keyword
+    dictionary_VR, tag_for_keyword, keyword_for_tag, repeater_has_keyword,
+    _keyword_tags
 )
 from pydicom.dataelem import DataElement, DataElement_from_raw, RawDataElement
 from pydicom.fileutil import path_from_pathlike
+from pydicom.multival import MultiValue
 from pydicom.pixel_data_handlers.util import (
     convert_color_space, reshape_pixel_array, get_image_pixel_ids
 )
@@ -59,6 +63,9 @@ from pydicom.uid import (ExplicitVRLittleEndian, ImplicitVRLittleEndian,
                          ExplicitVRBigEndian, PYDICOM_IMPLEMENTATION_UID)
 from pydicom.waveforms import numpy_handler as wave_handler
 
+if config.have_numpy:
+    import numpy
+
 
 class PrivateBlock:
     """Helper class for a private block in the :class:`Dataset`.
@@ -214,6 +221,47 @@ def _dict_equal(
             )
 
 
+# The size of the chunks used when reading deferred values for a digest
+_DIGEST_CHUNK_SIZE = 1024 * 1024
+# The VRs of raw values that are encoded unchanged after conversion, so a
+#   deferred value can be hashed directly from the file
+_DIGEST_STREAMED_VRS = {
+    'OB', 'OD', 'OF', 'OL', 'OV', 'OW', 'OB or OW', 'OW or OB', 'OB/OW',
+    'OW/OB'
+}
+
+
+def _dictionary_VR(tag: BaseTag) -> str:
+    """Return the VR to use for the raw element `tag` with an implicit VR."""
+    try:
+        return dictionary_VR(tag)
+    except KeyError:
+        # for VR for private tags see PS3.5, 6.2.2
+        if tag.is_private_creator:
+            return 'LO'
+
+        return 'UL' if tag.element == 0 else 'UN'
+
+
+def _copy_element(elem: DataElement) -> DataElement:
+    """Return a copy of `elem` for a copy-on-write :class:`Dataset` clone.
+
+    Mutable values are copied, with the items of a sequence being cloned
+    rather than copied.
+    """
+    elem = copy.copy(elem)
+    value = elem.value
+    if elem.VR == 'SQ' and value is not None:
+        from pydicom.sequence import Sequence
+        elem._value = Sequence([item.clone() for item in value])
+    elif isinstance(value, (list, MultiValue)):
+        elem._value = copy.deepcopy(value)
+    elif config.have_numpy and isinstance(value, numpy.ndarray):
+        elem._value = value.copy()
+
+    return elem
+
+
 _Dataset = TypeVar("_Dataset", bound="Dataset")
 _DatasetValue = Union[DataElement, RawDataElement]
 
@@ -375,10 +423,20 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
     ) -> None:
         """Create a new :class:`Dataset` instance."""
         self._parent_encoding = kwargs.get('parent_encoding', default_encoding)
+        # the tags in increasing order, rebuilt on demand after an element
+        #   is added or deleted. The list is held in a one item list that's
+        #   shared by all datasets using the same element dict, so a change
+        #   made through one of them is seen by the others
+        self._tag_order: List[Optional[List[BaseTag]]] = [None]
+        # the tags of elements shared with a copy-on-write clone, also
+        #   shared by all datasets using the same element dict
+        self._shared: Set[BaseTag] = set()
         if not args:
             self._dict: Dict[BaseTag, _DatasetValue] = {}
         elif isinstance(args[0], Dataset):
             self._dict = args[0]._dict
+            self._tag_order = args[0]._tag_order
+            self._shared = args[0]._shared
         else:
             self._dict = args[0]
         self.is_decompressed = False
@@ -454,6 +512,10 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
 
         data_element = DataElement(tag, VR, value)
         # use data_element.tag since DataElement verified it
+        if data_element.tag not in self._dict:
+            self._tag_order[0] = None
+
+        self._shared.discard(data_element.tag)
         self._dict[data_element.tag] = data_element
 
     def data_element(self, name: str) -> Optional[DataElement]:
@@ -546,10 +608,126 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
 
         self.walk(decode_callback, recursive=False)
 
+    def decode_all(self, recursive: bool = True) -> None:
+        """Convert all the raw elements in the :class:`Dataset`.
+
+        .. versionadded:: 2.2
+
+        Elements read from a file are normally only converted from their raw
+        form when first accessed. This converts them all up front instead,
+        including reading any deferred elements, so that later access
+        doesn't pay the conversion cost.
+
+        Parameters
+        ----------
+        recursive : bool, optional
+            If ``True`` (default) then also convert the elements in the items
+            of any sequences.
+        """
+        from pydicom.filewriter import correct_ambiguous_vr_element
+
+        # The encoding only needs to be resolved once for all the elements,
+        #   however (0008,0005) itself always uses the default encoding
+        character_set = self.read_encoding or self._character_set
+        charset_tag = BaseTag(0x00080005)
+
+        # Correcting an ambiguous VR may require the values of other
+        #   elements, so those are left until everything else is converted
+        ambiguous = []
+        for tag in self._sorted_tags():
+            elem = self._dict[tag]
+            if isinstance(elem, RawDataElement):
+                is_little_endian = elem.is_little_endian
+                if elem.value is None and elem.length != 0:
+                    from pydicom.filereader import read_deferred_data_element
+                    elem = read_deferred_data_element(
+                        self.fileobj_type, self.filename, self.timestamp, elem
+                    )
+
+                elem = DataElement_from_raw(
+                    elem,
+                    default_encoding if tag == charset_tag else character_set
+                )
+                self[tag] = elem
+                if 'or' in elem.VR:
+                    ambiguous.append((tag, is_little_endian))
+
+            if elem.VR == 'SQ' and elem.value:
+                # let a sequence know its parent dataset, as sequence items
+                # may need parent dataset tags to resolve ambiguous tags
+                elem.value.parent = self
+                if recursive:
+                    for item in elem.value:
+                        item.decode_all()
+
+        for tag, is_little_endian in ambiguous:
+            self[tag] = correct_ambiguous_vr_element(
+                self._dict[tag], self, is_little_endian
+            )
+
     def copy(self) -> "Dataset":
         """Return a shallow copy of the dataset."""
         return copy.copy(self)
 
+    def clone(self: _Dataset) -> _Dataset:
+        """Return a copy-on-write copy of the dataset.
+
+        .. versionadded:: 2.2
+
+        The clone initially shares its elements and sequence items with the
+        original dataset. An element is only copied when it's first
+        accessed or changed through either dataset, so making a clone costs
+        much less time and memory than :func:`copy.deepcopy`. Any file meta
+        information is also cloned.
+
+        .. warning::
+
+            Only access through the datasets themselves is copy-on-write.
+            Changes made using references to elements, sequences or
+            sequence items taken before the clone was made, such as
+            ``elem = ds['PatientName']`` or ``item = ds.BeamSequence[0]``,
+            affect both datasets. Writing either dataset may also set the
+            encoding and correct the ambiguous VRs of sequence items that
+            are still shared. Use :func:`copy.deepcopy` if the datasets
+            must be fully independent.
+
+        Returns
+        -------
+        Dataset
+            The copy-on-write clone.
+        """
+        # Not using copy.copy() as it would get the elements using items(),
+        #   which unshares them
+        ds = type(self).__new__(type(self))
+        ds.__dict__.update(self.__dict__)
+        ds.__dict__['parent'] = None
+        ds._dict = self._dict.copy()
+        ds._shared = set(self._dict)
+        self._shared.update(self._dict)
+        ds._tag_order = [self._tag_order[0]]
+        ds._private_blocks = {}
+        # the pixel data will be converted again if needed
+        ds._pixel_id = {}
+        ds.__dict__.pop('_pixel_array', None)
+
+        file_meta = self.__dict__.get('file_meta')
+        if file_meta is not None:
+            ds.__dict__['file_meta'] = file_meta.clone()
+
+        return ds
+
+    def _unshare(self, tag: BaseTag) -> None:
+        """Replace the element for `tag` with a copy if it's shared with
+        a clone of the dataset.
+        """
+        self._shared.discard(tag)
+        elem = self._dict.get(tag)
+        # raw elements are immutable so can stay shared
+        if isinstance(elem, DataElement):
+            elem = self._dict[tag] = _copy_element(elem)
+            if elem.parent is not None:
+                elem.parent = self
+
     def __delattr__(self, name: str) -> None:
         """Intercept requests to delete an attribute by `name`.
 
@@ -582,6 +760,7 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         tag = tag_for_keyword(name)
         if tag is not None and tag in self._dict:
             del self._dict[tag]
+            self._tag_order[0] = None
         # If not a DICOM name in this dataset, check for regular instance name
         #   can't do delete directly, that will call __delattr__ again
         elif name in self.__dict__:
@@ -621,6 +800,7 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
             then the tags matching the slice conditions will be deleted.
         """
         # If passed a slice, delete the corresponding DataElements
+        self._tag_order[0] = None
         if isinstance(key, slice):
             for tag in self._slice_dataset(key.start, key.stop, key.step):
                 del self._dict[tag]
@@ -779,6 +959,9 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
             :class:`~pydicom.dataelem.DataElement`) items for the
             :class:`Dataset`.
         """
+        for tag in list(self._shared):
+            self._unshare(tag)
+
         return self._dict.items()
 
     def keys(self) -> KeysView[BaseTag]:
@@ -801,6 +984,9 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
             The :class:`DataElements<pydicom.dataelem.DataElement>` that make
             up the values of the :class:`Dataset`.
         """
+        for tag in list(self._shared):
+            self._unshare(tag)
+
         return self._dict.values()
 
     def __getattr__(self, name: str) -> object:
@@ -821,16 +1007,30 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
               element's value. Otherwise returns the class attribute's
               value (if present).
         """
-        tag = tag_for_keyword(name)
-        if tag is not None:  # `name` isn't a DICOM element keyword
-            tag = Tag(tag)
-            if tag in self._dict:  # DICOM DataElement not in the Dataset
+        tag = _keyword_tags.get(name)
+        if tag is not None:  # `name` is a DICOM element keyword
+            elem = self._dict.get(tag)
+            if elem is not None:  # DICOM DataElement is in the Dataset
+                # Already converted non-sequence elements need no further
+                #   handling by __getitem__() unless shared with a clone
+                if (
+                    isinstance(elem, DataElement)
+                    and elem.VR != 'SQ'
+                    and tag not in self._shared
+                ):
+                    return elem.value
+
                 return self[tag].value
 
         # no tag or tag not contained in the dataset
         if name == '_dict':
             # special handling for contained dict, needed for pickle
             return {}
+        if name == '_shared':
+            # likewise for the shared tags, used when setting items
+            return set()
+        if name == '_tag_order':
+            return [None]
         # Try the base class attribute getter (fix for issue 332)
         return object.__getattribute__(self, name)
 
@@ -912,6 +1112,9 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
             except Exception as exc:
                 raise KeyError(f"'{key}'") from exc
 
+        if tag in self._shared:
+            self._unshare(tag)
+
         data_elem = self._dict[tag]
         if isinstance(data_elem, DataElement):
             if data_elem.VR == 'SQ' and data_elem.value:
@@ -1130,7 +1333,11 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         if isinstance(key, slice):
             return self._dataset_slice(key)
 
-        elem = self._dict.get(Tag(key))
+        tag = Tag(key)
+        if tag in self._shared:
+            self._unshare(tag)
+
+        elem = self._dict.get(tag)
         # If a deferred read, return using __getitem__ to read and convert it
         if isinstance(elem, RawDataElement) and elem.value is None:
             return self[key]
@@ -1142,10 +1349,33 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
 
         That includes properties related to endianess and VR handling,
         and the specific character set. No element conversion is done, e.g.
-        elements of type ``RawDataElement`` are kept.
+        elements of type ``RawDataElement`` are kept, and deferred elements
+        are only read if the slice has no file to read them from.
         """
         tags = self._slice_dataset(slce.start, slce.stop, slce.step)
-        ds = Dataset({tag: self.get_item(tag) for tag in tags})
+        # deferred elements can be kept if the slice can read them later
+        source = getattr(self, 'filename', None)
+        elements = {}
+        for tag in tags:
+            elem = self._dict[tag]
+            # If a deferred read, use __getitem__ to read and convert it
+            if (
+                source is None
+                and isinstance(elem, RawDataElement)
+                and elem.value is None
+            ):
+                elem = self[tag]
+
+            elements[tag] = elem
+
+        ds = Dataset(elements)
+        if source is not None:
+            ds.filename = source
+            ds.fileobj_type = getattr(self, 'fileobj_type', open)
+            ds.timestamp = getattr(self, 'timestamp', None)
+
+        # elements shared with a copy-on-write clone are kept shared
+        ds._shared = self._shared.intersection(tags)
         ds.is_little_endian = self.is_little_endian
         ds.is_implicit_VR = self.is_implicit_VR
         ds.set_original_encoding(
@@ -1229,8 +1459,7 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         # Note this is different than the underlying dict class,
         #        which returns the key of the key:value mapping.
         #   Here the value is returned (but data_element.tag has the key)
-        taglist = sorted(self._dict.keys())
-        for tag in taglist:
+        for tag in self._sorted_tags():
             yield self[tag]
 
     def elements(self) -> Iterator[DataElement]:
@@ -1253,10 +1482,24 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         dataelem.DataElement or dataelem.RawDataElement
             The unconverted elements sorted by increasing tag order.
         """
-        taglist = sorted(self._dict.keys())
-        for tag in taglist:
+        for tag in self._sorted_tags():
             yield self.get_item(tag)
 
+    def _sorted_tags(self) -> List[BaseTag]:
+        """Return the tags of the top-level elements in increasing order.
+
+        The sorted tags are kept until an element is added or deleted, so
+        repeatedly iterating over an unchanged dataset doesn't sort the tags
+        each time. The returned list shouldn't be modified.
+        """
+        # The length check catches changes made directly to a dict passed
+        #   to Dataset()
+        tags = self._tag_order[0]
+        if tags is None or len(tags) != len(self._dict):
+            tags = self._tag_order[0] = sorted(self._dict.keys())
+
+        return tags
+
     def __len__(self) -> int:
         """Return the number of elements in the top level of the dataset."""
         return len(self._dict)
@@ -1268,6 +1511,7 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
     def clear(self) -> None:
         """Delete all the elements from the :class:`Dataset`."""
         self._dict.clear()
+        self._tag_order[0] = None
 
     def pop(self, key: TagType, *args: object) -> _DatasetValue:
         """Emulate :meth:`dict.pop` with support for tags and keywords.
@@ -1303,6 +1547,10 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         except Exception:
             pass
 
+        self._tag_order[0] = None
+        if key in self._shared:
+            self._unshare(key)
+
         return self._dict.pop(key, *args)
 
     def popitem(self) -> Tuple[BaseTag, _DatasetValue]:
@@ -1312,7 +1560,14 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         -------
         tuple of (BaseTag, DataElement)
         """
-        return self._dict.popitem()
+        self._tag_order[0] = None
+        tag, elem = self._dict.popitem()
+        if tag in self._shared:
+            self._shared.discard(tag)
+            if isinstance(elem, DataElement):
+                elem = _copy_element(elem)
+
+        return tag, elem
 
     def setdefault(
         self, key: TagType, default: Optional[object] = None
@@ -1945,9 +2200,10 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         value
             The value for the attribute to be added/changed.
         """
-        tag = tag_for_keyword(name)
+        tag = _keyword_tags.get(name)
         if tag is not None:  # successfully mapped name to a tag
-            if tag not in self:
+            elem = self._dict.get(tag)
+            if elem is None:
                 # don't have this tag yet->create the data_element instance
                 VR = dictionary_VR(tag)
                 data_element = DataElement(tag, VR, value)
@@ -1956,12 +2212,15 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
                     # to its items, who may need parent dataset tags
                     # to resolve ambiguous tags
                     data_element.parent = self
-            else:
+                # Now have data_element - store it in this dict
+                self[tag] = data_element
+            elif isinstance(elem, DataElement) and tag not in self._shared:
                 # already have this data_element, just changing its value
-                data_element = self[tag]
-                data_element.value = value
-            # Now have data_element - store it in this dict
-            self[tag] = data_element
+                elem.value = value
+            else:
+                # converting the raw element or copying the shared element
+                #   stores it in this dict
+                self[tag].value = value
         elif repeater_has_keyword(name):
             # Check if `name` is repeaters element
             raise ValueError(
@@ -2060,6 +2319,10 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
                     elem = DataElement_from_raw(elem, self._character_set)
                 elem.private_creator = self[private_creator_tag].value
 
+        if elem_tag not in self._dict:
+            self._tag_order[0] = None
+
+        self._shared.discard(elem_tag)
         self._dict[elem_tag] = elem
 
     def _slice_dataset(
@@ -2093,7 +2356,7 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         if stop is not None:
             stop = Tag(stop)
 
-        all_tags = sorted(self._dict.keys())
+        all_tags = self._sorted_tags()
         # If the Dataset is empty, return an empty list
         if not all_tags:
             return []
@@ -2168,11 +2431,266 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         ------
         dataelem.DataElement
         """
-        for elem in self:
+        for _, elem in self.traverse():
             yield elem
-            if elem.VR == "SQ":
-                for ds in elem.value:
-                    yield from ds.iterall()
+
+    def traverse(
+        self,
+        tags: Optional[Iterable[TagType]] = None,
+        VRs: Optional[Iterable[str]] = None,
+        predicate: Optional[
+            Callable[["Dataset", _DatasetValue], bool]
+        ] = None,
+        prune: Optional[Callable[["Dataset", _DatasetValue], bool]] = None,
+        convert: bool = True
+    ) -> Iterator[Tuple["Dataset", _DatasetValue]]:
+        """Iterate through the :class:`Dataset` and its sequence items,
+        yielding the matching elements.
+
+        .. versionadded:: 2.2
+
+        Elements are yielded in order of increasing tag number within their
+        dataset, with the elements of a sequence's items following the
+        sequence element, the same as :meth:`iterall`. Unlike
+        :meth:`iterall` only the matching elements are converted from their
+        raw form, and none are if `convert` is ``False``. Sequence elements
+        are always converted so their items can be traversed, as are raw
+        elements with a VR of **UN** as they may be sequences.
+
+        Examples
+        --------
+
+        Replace the values of all the **PN** elements
+
+        >>> for ds, elem in dataset.traverse(VRs=['PN']):  # doctest: +SKIP
+        ...     elem.value = 'ANONYMOUS'
+
+        Parameters
+        ----------
+        tags : iterable of int or str or 2-tuple of int, optional
+            If used then only yield the elements with these tags, in any
+            form accepted by :func:`~pydicom.tag.Tag`, including element
+            keywords.
+        VRs : iterable of str, optional
+            If used then only yield the elements with these VRs. For raw
+            elements with an implicit VR this is the VR from the DICOM
+            dictionary.
+        predicate : callable, optional
+            If used then only yield the elements for which
+            ``predicate(dataset, element)`` returns ``True``, where `element`
+            may be a raw element.
+        prune : callable, optional
+            If used then the items of any sequence for which
+            ``prune(dataset, element)`` returns ``True`` are not traversed,
+            where `element` may be a raw element.
+        convert : bool, optional
+            If ``True`` (default) then yield the matching elements as
+            :class:`~pydicom.dataelem.DataElement`, otherwise yield them as
+            they are stored, which may be as
+            :class:`~pydicom.dataelem.RawDataElement`.
+
+        Yields
+        ------
+        tuple of (Dataset, dataelem.DataElement or dataelem.RawDataElement)
+            The matching elements and the datasets containing them.
+        """
+        tag_set = {Tag(tag) for tag in tags} if tags is not None else None
+        VR_set = set(VRs) if VRs is not None else None
+
+        # Use a stack of (dataset, tag) iterators rather than recursing, one
+        #   for the top-level dataset and one for each sequence being
+        #   traversed
+        stack = [((self, tag) for tag in self._sorted_tags())]
+        while stack:
+            for ds, tag in stack[-1]:
+                elem = ds._dict.get(tag)
+                if elem is None:
+                    # element deleted while traversing
+                    continue
+
+                VR = elem.VR if elem.VR is not None else _dictionary_VR(tag)
+                if VR == 'UN' and isinstance(elem, RawDataElement):
+                    # a raw 'UN' element may be converted to another VR,
+                    #   such as a sequence encoded as 'UN'
+                    elem = ds[tag]
+                    VR = elem.VR
+
+                if (
+                    (tag_set is None or tag in tag_set)
+                    and (VR_set is None or VR in VR_set)
+                    and (predicate is None or predicate(ds, elem))
+                ):
+                    if convert:
+                        elem = ds[tag]
+                    elif tag in ds._shared:
+                        ds._unshare(tag)
+                        elem = ds._dict[tag]
+
+                    yield ds, elem
+
+                    # the element may have been changed while yielded
+                    elem = ds._dict.get(tag)
+                    if elem is None:
+                        continue
+
+                if VR != 'SQ' or (prune is not None and prune(ds, elem)):
+                    continue
+
+                seq = ds[tag].value
+                if seq:
+                    stack.append(
+                        (item, t) for item in seq for t in item._sorted_tags()
+                    )
+                    break
+            else:
+                stack.pop()
+
+    def digest(
+        self,
+        algorithm: str = 'sha256',
+        include: Optional[Iterable[TagType]] = None,
+        exclude: Optional[Iterable[TagType]] = None
+    ) -> str:
+        """Return a digest of the encoded element values in the
+        :class:`Dataset`.
+
+        .. versionadded:: 2.2
+
+        The digest is calculated from the tags and encoded values of the
+        elements in the dataset and its sequence items, without needing to
+        write the dataset. Each value is encoded the way it would be written,
+        with raw elements being converted first without being stored, so the
+        digest is the same whether or not the elements have been accessed.
+        Deferred bulk binary values, which are encoded unchanged, are read
+        from the file in chunks as they're hashed. The file meta information
+        isn't included and the digest depends on the endianness of the
+        encoding.
+
+        Examples
+        --------
+
+        Compare two datasets ignoring their pixel data
+
+        >>> ds.digest(exclude=['PixelData']) == other.digest(  # doctest: +SKIP
+        ...     exclude=['PixelData']
+        ... )
+        True
+
+        Parameters
+        ----------
+        algorithm : str, optional
+            The name of the hash algorithm to use, as accepted by
+            :func:`hashlib.new` (default ``'sha256'``).
+        include : iterable of int or str or 2-tuple of int, optional
+            If used then only the elements with these tags are included, in
+            any form accepted by :func:`~pydicom.tag.Tag`, including element
+            keywords.
+        exclude : iterable of int or str or 2-tuple of int, optional
+            If used then the elements with these tags are excluded.
+
+        Returns
+        -------
+        str
+            The hexadecimal digest.
+        """
+        hasher = hashlib.new(algorithm)
+        self._update_digest(
+            hasher,
+            {Tag(tag) for tag in include} if include is not None else None,
+            {Tag(tag) for tag in exclude} if exclude is not None else set()
+        )
+
+        return hasher.hexdigest()
+
+    def _update_digest(
+        self,
+        hasher: Any,
+        include: Optional[Set[BaseTag]],
+        exclude: Set[BaseTag]
+    ) -> None:
+        """Update `hasher` with the elements in the :class:`Dataset`."""
+        from pydicom.filebase import DicomBytesIO
+        from pydicom.filewriter import _write_value
+
+        is_little_endian = self.is_little_endian
+        if is_little_endian is None:
+            is_little_endian = self.read_little_endian in (None, True)
+
+        for tag in self._sorted_tags():
+            if tag in exclude or (include is not None and tag not in include):
+                continue
+
+            elem = self._dict[tag]
+            hasher.update(pack('<L', tag))
+            if isinstance(elem, RawDataElement):
+                if elem.value is None and elem.length != 0:
+                    VR = elem.VR or _dictionary_VR(tag)
+                    if (
+                        VR in _DIGEST_STREAMED_VRS
+                        and elem.length != 0xFFFFFFFF
+                    ):
+                        self._update_digest_deferred(hasher, elem)
+                        continue
+
+                    from pydicom.filereader import read_deferred_data_element
+                    elem = read_deferred_data_element(
+                        self.fileobj_type, self.filename, self.timestamp, elem
+                    )
+
+                # Use the same conversion as __getitem__() but without
+                #   storing the converted element
+                if tag != BaseTag(0x00080005):
+                    character_set = self.read_encoding or self._character_set
+                else:
+                    character_set = default_encoding
+                elem = DataElement_from_raw(elem, character_set)
+
+            if elem.VR == 'SQ':
+                # hash the sequence items in the same way regardless of
+                #   whether they were encoded with defined length
+                for item in elem.value:
+                    hasher.update(b'\xfe\xff\x00\xe0')
+                    item._update_digest(hasher, include, exclude)
+                    hasher.update(b'\xfe\xff\x0d\xe0')
+
+                hasher.update(b'\xfe\xff\xdd\xe0')
+                continue
+
+            fp = DicomBytesIO()
+            fp.is_little_endian = is_little_endian
+            fp.is_implicit_VR = True
+            _write_value(fp, elem, self._character_set)
+            value = fp.getvalue()
+            hasher.update(pack('<Q', len(value)))
+            hasher.update(value)
+
+    def _update_digest_deferred(
+        self, hasher: Any, elem: RawDataElement
+    ) -> None:
+        """Update `hasher` with the value of the deferred `elem` read from
+        the file in chunks.
+        """
+        from pydicom.filereader import _deferred_file, _read_deferred_header
+
+        with _deferred_file(
+            self.fileobj_type, getattr(self, 'filename', None),
+            getattr(self, 'timestamp', None)
+        ) as fp:
+            # Only hash as much of the value as a normal read would return
+            fp.seek(0, 2)
+            remaining = max(min(elem.length, fp.tell() - elem.value_tell), 0)
+            _read_deferred_header(fp, elem)
+            hasher.update(pack('<Q', remaining))
+            while remaining:
+                chunk = fp.read(min(remaining, _DIGEST_CHUNK_SIZE))
+                if not chunk:
+                    raise EOFError(
+                        f"End of file reached while reading the deferred "
+                        f"value of {elem.tag}"
+                    )
+
+                hasher.update(chunk)
+                remaining -= len(chunk)
 
     def walk(
         self,
@@ -2208,8 +2726,7 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
             Flag to indicate whether to recurse into sequences (default
             ``True``).
         """
-        taglist = sorted(self._dict.keys())
-        for tag in taglist:
+        for tag in self._sorted_tags():
 
             with tag_in_exception(tag):
                 data_element = self[tag]
@@ -2369,9 +2886,17 @@ class Dataset(Dict[BaseTag, _DatasetValue]):
         # pickle cannot handle weakref - remove parent
         d = self.__dict__.copy()
         del d['parent']
+        # the shared memory handle of a dataset from dcmread_many() belongs
+        #   to the original dataset
+        d.pop('shared_memory', None)
+        # the sorted tags are kept so a shallow copy shares them along with
+        #   the element dict
+        d['_shared'] = set()
         return d
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__['_tag_order'] = [None]
+        self.__dict__['_shared'] = set()
         self.__dict__.update(state)
         # re-add parent - it will be set to the parent dataset on demand
         # if the dataset is in a sequence
@@ -2497,7 +3022,9 @@ class FileDataset(Dataset):
             return (
                 _dict_equal(self, other)
                 and _dict_equal(
-                    self.__dict__, other.__dict__, exclude=['_dict']
+                    self.__dict__,
+                    other.__dict__,
+                    exclude=['_dict', '_tag_order', '_shared']
                 )
             )
 
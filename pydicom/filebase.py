@@ -2,6 +2,8 @@
 """Hold DicomFile class, which does basic I/O for a dicom file."""
 
 from io import BytesIO
+import mmap
+import os
 from struct import unpack, pack
 from types import TracebackType
 from typing import (
@@ -212,6 +214,253 @@ def DicomFile(*args: Any, **kwargs: Any) -> DicomFileLike:
     return DicomFileLike(open(*args, **kwargs))
 
 
+class DicomMemoryMap(DicomFileLike):
+    """A read-only file-like backed by a memory-mapped file.
+
+    .. versionadded:: 2.2
+
+    Behaves like a :class:`DicomFileLike` opened in ``'rb'`` mode, but also
+    offers :meth:`read_view`, which returns a :class:`memoryview` of the
+    mapping rather than a copy of the bytes. The mapping remains valid for as
+    long as any of the returned views are referenced, even after
+    :meth:`close` has been called.
+    """
+
+    def __init__(self, filename: str, mode: str = 'rb') -> None:
+        """Map the file `filename` into memory.
+
+        Parameters
+        ----------
+        filename : str
+            The path to the file to be mapped.
+        mode : str, optional
+            Must be ``'rb'`` (the default), as the mapping is read-only.
+        """
+        if mode != 'rb':
+            raise ValueError("DicomMemoryMap only supports the mode 'rb'")
+
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                mapped: Union[mmap.mmap, BytesIO] = mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            else:
+                # Empty files can't be mapped
+                mapped = BytesIO()
+
+        super().__init__(mapped)
+        # Closing the mapping directly fails while views of it exist, so
+        #   use our own close() rather than the one set by DicomFileLike
+        del self.close
+        self.name = filename
+        self._view = (
+            memoryview(mapped) if isinstance(mapped, mmap.mmap)
+            else mapped.getbuffer()
+        )
+
+    def read_view(self, length: int) -> memoryview:
+        """Return a :class:`memoryview` of the next `length` bytes without
+        copying them.
+
+        Parameters
+        ----------
+        length : int
+            The number of bytes to return, fewer will be returned if the end
+            of the file is reached first.
+
+        Returns
+        -------
+        memoryview
+            A read-only view of the mapped bytes.
+        """
+        start = self.tell()
+        view = self._view[start:start + length]
+        self.seek(start + len(view))
+        return view
+
+    def find(self, sub: bytes, start: int) -> int:
+        """Return the lowest position of `sub` at or after `start` without
+        changing the current position.
+
+        Parameters
+        ----------
+        sub : bytes
+            The bytes to find.
+        start : int
+            The position to start searching from.
+
+        Returns
+        -------
+        int
+            The position of `sub`, or ``-1`` if not found.
+        """
+        if isinstance(self.parent, mmap.mmap):
+            return self.parent.find(sub, start)
+
+        return -1
+
+    def close(self) -> None:
+        """Release the mapping.
+
+        If views returned by :meth:`read_view` are still referenced then the
+        mapping will be released once they have all been garbage collected.
+        """
+        self._view.release()
+        try:
+            self.parent.close()
+        except BufferError:
+            pass
+
+
+class DicomBufferedReader(DicomFileLike):
+    """A read-only file-like that reads ahead from another file-like in
+    blocks.
+
+    .. versionadded:: 2.2
+
+    Parsing a dataset involves many small reads, which is slow when each of
+    them is passed on to an unbuffered or remote file-like, such as a raw
+    socket or a network file system. Wrapping the file-like with
+    :class:`DicomBufferedReader` before passing it to
+    :func:`~pydicom.filereader.dcmread` reads the data in blocks instead.
+    Seeking to a position within the current block reuses it, while seeking
+    anywhere else discards it. Reads at least as large as the block size,
+    such as for *Pixel Data*, are passed on directly.
+
+    Attributes
+    ----------
+    block_size : int
+        The number of bytes to read ahead at a time.
+    read_calls : int
+        The number of times the wrapped file-like's ``read()`` has been
+        called.
+    bytes_read : int
+        The total number of bytes returned by the wrapped file-like.
+
+    Examples
+    --------
+
+    >>> with fsspec.open("s3://bucket/ct.dcm", "rb") as f:
+    ...     fp = DicomBufferedReader(f, block_size=262144)
+    ...     ds = dcmread(fp, stop_before_pixels=True)
+    >>> fp.read_calls
+    1
+    """
+
+    def __init__(
+        self,
+        file_like_obj: Union[str, BinaryIO, BytesIO],
+        mode: str = 'rb',
+        *,
+        block_size: int = 65536
+    ) -> None:
+        """Wrap the file-like `file_like_obj`.
+
+        Parameters
+        ----------
+        file_like_obj : str or file-like
+            The file-like to read from, must have ``read()``, ``seek()`` and
+            ``tell()`` methods, or the path to a file to open unbuffered.
+        mode : str, optional
+            Must be ``'rb'`` (the default), as the reader is read-only.
+        block_size : int, optional
+            The number of bytes to read ahead at a time, default ``65536``.
+        """
+        if mode != 'rb':
+            raise ValueError("DicomBufferedReader only supports the mode 'rb'")
+
+        if block_size < 1:
+            raise ValueError("'block_size' must be greater than 0")
+
+        if isinstance(file_like_obj, str):
+            file_like_obj = open(file_like_obj, 'rb', buffering=0)
+
+        super().__init__(file_like_obj)
+        # Use our own methods rather than those set by DicomFileLike
+        del self.parent_read, self.seek, self.tell
+        self.write = self.no_write
+        self.block_size = block_size
+        self.read_calls = 0
+        self.bytes_read = 0
+        self._read = file_like_obj.read
+        self._seek = file_like_obj.seek
+        # The wrapped file-like is always positioned at the end of the
+        #   buffer, which starts at `_start` in the file
+        self._buffer = b""
+        self._start = file_like_obj.tell()
+        self._position = 0
+
+    def _read_parent(self, size: int = -1) -> bytes:
+        """Return bytes read from the wrapped file-like."""
+        data = self._read(size)
+        self.read_calls += 1
+        self.bytes_read += len(data)
+        return data
+
+    def parent_read(self, size: Optional[int] = -1) -> bytes:
+        """Return up to `size` bytes, or all the remaining bytes if `size` is
+        ``None`` or negative.
+        """
+        buffer = self._buffer
+        position = self._position
+        available = len(buffer) - position
+        if size is not None and 0 <= size <= available:
+            self._position += size
+            return buffer[position:position + size]
+
+        start = self._start + len(buffer)
+        data = buffer[position:]
+        if size is None or size < 0:
+            data += self._read_parent()
+            self._buffer = b""
+        elif size - available >= self.block_size:
+            data += self._read_parent(size - available)
+            self._buffer = b""
+        else:
+            self._buffer = self._read_parent(self.block_size)
+            self._position = min(size - available, len(self._buffer))
+            self._start = start
+            return data + self._buffer[:self._position]
+
+        self._position = 0
+        self._start = start + len(data) - available
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Change the current position and return it.
+
+        Parameters
+        ----------
+        offset : int
+            The offset to seek to, relative to the position given by
+            `whence`.
+        whence : int, optional
+            ``0`` (default) for the start of the file, ``1`` for the current
+            position and ``2`` for the end of the file.
+
+        Returns
+        -------
+        int
+            The new position.
+        """
+        if whence == 1:
+            offset += self.tell()
+            whence = 0
+
+        if whence == 0 and 0 <= offset - self._start <= len(self._buffer):
+            self._position = offset - self._start
+            return offset
+
+        self._buffer = b""
+        self._position = 0
+        self._start = self._seek(offset, whence)
+        return self._start
+
+    def tell(self) -> int:
+        """Return the current position."""
+        return self._start + self._position
+
+
 class DicomBytesIO(DicomFileLike):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(BytesIO(*args, **kwargs))
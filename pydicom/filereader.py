@@ -2,28 +2,47 @@
 """Read a dicom media file"""
 
 
+from collections import deque, OrderedDict
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+)
+from contextlib import contextmanager
 # Need zlib and io.BytesIO for deflate-compressed file
-from io import BytesIO
+from io import BytesIO, UnsupportedOperation
+from itertools import islice
 import os
-from struct import (Struct, unpack)
-from typing import BinaryIO, Union, Optional, List, Tuple, AnyStr
+import pickle
+from struct import (Struct, pack, unpack, unpack_from)
+import threading
+from typing import (
+    BinaryIO, Union, Optional, List, Tuple, AnyStr, Dict, NamedTuple,
+    Iterable, Iterator, Any
+)
 import warnings
 import zlib
 
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
 from pydicom import config
 from pydicom.charset import (default_encoding, convert_encodings)
 from pydicom.config import logger
 from pydicom.datadict import dictionary_VR, tag_for_keyword
 from pydicom.dataelem import (DataElement, RawDataElement,
-                              DataElement_from_raw, empty_value_for_VR)
+                              DataElement_from_raw, empty_value_for_VR,
+                              _ZERO_COPY_VRS)
 from pydicom.dataset import (Dataset, FileDataset, FileMetaDataset)
 from pydicom.dicomdir import DicomDir
 from pydicom.errors import InvalidDicomError
-from pydicom.filebase import DicomFile
+from pydicom.filebase import DicomFile, DicomMemoryMap
 from pydicom.fileutil import read_undefined_length_value, path_from_pathlike
 from pydicom.misc import size_in_bytes
 from pydicom.sequence import Sequence
-from pydicom.tag import (ItemTag, SequenceDelimiterTag, TupleTag, Tag, BaseTag)
+from pydicom.tag import (
+    ItemTag, ItemDelimiterTag, SequenceDelimiterTag, TupleTag, Tag, BaseTag
+)
 import pydicom.uid
 from pydicom.util.hexutil import bytes2hex
 from pydicom.valuerep import extra_length_VRs
@@ -35,7 +54,8 @@ def data_element_generator(fp,
                            stop_when=None,
                            defer_size=None,
                            encoding=default_encoding,
-                           specific_tags=None):
+                           specific_tags=None,
+                           raw_sequences=False):
 
     """Create a generator to efficiently return the raw data elements.
 
@@ -63,6 +83,8 @@ def data_element_generator(fp,
         Encoding scheme
     specific_tags : list or None
         See :func:`dcmread` for parameter info.
+    raw_sequences : bool, optional
+        See :func:`dcmread` for parameter info.
 
     Returns
     -------
@@ -71,8 +93,12 @@ def data_element_generator(fp,
     length : int
         The length of the DICOM data element (could be DICOM "undefined
         length" ``0xFFFFFFFFL``)
-    value_bytes : bytes or str
-        The raw bytes from the DICOM file (not parsed into Python types)
+    value_bytes : bytes or str or memoryview
+        The raw bytes from the DICOM file (not parsed into Python types). If
+        `fp` is a :class:`~pydicom.filebase.DicomMemoryMap` then the
+        values of elements with a VR of **OB**, **OD**, **OF**, **OL**,
+        **OV** or **OW** and a defined length are a :class:`memoryview` of
+        the mapped file.
     is_little_endian : bool
         ``True`` if transfer syntax is little endian; else ``False``.
     """
@@ -108,6 +134,9 @@ def data_element_generator(fp,
         extra_length_struct = Struct(endian_chr + "L")  # for special VRs
         extra_length_unpack = extra_length_struct.unpack  # for lookup speed
 
+    # The encoded Sequence Delimitation Item
+    delimiter_item = pack(endian_chr + "HHL", 0xFFFE, 0xE0DD, 0)
+
     # Make local variables so have faster lookup
     fp_read = fp.read
     fp_tell = fp.tell
@@ -115,11 +144,16 @@ def data_element_generator(fp,
     debugging = config.debugging
     element_struct_unpack = element_struct.unpack
     defer_size = size_in_bytes(defer_size)
+    # Only available for memory-mapped files
+    fp_read_view = getattr(fp, "read_view", None)
 
     tag_set = {Tag(tag) for tag in specific_tags} if specific_tags else set()
     has_tag_set = bool(tag_set)
     if has_tag_set:
         tag_set.add(Tag(0x00080005))  # Specific Character Set
+        # Elements are in ascending tag order, so there's nothing left
+        #   to find once we're past the largest wanted tag
+        max_tag = max(tag_set)
 
     while True:
         # Read tag, VR, length, get ready to read value
@@ -167,6 +201,16 @@ def data_element_generator(fp,
                 fp.seek(value_tell - rewind_length)
                 return
 
+        if has_tag_set and tag > max_tag:
+            if debugging:
+                logger_debug("Reading ended after the last of the specific "
+                             "tags. Rewinding to start of data element.")
+            rewind_length = 8
+            if not is_implicit_VR and VR in extra_length_VRs:
+                rewind_length += 4
+            fp.seek(value_tell - rewind_length)
+            return
+
         # Reading the value
         # First case (most common): reading a value with a defined length
         if length != 0xFFFFFFFF:
@@ -184,15 +228,22 @@ def data_element_generator(fp,
                 logger_debug("Defer size exceeded. "
                              "Skipping forward to next data element.")
                 fp.seek(fp_tell() + length)
+            elif length == 0:
+                value = empty_value_for_VR(VR, raw=True)
+            elif (
+                fp_read_view is not None
+                and (VR or _dictionary_VR_or_none(tag)) in _ZERO_COPY_VRS
+            ):
+                value = fp_read_view(length)
             else:
-                value = (fp_read(length) if length > 0
-                         else empty_value_for_VR(VR, raw=True))
-                if debugging:
-                    dotdot = "..." if length > 12 else "   "
-                    displayed_value = value[:12] if value else b''
-                    logger_debug("%08x: %-34s %s %r %s" %
-                                 (value_tell, bytes2hex(displayed_value),
-                                  dotdot, displayed_value, dotdot))
+                value = fp_read(length)
+
+            if debugging and value is not None:
+                dotdot = "..." if length > 12 else "   "
+                displayed_value = bytes(value[:12]) if value else b''
+                logger_debug("%08x: %-34s %s %r %s" %
+                             (value_tell, bytes2hex(displayed_value),
+                              dotdot, displayed_value, dotdot))
 
             # If the tag is (0008,0005) Specific Character Set, then store it
             if tag == BaseTag(0x00080005):
@@ -227,13 +278,45 @@ def data_element_generator(fp,
                         VR = 'SQ'
 
             if VR == 'SQ':
+                if has_tag_set and tag not in tag_set:
+                    # Skip to the end of the sequence without parsing it
+                    if debugging:
+                        msg = "{0:08x}: Skipping undefined length sequence"
+                        logger_debug(msg.format(fp_tell()))
+                    _skip_undefined_length_sequence(
+                        fp, is_implicit_VR, is_little_endian
+                    )
+                    continue
+
+                if raw_sequences:
+                    # Keep the encoded sequence so it's only parsed if
+                    #   needed and can be written unchanged if it isn't
+                    if debugging:
+                        msg = "{0:08x}: Reading undefined length sequence"
+                        logger_debug(msg.format(fp_tell()))
+                    _skip_undefined_length_sequence(
+                        fp, is_implicit_VR, is_little_endian
+                    )
+                    value_length = fp_tell() - value_tell
+                    if defer_size is not None and value_length > defer_size:
+                        value = None
+                    else:
+                        fp.seek(value_tell)
+                        value = fp_read(value_length)
+                        # Exclude the Sequence Delimitation Item, which is
+                        #   added back when the element is written
+                        if value[-8:] == delimiter_item:
+                            value = value[:-8]
+
+                    yield RawDataElement(tag, VR, length, value, value_tell,
+                                         is_implicit_VR, is_little_endian)
+                    continue
+
                 if debugging:
                     msg = "{0:08x}: Reading/parsing undefined length sequence"
                     logger_debug(msg.format(fp_tell()))
                 seq = read_sequence(fp, is_implicit_VR,
                                     is_little_endian, length, encoding)
-                if has_tag_set and tag not in tag_set:
-                    continue
                 yield DataElement(tag, VR, seq, value_tell,
                                   is_undefined_length=True)
             else:
@@ -250,6 +333,93 @@ def data_element_generator(fp,
                                      is_implicit_VR, is_little_endian)
 
 
+def _skip_undefined_length_sequence(fp, is_implicit_VR, is_little_endian):
+    """Move `fp` past the value of an undefined length sequence.
+
+    Only the item and element headers are read, defined length values are
+    skipped over using their length and nested undefined length values are
+    skipped recursively, so no :class:`~pydicom.dataset.Dataset` instances
+    are created.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like positioned at the start of the sequence's value.
+    is_implicit_VR : bool
+        ``True`` if the sequence's items are encoded as implicit VR.
+    is_little_endian : bool
+        ``True`` if the data is encoded as little endian.
+
+    Returns
+    -------
+    None
+        `fp` is positioned after the sequence's Sequence Delimitation Item,
+        or at the end of the file if it has no delimiter.
+    """
+    endian_chr = "<" if is_little_endian else ">"
+    # Item and delimiter headers are always tag and 4-byte length
+    item_unpack = Struct(endian_chr + "HHL").unpack
+    if is_implicit_VR:
+        element_unpack = item_unpack
+    else:
+        element_unpack = Struct(endian_chr + "HH2sH").unpack
+        extra_length_unpack = Struct(endian_chr + "L").unpack
+
+    fp_read = fp.read
+    fp_seek = fp.seek
+    fp_tell = fp.tell
+    while True:
+        bytes_read = fp_read(8)
+        if len(bytes_read) < 8:
+            return
+
+        group, elem, length = item_unpack(bytes_read)
+        if (group, elem) == SequenceDelimiterTag:
+            return
+
+        if length != 0xFFFFFFFF:
+            fp_seek(fp_tell() + length)
+            continue
+
+        # Undefined length item - skip its elements up to the delimiter
+        while True:
+            bytes_read = fp_read(8)
+            if len(bytes_read) < 8:
+                return
+
+            if is_implicit_VR:
+                group, elem, length = element_unpack(bytes_read)
+                VR = None
+            else:
+                group, elem, VR, length = element_unpack(bytes_read)
+                if (group, elem) == ItemDelimiterTag:
+                    break
+
+                VR = VR.decode(default_encoding)
+                if VR in extra_length_VRs:
+                    length = extra_length_unpack(fp_read(4))[0]
+
+            if (group, elem) == ItemDelimiterTag:
+                break
+
+            if length != 0xFFFFFFFF:
+                fp_seek(fp_tell() + length)
+            else:
+                # Undefined length sequence or encapsulated value, UN is
+                #   always encoded as implicit VR little endian
+                _skip_undefined_length_sequence(
+                    fp, is_implicit_VR or VR == 'UN', is_little_endian
+                )
+
+
+def _dictionary_VR_or_none(tag):
+    """Return the dictionary VR for `tag` or ``None`` if it's unknown."""
+    try:
+        return dictionary_VR(tag)
+    except KeyError:
+        return None
+
+
 def _is_implicit_vr(fp, implicit_vr_is_assumed, is_little_endian, stop_when):
     """Check if the real VR is explicit or implicit.
 
@@ -304,7 +474,7 @@ def _is_implicit_vr(fp, implicit_vr_is_assumed, is_little_endian, stop_when):
 def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
                  stop_when=None, defer_size=None,
                  parent_encoding=default_encoding, specific_tags=None,
-                 at_top_level=True):
+                 at_top_level=True, raw_sequences=False):
     """Return a :class:`~pydicom.dataset.Dataset` instance containing the next
     dataset in the file.
 
@@ -333,6 +503,8 @@ def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
     at_top_level: bool
         If dataset is top level (not within a sequence).
         Used to turn off explicit VR heuristic within sequences
+    raw_sequences : bool, optional
+        See :func:`dcmread` for parameter info.
 
     Returns
     -------
@@ -353,7 +525,7 @@ def read_dataset(fp, is_implicit_VR, is_little_endian, bytelength=None,
     fp.seek(fp_start)
     de_gen = data_element_generator(fp, is_implicit_VR, is_little_endian,
                                     stop_when, defer_size, parent_encoding,
-                                    specific_tags)
+                                    specific_tags, raw_sequences)
     try:
         while (bytelength is None) or (fp.tell() - fp_start < bytelength):
             raw_data_element = next(de_gen)
@@ -628,18 +800,147 @@ def read_preamble(fp, force):
     return preamble
 
 
+class _InflatedFileLike:
+    """A read-only file-like that inflates a deflated stream on demand.
+
+    Used for datasets with the *Deflated Explicit VR Little Endian* transfer
+    syntax so that only as much of the stream as is actually read is
+    inflated. The inflated data is kept to allow seeking backwards and for
+    reading deferred elements.
+    """
+    chunk_size = 16 * 1024
+
+    def __init__(self, fp: BinaryIO) -> None:
+        """Create a new file-like.
+
+        Parameters
+        ----------
+        fp : file-like
+            The file-like to read the deflated data from, positioned at the
+            start of the deflated stream.
+        """
+        self._fp = fp
+        # -MAX_WBITS for a raw deflate stream without header or checksum
+        self._inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        self._buffer = bytearray()
+        self._position = 0
+        self._eof = False
+
+    def _inflate(self, end: Optional[int] = None) -> None:
+        """Inflate until at least `end` bytes are available, or the whole
+        stream if `end` is ``None``.
+        """
+        buffer = self._buffer
+        inflater = self._inflater
+        while not self._eof and (end is None or len(buffer) < end):
+            data = inflater.unconsumed_tail or self._fp.read(self.chunk_size)
+            if not data:
+                buffer += inflater.flush()
+                self._eof = True
+                break
+
+            max_length = 0 if end is None else end - len(buffer)
+            buffer += inflater.decompress(
+                data, max_length and max(max_length, self.chunk_size)
+            )
+            self._eof = inflater.eof
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Return up to `size` bytes of inflated data, or all the remaining
+        data if `size` is negative or ``None``.
+        """
+        start = self._position
+        if size is None or size < 0:
+            self._inflate()
+            end = len(self._buffer)
+        else:
+            end = start + size
+            self._inflate(end)
+
+        with memoryview(self._buffer) as view:
+            data = view[start:end].tobytes()
+
+        self._position = start + len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Change the position in the inflated data and return it."""
+        if whence == 1:
+            offset += self._position
+        elif whence == 2:
+            self._inflate()
+            offset += len(self._buffer)
+
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+
+        self._position = offset
+        return offset
+
+    def tell(self) -> int:
+        """Return the position in the inflated data."""
+        return self._position
+
+    def close(self) -> None:
+        """Does nothing, the inflated data is kept for reading any other
+        deferred elements and the deflated file-like isn't closed.
+        """
+        pass
+
+    def __reduce__(self):
+        # The inflater and deflated file-like can't be pickled, so use the
+        #   data that's been inflated so far
+        return BytesIO, (bytes(self._buffer), )
+
+
 def _at_pixel_data(tag, VR, length):
     return tag == (0x7fe0, 0x0010)
 
 
+def _guess_encoding(data):
+    """Return the guessed ``(is_implicit_VR, is_little_endian)`` of a dataset
+    without a *Transfer Syntax UID*.
+
+    Parameters
+    ----------
+    data : bytes
+        The first 6 bytes of the dataset, which are the first element's tag
+        group and (possibly) VR.
+
+    Returns
+    -------
+    tuple of (bool, bool)
+        The guessed encoding, defaults to implicit VR little endian.
+    """
+    group, _, VR = unpack("<HH2s", data)
+
+    # Test the VR to see if it's valid, and if so then assume explicit VR
+    from pydicom.values import converters
+    VR = VR.decode(default_encoding)
+    if VR in converters.keys():
+        # Big endian encoding can only be explicit VR
+        #   Big endian 0x0004 decoded as little endian will be 1024
+        #   Big endian 0x0100 decoded as little endian will be 1
+        # Therefore works for big endian tag groups up to 0x00FF after
+        #   which it will fail, in which case we leave it as little endian
+        #   and hope for the best (big endian is retired anyway)
+        return False, group < 1024
+
+    return True, True
+
+
 def read_partial(fileobj, stop_when=None, defer_size=None,
-                 force=False, specific_tags=None):
+                 force=False, specific_tags=None, index=None,
+                 raw_sequences=False):
     """Parse a DICOM file until a condition is met.
 
     Parameters
     ----------
     fileobj : a file-like object
-        Note that the file will not close when the function returns.
+        Note that the file will not close when the function returns. If a
+        :class:`~pydicom.filebase.DicomMemoryMap` then the values of
+        bulk binary elements will be :class:`memoryview` instances of the
+        mapped file (see the `mmap` parameter of :func:`dcmread`).
     stop_when :
         Stop condition. See :func:`read_dataset` for more info.
     defer_size : int, str, None, optional
@@ -648,6 +949,12 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
         See :func:`dcmread` for parameter info.
     specific_tags : list or None
         See :func:`dcmread` for parameter info.
+    index : ElementIndex or None
+        If used then the dataset elements are read using the positions in
+        the index rather than by parsing the file (see the `index` parameter
+        of :func:`dcmread`).
+    raw_sequences : bool, optional
+        See :func:`dcmread` for parameter info.
 
     Notes
     -----
@@ -695,22 +1002,8 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
         #   the correct values for `is_little_endian` and `is_implicit_VR`.
         # Peek at the first 6 bytes to get the first element's tag group and
         #   (possibly) VR
-        group, _, VR = unpack("<HH2s", fileobj.read(6))
+        is_implicit_VR, is_little_endian = _guess_encoding(fileobj.read(6))
         fileobj.seek(-6, 1)
-
-        # Test the VR to see if it's valid, and if so then assume explicit VR
-        from pydicom.values import converters
-        VR = VR.decode(default_encoding)
-        if VR in converters.keys():
-            is_implicit_VR = False
-            # Big endian encoding can only be explicit VR
-            #   Big endian 0x0004 decoded as little endian will be 1024
-            #   Big endian 0x0100 decoded as little endian will be 1
-            # Therefore works for big endian tag groups up to 0x00FF after
-            #   which it will fail, in which case we leave it as little endian
-            #   and hope for the best (big endian is retired anyway)
-            if group >= 1024:
-                is_little_endian = False
     elif transfer_syntax == pydicom.uid.ImplicitVRLittleEndian:
         pass
     elif transfer_syntax == pydicom.uid.ExplicitVRLittleEndian:
@@ -724,12 +1017,10 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
         #     the file metadata was prepared the normal way,
         #     then "deflate" compression applied.
         #  All that is needed here is to decompress and then
-        #     use as normal in a file-like object
-        zipped = fileobj.read()
-        # -MAX_WBITS part is from comp.lang.python answer:
-        # groups.google.com/group/comp.lang.python/msg/e95b3b38a71e6799
-        unzipped = zlib.decompress(zipped, -zlib.MAX_WBITS)
-        fileobj = BytesIO(unzipped)  # a file-like object
+        #     use as normal in a file-like object, which inflates
+        #     the data as it's read so only the parts of the dataset
+        #     that are needed are decompressed
+        fileobj = _InflatedFileLike(fileobj)
         is_implicit_VR = False
     else:
         # Any other syntax should be Explicit VR Little Endian,
@@ -741,9 +1032,19 @@ def read_partial(fileobj, stop_when=None, defer_size=None,
     #   By this point we should be at the start of the dataset and have
     #   the transfer syntax (whether read from the file meta or guessed at)
     try:
-        dataset = read_dataset(fileobj, is_implicit_VR, is_little_endian,
-                               stop_when=stop_when, defer_size=defer_size,
-                               specific_tags=specific_tags)
+        if index is not None and peek != b'':
+            dataset = _read_indexed_dataset(
+                fileobj, index, stop_when=stop_when, defer_size=defer_size,
+                specific_tags=specific_tags, raw_sequences=raw_sequences
+            )
+            is_implicit_VR = index.is_implicit_VR
+            is_little_endian = index.is_little_endian
+        else:
+            dataset = read_dataset(
+                fileobj, is_implicit_VR, is_little_endian,
+                stop_when=stop_when, defer_size=defer_size,
+                specific_tags=specific_tags, raw_sequences=raw_sequences
+            )
     except EOFError:
         if config.enforce_valid_values:
             raise
@@ -776,7 +1077,10 @@ def dcmread(
     defer_size: Optional[Union[str, int]] = None,
     stop_before_pixels: bool = False,
     force: bool = False,
-    specific_tags: Optional[List[Union[int, str, Tuple[int]]]] = None
+    specific_tags: Optional[List[Union[int, str, Tuple[int]]]] = None,
+    mmap: bool = False,
+    index: Optional[Union[str, "os.PathLike[AnyStr]", "ElementIndex"]] = None,
+    raw_sequences: bool = False
 ) -> Union[FileDataset, DicomDir]:
     """Read and parse a DICOM dataset stored in the DICOM File Format.
 
@@ -811,6 +1115,35 @@ def dcmread(
         elements can be tags or tag names. Note that the element (0008,0005)
         *Specific Character Set* is always returned if present - this ensures
         correct decoding of returned text values.
+    mmap : bool, optional
+        If ``False`` (default), element values are copied into memory as
+        :class:`bytes`. If ``True`` then `fp` must be a path and the file is
+        memory-mapped instead, with the values of elements with a VR of
+        **OB**, **OD**, **OF**, **OL**, **OV** or **OW** and a defined length
+        (such as native *Pixel Data*) returned as read-only
+        :class:`memoryview` instances of the mapping rather than copies. The
+        mapping is released once the dataset and any views taken from it
+        are no longer referenced.
+
+        .. versionadded:: 2.2
+    index : str or PathLike or ElementIndex, optional
+        An :class:`ElementIndex` of the file at `fp` or the path to an index
+        sidecar file written by :func:`build_element_index`. If used then the
+        wanted elements are read by seeking directly to them rather than by
+        parsing the file, which is much faster when only a few
+        `specific_tags` are needed. If `fp` is a path and the file's size or
+        modification time has changed since the index was built then a
+        warning is issued and the index is ignored.
+
+        .. versionadded:: 2.2
+    raw_sequences : bool, optional
+        If ``False`` (default), sequences with an undefined length are parsed
+        as they're read. If ``True`` then they're kept encoded like sequences
+        with a defined length, so they're only parsed when accessed and are
+        written unchanged by :func:`~pydicom.filewriter.dcmwrite` if they
+        haven't been accessed and the transfer syntax is the same.
+
+        .. versionadded:: 2.2
 
     Returns
     -------
@@ -826,6 +1159,9 @@ def dcmread(
         If `force` is ``False`` and the file is not a valid DICOM file.
     TypeError
         If `fp` is ``None`` or of an unsupported type.
+    ValueError
+        If `mmap` is ``True`` and `fp` is not a path, or if `index` doesn't
+        match the file.
 
     See Also
     --------
@@ -850,15 +1186,47 @@ def dcmread(
 
     >>> with pydicom.dcmread("rtplan.dcm") as ds:
     >>>     ds.PatientName
+
+    Memory-map a large multi-frame file so the *Pixel Data* isn't copied:
+
+    >>> ds = pydicom.dcmread("multiframe.dcm", mmap=True)
+    >>> arr = pydicom.pixel_data_handlers.numpy_handler.get_pixeldata(
+    ...     ds, read_only=True
+    ... )
+
+    Use an index to quickly read a few elements from a file:
+
+    >>> index = pydicom.filereader.build_element_index("rtplan.dcm")
+    >>> ds = pydicom.dcmread(
+    ...     "rtplan.dcm", specific_tags=["PatientName"], index=index
+    ... )
     """
     # Open file if not already a file object
     caller_owns_file = True
     fp = path_from_pathlike(fp)
+    if index is not None and not isinstance(index, ElementIndex):
+        index = read_element_index(index)
+
+    if isinstance(fp, str) and index is not None:
+        stat = os.stat(fp)
+        if (stat.st_size, stat.st_mtime_ns) != (
+            index.file_size, index.mtime_ns
+        ):
+            warnings.warn(
+                f"The file '{fp}' has changed since its element index was "
+                "built, the index will not be used"
+            )
+            index = None
+
     if isinstance(fp, str):
         # caller provided a file name; we own the file handle
         caller_owns_file = False
         logger.debug("Reading file '{0}'".format(fp))
-        fp = open(fp, 'rb')
+        fp = DicomMemoryMap(fp) if mmap else open(fp, 'rb')
+    elif mmap:
+        raise ValueError(
+            "dcmread: 'mmap' can only be used when 'fp' is a file path"
+        )
     elif fp is None or not hasattr(fp, "read") or not hasattr(fp, "seek"):
         raise TypeError("dcmread: Expected a file path or a file-like, "
                         "but got " + type(fp).__name__)
@@ -885,7 +1253,8 @@ def dcmread(
         stop_when = _at_pixel_data
     try:
         dataset = read_partial(fp, stop_when, defer_size=defer_size,
-                               force=force, specific_tags=specific_tags)
+                               force=force, specific_tags=specific_tags,
+                               index=index, raw_sequences=raw_sequences)
     finally:
         if not caller_owns_file:
             fp.close()
@@ -896,6 +1265,797 @@ def dcmread(
 read_file = dcmread  # used read_file until pydicom 1.0. Kept for compatibility
 
 
+if shared_memory is not None:
+    class _SharedMemory(shared_memory.SharedMemory):
+        """A shared memory block that's kept mapped while there are views."""
+
+        def __del__(self) -> None:
+            try:
+                self.close()
+            except BufferError:
+                # The block is unmapped once the remaining views of it
+                #   have been released
+                pass
+
+
+def _dcmread_shared(
+    path: Union[str, "os.PathLike[AnyStr]"], name: str, kwargs: Dict[str, Any]
+) -> Tuple[bytes, List[Tuple[int, int]]]:
+    """Return the dataset read from `path` in a worker process pickled with
+    its bulk binary values copied to the shared memory block `name`.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The path to the file to read.
+    name : str
+        The name of the shared memory block created by the parent process.
+    kwargs : dict
+        The keyword arguments to use with :func:`dcmread`.
+
+    Returns
+    -------
+    bytes, list of (int, int)
+        The dataset pickled using protocol 5 and the ``(start, end)``
+        positions in the block of each of its out-of-band buffers. Any
+        buffers that don't fit in the block are pickled in-band.
+    """
+    ds = dcmread(path, **kwargs)
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        positions = []
+
+        def _to_shared(buffer: pickle.PickleBuffer) -> bool:
+            start = positions[-1][1] if positions else 0
+            view = buffer.raw()
+            end = start + view.nbytes
+            if end > shm.size:
+                return True
+
+            shm.buf[start:end] = view
+            positions.append((start, end))
+            return False
+
+        data = pickle.dumps(ds, protocol=5, buffer_callback=_to_shared)
+    finally:
+        shm.close()
+
+    return data, positions
+
+
+def _restore_shared(
+    data: bytes,
+    positions: List[Tuple[int, int]],
+    shm: "_SharedMemory"
+) -> FileDataset:
+    """Return the dataset pickled by :func:`_dcmread_shared` with its
+    out-of-band values as views of `shm`.
+    """
+    buffers = [shm.buf[start:end].toreadonly() for start, end in positions]
+    ds = pickle.loads(data, buffers=buffers)
+    del buffers
+    if positions:
+        # Set after the elements so the views are released first when the
+        #   dataset is garbage collected
+        ds.shared_memory = shm
+    else:
+        shm.close()
+
+    return ds
+
+
+def dcmread_many(
+    paths: Iterable[Union[str, "os.PathLike[AnyStr]"]],
+    workers: Optional[int] = None,
+    executor: str = 'process',
+    ordered: bool = True,
+    shared: bool = False,
+    **kwargs: Any
+) -> Iterator[Union[FileDataset, DicomDir]]:
+    """Read multiple DICOM files in parallel.
+
+    .. versionadded:: 2.2
+
+    Parameters
+    ----------
+    paths : iterable of (str or PathLike)
+        The paths to the files to be read.
+    workers : int, optional
+        The maximum number of worker processes or threads, defaults to the
+        number of processors on the machine (see
+        :class:`concurrent.futures.ProcessPoolExecutor`).
+    executor : str, optional
+        The type of worker to use, one of:
+
+        * ``'process'`` (default): read the files using a pool of processes,
+          best when many small files are being read as the parsing isn't
+          limited by the GIL. The datasets are pickled to return them from
+          the worker processes.
+        * ``'thread'``: read the files using a pool of threads, best when
+          most of the time is spent waiting on I/O, such as with network
+          storage.
+    ordered : bool, optional
+        If ``True`` (default) then yield the datasets in the same order as
+        `paths`, otherwise yield each dataset as soon as it's been read.
+    shared : bool, optional
+        If ``True`` and using the ``'process'`` executor with Python 3.8+
+        then the large bulk binary values, such as *Pixel Data*, are
+        returned from the worker processes in a
+        :class:`~multiprocessing.shared_memory.SharedMemory` block rather
+        than being pickled, and are read-only :class:`memoryview` views of
+        the block. Default ``False``. See the notes below.
+    **kwargs
+        Additional keyword arguments to pass to :func:`dcmread`.
+
+    Yields
+    ------
+    FileDataset or DicomDir
+        The read datasets. Only a limited number of files are read in
+        advance of the datasets that have been yielded, so large numbers of
+        files can be read without running out of memory.
+
+    Raises
+    ------
+    ValueError
+        If `executor` is not ``'process'`` or ``'thread'`` or if `mmap` is
+        used with the ``'process'`` executor.
+
+    Notes
+    -----
+    With `shared`, the shared memory block of a dataset is owned by the
+    caller and is available as the dataset's ``shared_memory`` attribute.
+    The block has already been unlinked, so it's freed once the dataset
+    and any remaining views of its values, such as a NumPy array returned
+    by :attr:`~pydicom.dataset.Dataset.pixel_array`, have been garbage
+    collected. It can also be released early with
+    ``ds.shared_memory.close()``, which raises :class:`BufferError` if
+    there are still views of the block in use. Each
+    block is created by the parent process with the size of the file, so
+    values that don't fit, such as those of a deflated dataset, are
+    pickled as usual.
+
+    Examples
+    --------
+    Read a series using 4 worker processes:
+
+    >>> from pathlib import Path
+    >>> from pydicom.filereader import dcmread_many
+    >>> paths = sorted(Path("series").glob("*.dcm"))
+    >>> datasets = list(dcmread_many(paths, workers=4))
+
+    Read a series with the pixel data returned in shared memory:
+
+    >>> for ds in dcmread_many(paths, shared=True):
+    ...     arr = ds.pixel_array
+    ...     del ds
+    """
+    if executor not in ('process', 'thread'):
+        raise ValueError(
+            f"Invalid 'executor' value '{executor}', must be 'process' or "
+            "'thread'"
+        )
+
+    use_processes = executor == 'process'
+    if use_processes and kwargs.get('mmap'):
+        raise ValueError(
+            "'mmap' can't be used with the 'process' executor as memory-"
+            "mapped values can't be returned from the worker processes"
+        )
+
+    use_shared = shared and use_processes and shared_memory is not None
+    if use_shared:
+        # Share our resource tracker with the workers so the shared memory
+        #   they use isn't cleaned up when they exit
+        resource_tracker.ensure_running()
+
+    pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    pool = pool_class(max_workers=workers)
+    nr_workers = workers or os.cpu_count() or 1
+    # The shared memory blocks of the files being read, which are created
+    #   by us so they're kept when the workers close them
+    blocks = {}
+
+    def _submit(path):
+        size = os.path.getsize(path) if use_shared else 0
+        if not size:
+            return pool.submit(dcmread, path, **kwargs)
+
+        shm = _SharedMemory(create=True, size=size)
+        try:
+            future = pool.submit(_dcmread_shared, path, shm.name, kwargs)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        blocks[future] = shm
+        return future
+
+    def _result(future):
+        shm = blocks.pop(future, None)
+        if shm is None:
+            return future.result()
+
+        try:
+            data, positions = future.result()
+        except BaseException:
+            shm.close()
+            raise
+        finally:
+            # Unlink once the worker has finished with the block, it's
+            #   freed when we close it
+            shm.unlink()
+
+        return _restore_shared(data, positions, shm)
+
+    # Limit the number of files read ahead of the consumer
+    paths = iter(paths)
+    futures = deque(_submit(path) for path in islice(paths, 2 * nr_workers))
+    try:
+        if ordered:
+            while futures:
+                future = futures.popleft()
+                futures.extend(_submit(path) for path in islice(paths, 1))
+                yield _result(future)
+        else:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    futures.remove(future)
+                    futures.extend(_submit(path) for path in islice(paths, 1))
+                    yield _result(future)
+    finally:
+        # Don't read any more files if not all the datasets were consumed
+        for future in futures:
+            future.cancel()
+
+        pool.shutdown(wait=True)
+        # Free the shared memory of the datasets that weren't consumed
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
+
+
+class _BufferFileLike:
+    """A minimal read-only file-like over a :class:`memoryview` whose
+    positions are offset by `offset`.
+    """
+    def __init__(self, view: memoryview, offset: int) -> None:
+        self._view = view
+        self._offset = offset
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._position
+        end = len(self._view) if size < 0 else start + size
+        data = self._view[start:end].tobytes()
+        self._position = start + len(data)
+        return data
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 1:
+            self._position += offset
+        elif whence == 2:
+            self._position = len(self._view) + offset
+        else:
+            self._position = offset - self._offset
+
+        return self._position + self._offset
+
+    def tell(self) -> int:
+        return self._position + self._offset
+
+
+class IncrementalParser:
+    """Parse DICOM data incrementally as it's received.
+
+    .. versionadded:: 2.2
+
+    Encoded data is passed to the parser in chunks of any size using
+    :meth:`feed`, which returns each top-level element as soon as all of its
+    encoded data has been received. This allows the elements to be used
+    while the rest of the data is still being received, such as when reading
+    from a socket or when using ranged reads from object storage.
+
+    By default the data is expected to be in the DICOM File Format with a
+    preamble and *File Meta Information*, which is used to determine the
+    transfer syntax of the dataset. If the data is only an encoded dataset
+    then the encoding should be set using `is_implicit_VR` and
+    `is_little_endian`.
+
+    Attributes
+    ----------
+    preamble : bytes or None
+        The 128-byte DICOM preamble, if present.
+    file_meta : dataset.FileMetaDataset
+        The *File Meta Information* elements, if present.
+    is_implicit_VR : bool or None
+        ``True`` if the dataset is implicit VR, ``None`` if not yet known.
+    is_little_endian : bool or None
+        ``True`` if the dataset is little endian, ``None`` if not yet known.
+
+    Examples
+    --------
+
+    >>> parser = IncrementalParser()
+    >>> ds = Dataset()
+    >>> for chunk in iter(lambda: sock.recv(65536), b""):
+    ...     for elem in parser.feed(chunk):
+    ...         ds[elem.tag] = elem
+    >>> ds.update({elem.tag: elem for elem in parser.close()})
+    """
+    def __init__(
+        self,
+        is_implicit_VR: Optional[bool] = None,
+        is_little_endian: Optional[bool] = None,
+        force: bool = False
+    ) -> None:
+        """Create a new parser.
+
+        Parameters
+        ----------
+        is_implicit_VR : bool, optional
+            If used then the data is an encoded dataset without a preamble or
+            *File Meta Information* and `is_little_endian` must also be used.
+            ``True`` if the dataset is implicit VR, ``False`` otherwise.
+        is_little_endian : bool, optional
+            ``True`` if the dataset is little endian, ``False`` otherwise.
+            Must be used with `is_implicit_VR`.
+        force : bool, optional
+            If ``False`` (default) raise an
+            :class:`~pydicom.errors.InvalidDicomError` if the data is in the
+            DICOM File Format but is missing the preamble and prefix. Set to
+            ``True`` to parse it anyway. See :func:`dcmread` for more
+            information.
+        """
+        if (is_implicit_VR is None) != (is_little_endian is None):
+            raise ValueError(
+                "'is_implicit_VR' and 'is_little_endian' must either both be "
+                "used or both be None"
+            )
+
+        self.preamble: Optional[bytes] = None
+        self.file_meta = FileMetaDataset()
+        self.is_implicit_VR = is_implicit_VR
+        self.is_little_endian = is_little_endian
+        self._force = force
+        self._state = "preamble" if is_implicit_VR is None else "dataset"
+        self._file_meta_elements: Dict[BaseTag, RawDataElement] = {}
+        self._encoding: Union[str, List[str]] = default_encoding
+        self._inflater = None
+
+        # The data received but not yet parsed, starting at `_offset` in the
+        #   (inflated) stream
+        self._buffer = bytearray()
+        self._offset = 0
+        # When scanning an undefined length value for its end, the
+        #   position of the scan in the buffer and a stack with a
+        #   (is in item, is implicit VR) for each nested undefined length
+        #   sequence and item being scanned
+        self._scan_position = 0
+        self._scan_stack: List[Tuple[bool, bool]] = []
+
+    def feed(self, data: bytes) -> List[Union[RawDataElement, DataElement]]:
+        """Parse the next chunk of encoded data.
+
+        Parameters
+        ----------
+        data : bytes
+            The next chunk of data.
+
+        Returns
+        -------
+        list of (dataelem.RawDataElement or dataelem.DataElement)
+            The top-level elements completed by `data`, in the order they
+            were encoded. Undefined length sequences are returned as
+            :class:`~pydicom.dataelem.DataElement` and all other elements
+            as :class:`~pydicom.dataelem.RawDataElement`, the same as
+            :func:`data_element_generator`. Any *File Meta Information*
+            elements are added to :attr:`file_meta` instead.
+        """
+        if self._inflater is not None:
+            data = self._inflater.decompress(data)
+
+        self._buffer += data
+        return self._parse()
+
+    def close(self) -> List[Union[RawDataElement, DataElement]]:
+        """Finish parsing once all the data has been fed.
+
+        Returns
+        -------
+        list of (dataelem.RawDataElement or dataelem.DataElement)
+            Any top-level elements that couldn't be returned until the end
+            of the data was known.
+
+        Raises
+        ------
+        EOFError
+            If the data ends part way through an element and
+            :attr:`~pydicom.config.enforce_valid_values` is ``True``,
+            otherwise a warning is issued.
+        """
+        if self._inflater is not None:
+            self._buffer += self._inflater.flush()
+            self._inflater = None
+
+        elements = self._parse(at_end=True)
+        if self._buffer:
+            msg = (
+                f"End of data reached with {len(self._buffer)} bytes of an "
+                f"incomplete element at position {self._offset}"
+            )
+            if config.enforce_valid_values:
+                raise EOFError(msg)
+
+            warnings.warn(msg, UserWarning)
+            self._buffer.clear()
+
+        return elements
+
+    def _next_tag(self) -> Optional[BaseTag]:
+        """Return the tag of the next dataset element, or ``None`` if it
+        hasn't been received yet.
+        """
+        if self._state != "dataset" or len(self._buffer) < 4:
+            return None
+
+        endian_chr = "<" if self.is_little_endian else ">"
+        group, elem = unpack_from(endian_chr + "HH", self._buffer)
+        return TupleTag((group, elem))
+
+    def _parse(self, at_end: bool = False) -> List[
+        Union[RawDataElement, DataElement]
+    ]:
+        """Return the top-level elements that can be parsed from the
+        buffered data.
+        """
+        buffer = self._buffer
+        elements = []
+        while True:
+            if self._state == "preamble":
+                if len(buffer) < 132 and not at_end:
+                    break
+
+                if buffer[128:132] == b"DICM":
+                    self.preamble = bytes(buffer[:128])
+                    self._consume(132)
+                elif not self._force:
+                    raise InvalidDicomError(
+                        "File is missing DICOM File Meta Information header "
+                        "or the 'DICM' prefix is missing from the header. "
+                        "Use force=True to force reading."
+                    )
+
+                self._state = "file meta"
+            elif self._state == "file meta":
+                if len(buffer) < 2 and not at_end:
+                    break
+
+                if buffer[:2] != b"\x02\x00":
+                    # Not group 0x0002 so the File Meta Information is done
+                    if not self._start_dataset(at_end):
+                        break
+
+                    continue
+
+                elem = self._next_element(False, True, default_encoding)
+                if elem is None:
+                    break
+
+                self._file_meta_elements[elem.tag] = elem
+            else:
+                if not buffer:
+                    break
+
+                elem = self._next_element(
+                    self.is_implicit_VR, self.is_little_endian, self._encoding
+                )
+                if elem is None:
+                    break
+
+                if elem.tag == 0x00080005:
+                    char_set = DataElement_from_raw(elem).value
+                    self._encoding = convert_encodings(char_set)
+
+                elements.append(elem)
+
+        return elements
+
+    def _start_dataset(self, at_end: bool) -> bool:
+        """Set the dataset encoding after the end of any *File Meta
+        Information*, returning ``False`` if more data is needed.
+        """
+        self.file_meta = FileMetaDataset(Dataset(self._file_meta_elements))
+        transfer_syntax = self.file_meta.get("TransferSyntaxUID")
+        if transfer_syntax is None:
+            # Need the tag group and VR of the first element to guess
+            if len(self._buffer) < 6:
+                if not at_end:
+                    return False
+
+                self.is_implicit_VR, self.is_little_endian = True, True
+            else:
+                self.is_implicit_VR, self.is_little_endian = (
+                    _guess_encoding(bytes(self._buffer[:6]))
+                )
+        elif transfer_syntax == pydicom.uid.ImplicitVRLittleEndian:
+            self.is_implicit_VR, self.is_little_endian = True, True
+        elif transfer_syntax == pydicom.uid.ExplicitVRBigEndian:
+            self.is_implicit_VR, self.is_little_endian = False, False
+        else:
+            self.is_implicit_VR, self.is_little_endian = False, True
+
+        if transfer_syntax == pydicom.uid.DeflatedExplicitVRLittleEndian:
+            # Inflate the rest of the data as it's received, with positions
+            #   relative to the start of the inflated dataset
+            self._inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+            data = self._inflater.decompress(self._buffer)
+            self._buffer.clear()
+            self._buffer += data
+            if at_end:
+                self._buffer += self._inflater.flush()
+                self._inflater = None
+            self._offset = 0
+
+        self._state = "dataset"
+        return True
+
+    def _consume(self, length: int) -> None:
+        """Remove `length` bytes from the start of the buffer."""
+        del self._buffer[:length]
+        self._offset += length
+
+    def _next_element(
+        self,
+        is_implicit_VR: bool,
+        is_little_endian: bool,
+        encoding: Union[str, List[str]]
+    ) -> Optional[Union[RawDataElement, DataElement]]:
+        """Return the next element in the buffer or ``None`` if it's
+        incomplete.
+        """
+        buffer = self._buffer
+        endian_chr = "<" if is_little_endian else ">"
+        if not self._scan_stack:
+            if len(buffer) < 8:
+                return None
+
+            if is_implicit_VR:
+                _, _, length = unpack_from(endian_chr + "HHL", buffer)
+                VR = None
+                header_length = 8
+            else:
+                _, _, VR, length = unpack_from(endian_chr + "HH2sH", buffer)
+                VR = VR.decode(default_encoding)
+                header_length = 8
+                if VR in extra_length_VRs:
+                    if len(buffer) < 12:
+                        return None
+
+                    length = unpack_from(endian_chr + "L", buffer, 8)[0]
+                    header_length = 12
+
+            if length != 0xFFFFFFFF:
+                end = header_length + length
+                if len(buffer) < end:
+                    return None
+
+                return self._parse_element(
+                    end, is_implicit_VR, is_little_endian, encoding
+                )
+
+            # Undefined length sequence or encapsulated value, UN is
+            #   always encoded as implicit VR little endian
+            self._scan_stack.append((False, is_implicit_VR or VR == 'UN'))
+            self._scan_position = header_length
+
+        end = self._scan_undefined_length(endian_chr)
+        if end is None:
+            return None
+
+        return self._parse_element(
+            end, is_implicit_VR, is_little_endian, encoding
+        )
+
+    def _scan_undefined_length(self, endian_chr: str) -> Optional[int]:
+        """Continue scanning the items of the current undefined length value
+        and return the position of its end in the buffer, or ``None`` if
+        more data is needed.
+        """
+        buffer = self._buffer
+        stack = self._scan_stack
+        position = self._scan_position
+        tag_length_format = endian_chr + "HHL"
+        while stack:
+            if len(buffer) < position + 8:
+                break
+
+            group, elem, length = unpack_from(
+                tag_length_format, buffer, position
+            )
+            is_in_item, is_implicit_VR = stack[-1]
+            if not is_in_item:
+                # An item or the end of the sequence
+                if (group, elem) == (0xFFFE, 0xE0DD):
+                    stack.pop()
+                    position += 8
+                elif length == 0xFFFFFFFF:
+                    stack.append((True, is_implicit_VR))
+                    position += 8
+                else:
+                    position += 8 + length
+
+                continue
+
+            # An element within an undefined length item or the end of it
+            if (group, elem) == (0xFFFE, 0xE00D):
+                stack.pop()
+                position += 8
+                continue
+
+            VR = None
+            header_length = 8
+            if not is_implicit_VR:
+                VR = bytes(buffer[position + 4:position + 6])
+                VR = VR.decode(default_encoding)
+                if VR in extra_length_VRs:
+                    if len(buffer) < position + 12:
+                        break
+
+                    length = unpack_from(
+                        endian_chr + "L", buffer, position + 8
+                    )[0]
+                    header_length = 12
+                else:
+                    length = unpack_from(
+                        endian_chr + "H", buffer, position + 6
+                    )[0]
+
+            if length == 0xFFFFFFFF:
+                stack.append((False, is_implicit_VR or VR == 'UN'))
+                position += header_length
+            else:
+                position += header_length + length
+
+        self._scan_position = position
+        if stack:
+            return None
+
+        return position
+
+    def _parse_element(
+        self,
+        end: int,
+        is_implicit_VR: bool,
+        is_little_endian: bool,
+        encoding: Union[str, List[str]]
+    ) -> Union[RawDataElement, DataElement]:
+        """Return the element encoded in the first `end` bytes of the buffer
+        and remove them from the buffer.
+        """
+        with memoryview(self._buffer) as view:
+            fp = _BufferFileLike(view[:end], self._offset)
+            elem_gen = data_element_generator(
+                fp, is_implicit_VR, is_little_endian, encoding=encoding
+            )
+            elem = next(elem_gen)
+            del fp, elem_gen
+
+        self._consume(end)
+        return elem
+
+
+async def dcmread_async(
+    stream: Any,
+    stop_before_pixels: bool = False,
+    force: bool = False,
+    specific_tags: Optional[List[Union[int, str, Tuple[int]]]] = None,
+    chunk_size: int = 65536
+) -> FileDataset:
+    """Read and parse a DICOM dataset from an asynchronous stream.
+
+    .. versionadded:: 2.2
+
+    The data is read from `stream` in chunks and parsed by an
+    :class:`IncrementalParser` as it's received, so the event loop isn't
+    blocked while waiting for the data.
+
+    Parameters
+    ----------
+    stream : object
+        The stream to read from, such as an :class:`asyncio.StreamReader`.
+        It must have an ``async read(n)`` method that returns up to `n`
+        bytes and an empty :class:`bytes` at the end of the stream.
+    stop_before_pixels : bool, optional
+        If ``False`` (default), the full stream will be read and parsed. Set
+        ``True`` to stop reading before (7FE0,0010) *Pixel Data* (and all
+        subsequent elements).
+    force : bool, optional
+        If ``False`` (default), raises an
+        :class:`~pydicom.errors.InvalidDicomError` if the data is missing
+        the DICOM preamble and prefix. See :func:`dcmread` for more
+        information.
+    specific_tags : list of (int or str or 2-tuple of int), optional
+        If not ``None``, only the tags in the list are returned and reading
+        stops once the last of them has been passed. See :func:`dcmread`
+        for more information.
+    chunk_size : int, optional
+        The maximum number of bytes to read from `stream` at a time, default
+        ``65536``.
+
+    Returns
+    -------
+    FileDataset
+        The parsed dataset.
+
+    Raises
+    ------
+    InvalidDicomError
+        If `force` is ``False`` and the data is not in the DICOM File
+        Format.
+
+    Examples
+    --------
+
+    >>> reader, writer = await asyncio.open_connection(host, port)
+    >>> ds = await dcmread_async(reader, stop_before_pixels=True)
+    """
+    tag_set = {Tag(tag) for tag in specific_tags} if specific_tags else set()
+    if tag_set:
+        tag_set.add(Tag(0x00080005))  # Specific Character Set
+        max_tag = max(tag_set)
+
+    def _is_past_end(tag):
+        if stop_before_pixels and tag == 0x7FE00010:
+            return True
+
+        return bool(tag_set) and tag > max_tag
+
+    parser = IncrementalParser(force=force)
+    raw_data_elements = {}
+    at_end = False
+    while not at_end:
+        data = await stream.read(chunk_size)
+        if data:
+            elements = parser.feed(data)
+        else:
+            elements = parser.close()
+
+        for elem in elements:
+            if _is_past_end(elem.tag):
+                at_end = True
+                break
+
+            if not tag_set or elem.tag in tag_set:
+                raw_data_elements[elem.tag] = elem
+
+        next_tag = parser._next_tag()
+        at_end = (
+            at_end or not data
+            or (next_tag is not None and _is_past_end(next_tag))
+        )
+
+    dataset = Dataset(raw_data_elements)
+    if 0x00080005 in raw_data_elements:
+        char_set = DataElement_from_raw(raw_data_elements[0x00080005]).value
+        encoding = convert_encodings(char_set)
+    else:
+        encoding = default_encoding
+
+    # The encoding is unknown if there was no data
+    is_implicit_VR = parser.is_implicit_VR in (None, True)
+    is_little_endian = parser.is_little_endian in (None, True)
+    new_dataset = FileDataset(
+        stream, dataset, parser.preamble, parser.file_meta, is_implicit_VR,
+        is_little_endian
+    )
+    new_dataset.set_original_encoding(
+        is_implicit_VR, is_little_endian, encoding
+    )
+    return new_dataset
+
+
 def read_dicomdir(filename="DICOMDIR"):
     """Read a DICOMDIR file and return a :class:`~pydicom.dicomdir.DicomDir`.
 
@@ -949,6 +2109,112 @@ def data_element_offset_to_value(is_implicit_VR, VR):
     return offset
 
 
+# The files used to read deferred elements, keyed by
+#   (file type, path, modification time) and ordered by last use
+_deferred_read_files = OrderedDict()
+_deferred_read_lock = threading.Lock()
+
+
+def _cached_deferred_read_file(fileobj_type, filename, mtime):
+    """Return the open file to use for reading deferred elements from
+    `filename`.
+
+    Parameters
+    ----------
+    fileobj_type : type
+        The type of the original file object.
+    filename : str
+        The path to the file.
+    mtime : float
+        The current modification time of the file.
+
+    Returns
+    -------
+    file-like
+        The cached file, or the newly opened file if not already cached.
+    """
+    key = (fileobj_type, filename, mtime)
+    fp = _deferred_read_files.get(key)
+    if fp is not None:
+        _deferred_read_files.move_to_end(key)
+        return fp
+
+    # Close any files cached before `filename` was modified
+    for stale in [k for k in _deferred_read_files if k[:2] == key[:2]]:
+        _deferred_read_files.pop(stale).close()
+
+    fp = _deferred_read_files[key] = fileobj_type(filename, 'rb')
+    while len(_deferred_read_files) > config.deferred_read_cache_size:
+        _deferred_read_files.popitem(last=False)[1].close()
+
+    return fp
+
+
+def clear_deferred_read_cache():
+    """Close any files cached for reading deferred elements.
+
+    .. versionadded:: 2.2
+
+    See :attr:`~pydicom.config.deferred_read_cache_size` for more
+    information.
+    """
+    with _deferred_read_lock:
+        while _deferred_read_files:
+            _deferred_read_files.popitem()[1].close()
+
+
+@contextmanager
+def _deferred_file(fileobj_type, filename_or_obj, timestamp):
+    """Yield the file to use for reading the values of deferred elements.
+
+    See :func:`read_deferred_data_element` for the parameters.
+    """
+    # If it wasn't read from a file, then return an error
+    if filename_or_obj is None:
+        raise IOError("Deferred read -- original filename not stored. "
+                      "Cannot re-open")
+    is_filename = isinstance(filename_or_obj, str)
+
+    # Check that the file is the same as when originally read
+    if is_filename:
+        try:
+            statinfo = os.stat(filename_or_obj)
+        except FileNotFoundError:
+            raise IOError("Deferred read -- original file "
+                          "{0:s} is missing".format(filename_or_obj))
+        if timestamp is not None and statinfo.st_mtime != timestamp:
+            warnings.warn("Deferred read warning -- file modification time "
+                          "has changed.")
+
+    # Open the file (or use the cached one)
+    if is_filename and config.deferred_read_cache_size > 0:
+        with _deferred_read_lock:
+            yield _cached_deferred_read_file(
+                fileobj_type, filename_or_obj, statinfo.st_mtime
+            )
+    else:
+        fp = (fileobj_type(filename_or_obj, 'rb')
+              if is_filename else filename_or_obj)
+        try:
+            yield fp
+        finally:
+            fp.close()
+
+
+def _read_deferred_element(fp, raw_data_elem):
+    """Return the raw data element for `raw_data_elem` read from `fp`."""
+    is_implicit_VR = raw_data_elem.is_implicit_VR
+    is_little_endian = raw_data_elem.is_little_endian
+    offset = data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
+    fp.seek(raw_data_elem.value_tell - offset)
+    # Only sequences read with `raw_sequences` have undefined length and
+    #   are deferred
+    elem_gen = data_element_generator(fp, is_implicit_VR, is_little_endian,
+                                      defer_size=None, raw_sequences=True)
+
+    return next(elem_gen)
+
+
 def read_deferred_data_element(fileobj_type, filename_or_obj, timestamp,
                                raw_data_elem):
     """Read the previously deferred value from the file into memory
@@ -987,35 +2253,10 @@ def read_deferred_data_element(fileobj_type, filename_or_obj, timestamp,
         If the VR or tag of `raw_data_elem` does not match the read value.
     """
     logger.debug("Reading deferred element %r" % str(raw_data_elem.tag))
-    # If it wasn't read from a file, then return an error
-    if filename_or_obj is None:
-        raise IOError("Deferred read -- original filename not stored. "
-                      "Cannot re-open")
-    is_filename = isinstance(filename_or_obj, str)
-
-    # Check that the file is the same as when originally read
-    if is_filename and not os.path.exists(filename_or_obj):
-        raise IOError("Deferred read -- original file "
-                      "{0:s} is missing".format(filename_or_obj))
-    if timestamp is not None:
-        statinfo = os.stat(filename_or_obj)
-        if statinfo.st_mtime != timestamp:
-            warnings.warn("Deferred read warning -- file modification time "
-                          "has changed.")
-
-    # Open the file, position to the right place
-    fp = (fileobj_type(filename_or_obj, 'rb')
-          if is_filename else filename_or_obj)
-    is_implicit_VR = raw_data_elem.is_implicit_VR
-    is_little_endian = raw_data_elem.is_little_endian
-    offset = data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
-    fp.seek(raw_data_elem.value_tell - offset)
-    elem_gen = data_element_generator(fp, is_implicit_VR, is_little_endian,
-                                      defer_size=None)
+    with _deferred_file(fileobj_type, filename_or_obj, timestamp) as fp:
+        data_elem = _read_deferred_element(fp, raw_data_elem)
 
-    # Read the data element and check matches what was stored before
-    data_elem = next(elem_gen)
-    fp.close()
+    # Check the read data element matches what was stored before
     if data_elem.VR != raw_data_elem.VR:
         raise ValueError("Deferred read VR {0:s} does not match "
                          "original {1:s}".format(data_elem.VR,
@@ -1027,3 +2268,386 @@ def read_deferred_data_element(fileobj_type, filename_or_obj, timestamp,
 
     # Everything is ok, now this object should act like usual DataElement
     return data_elem
+
+
+def copy_deferred_data_element(fileobj_type, filename_or_obj, timestamp,
+                               raw_data_elem, fp):
+    """Copy the encoded deferred element from the original file to `fp`
+    without reading its value into memory.
+
+    .. versionadded:: 2.2
+
+    .. note:
+
+        This is called internally by pydicom and will normally not be
+        needed in user code.
+
+    The element's header and value are copied unchanged, so `fp` must use
+    the same encoding as the original file. If both files support
+    :meth:`~io.IOBase.fileno` and :func:`os.copy_file_range` is available
+    then the value is copied within the operating system, otherwise it's
+    copied in chunks.
+
+    Parameters
+    ----------
+    fileobj_type : type
+        The type of the original file object.
+    filename_or_obj : str or file-like
+        The filename of the original file if one exists, or the file-like
+        object where the data element persists.
+    timestamp : time or None
+        The time the original file has been read, if not a file-like.
+    raw_data_elem : dataelem.RawDataElement
+        The deferred raw data element, which must have a defined length.
+    fp : file-like
+        The file-like to copy the encoded element to.
+
+    Returns
+    -------
+    bool
+        ``True`` if the element was copied, ``False`` if the original file
+        ends before the end of the value, such as with a truncated file,
+        in which case nothing is written to `fp`.
+
+    Raises
+    ------
+    IOError
+        If `filename_or_obj` is ``None``.
+    IOError
+        If `filename_or_obj` is a filename and the corresponding file does
+        not exist.
+    ValueError
+        If the tag or VR of `raw_data_elem` does not match the original file.
+    """
+    logger.debug("Copying deferred element %r" % str(raw_data_elem.tag))
+    with _deferred_file(fileobj_type, filename_or_obj, timestamp) as src:
+        # Check the whole value is available before anything is written
+        end = raw_data_elem.value_tell + raw_data_elem.length
+        src.seek(0, 2)
+        if src.tell() < end:
+            return False
+
+        fp.write(_read_deferred_header(src, raw_data_elem))
+        _copy_file_range(
+            src, getattr(fp, 'parent', fp), raw_data_elem.value_tell,
+            raw_data_elem.length
+        )
+
+    return True
+
+
+def _read_deferred_header(fp, raw_data_elem):
+    """Return the encoded header of the deferred `raw_data_elem` read from
+    `fp`, leaving `fp` positioned at the start of the value.
+
+    Raises
+    ------
+    ValueError
+        If the tag or VR of `raw_data_elem` does not match the header.
+    """
+    is_implicit_VR = raw_data_elem.is_implicit_VR
+    endian_chr = "<" if raw_data_elem.is_little_endian else ">"
+    offset = data_element_offset_to_value(is_implicit_VR, raw_data_elem.VR)
+    fp.seek(raw_data_elem.value_tell - offset)
+    header = fp.read(offset)
+    tag = TupleTag(unpack_from(endian_chr + "HH", header))
+    if tag != raw_data_elem.tag:
+        raise ValueError(
+            "Deferred read tag {0!r} does not match "
+            "original {1!r}".format(tag, raw_data_elem.tag)
+        )
+    if not is_implicit_VR and header[4:6] != raw_data_elem.VR.encode():
+        raise ValueError(
+            "Deferred read VR {0!r} does not match "
+            "original {1:s}".format(header[4:6], raw_data_elem.VR)
+        )
+
+    return header
+
+
+# The size of the chunks used when copying without os.copy_file_range()
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _copy_file_range(src, dst, offset, length):
+    """Copy `length` bytes from `offset` in `src` to the current position
+    in `dst`, leaving `dst` positioned after the copied bytes.
+    """
+    try:
+        src_fd = src.fileno()
+        dst_fd = dst.fileno()
+    except (AttributeError, OSError, UnsupportedOperation):
+        src_fd = None
+
+    if src_fd is not None and hasattr(os, "copy_file_range"):
+        dst.flush()
+        position = dst.tell()
+        try:
+            while length:
+                nr_copied = os.copy_file_range(
+                    src_fd, dst_fd, length, offset, position
+                )
+                if not nr_copied:
+                    raise EOFError(
+                        "End of file reached while copying a deferred value"
+                    )
+
+                offset += nr_copied
+                position += nr_copied
+                length -= nr_copied
+        except OSError:
+            # Not supported for these files, copy the rest in chunks
+            pass
+        finally:
+            # Also updates the position of any buffered file object
+            dst.seek(position)
+
+    src.seek(offset)
+    while length:
+        chunk = src.read(min(length, _COPY_CHUNK_SIZE))
+        if not chunk:
+            raise EOFError(
+                "End of file reached while copying a deferred value"
+            )
+
+        dst.write(chunk)
+        length -= len(chunk)
+
+
+class ElementIndex(NamedTuple):
+    """The positions of the top-level elements in a DICOM file.
+
+    .. versionadded:: 2.2
+
+    Created by :func:`build_element_index` or :func:`read_element_index` and
+    used by :func:`dcmread` to seek directly to the wanted elements.
+    """
+    is_implicit_VR: bool
+    is_little_endian: bool
+    #: The size of the indexed file (in bytes)
+    file_size: int
+    #: The modification time of the indexed file (in nanoseconds)
+    mtime_ns: int
+    #: The ``(VR, length, value_tell)`` of each element, keyed by tag. The VR
+    #: is ``None`` for implicit VR datasets.
+    elements: Dict[BaseTag, Tuple[Optional[str], int, int]]
+
+
+# Index file header: identifier, is implicit VR, is little endian, reserved,
+#   file size, file modification time, number of elements
+_INDEX_HEADER = Struct("<8s??2xQqL")
+_INDEX_MAGIC = b"PYDCMIX1"
+# Index element entry: tag, VR, length, value tell
+_INDEX_ENTRY = Struct("<L2sLQ")
+
+
+def build_element_index(
+    path: Union[str, "os.PathLike[AnyStr]"],
+    index_path: Optional[Union[str, "os.PathLike[AnyStr]"]] = None
+) -> ElementIndex:
+    """Index the top-level elements in the DICOM file at `path`.
+
+    .. versionadded:: 2.2
+
+    The tag, VR, length and position of the value of each element in the
+    dataset are recorded and written to a binary sidecar file. Passing the
+    index to :func:`dcmread` along with `specific_tags` allows the wanted
+    elements to be read without scanning the file.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The path to the DICOM file to index.
+    index_path : str or PathLike, optional
+        The path to write the index to, default ``"<path>.idx"``.
+
+    Returns
+    -------
+    ElementIndex
+        The index of the file.
+
+    Raises
+    ------
+    ValueError
+        If the dataset uses the *Deflated Explicit VR Little Endian* transfer
+        syntax, as the positions of its elements can't be used for seeking.
+
+    See Also
+    --------
+    read_element_index
+
+    Examples
+    --------
+
+    >>> build_element_index("CT_small.dcm")
+    >>> ds = dcmread(
+    ...     "CT_small.dcm", specific_tags=["PatientName"],
+    ...     index="CT_small.dcm.idx"
+    ... )
+    """
+    path = path_from_pathlike(path)
+    if index_path is None:
+        index_path = f"{path}.idx"
+
+    # Defer all the values so only the element headers are read
+    ds = dcmread(path, defer_size=0, force=True)
+    if ds.file_meta.get("TransferSyntaxUID") == (
+        pydicom.uid.DeflatedExplicitVRLittleEndian
+    ):
+        raise ValueError(
+            "Unable to index a dataset using the 'Deflated Explicit VR Little "
+            "Endian' transfer syntax"
+        )
+
+    elements = {}
+    for tag, elem in ds._dict.items():
+        # Command Set elements are always read by read_partial()
+        if tag.group == 0:
+            continue
+
+        if isinstance(elem, RawDataElement):
+            elements[tag] = (elem.VR, elem.length, elem.value_tell)
+        else:
+            # An undefined length sequence, which is always parsed
+            elements[tag] = (elem.VR, 0xFFFFFFFF, elem.file_tell)
+
+    stat = os.stat(path)
+    index = ElementIndex(
+        ds.is_implicit_VR, ds.is_little_endian, stat.st_size, stat.st_mtime_ns,
+        elements
+    )
+
+    with open(index_path, "wb") as f:
+        f.write(
+            _INDEX_HEADER.pack(
+                _INDEX_MAGIC, index.is_implicit_VR, index.is_little_endian,
+                index.file_size, index.mtime_ns, len(elements)
+            )
+        )
+        f.write(
+            b"".join(
+                _INDEX_ENTRY.pack(
+                    tag, (VR or "").encode(default_encoding).ljust(2, b"\0"),
+                    length, value_tell
+                )
+                for tag, (VR, length, value_tell) in sorted(elements.items())
+            )
+        )
+
+    return index
+
+
+def read_element_index(
+    index_path: Union[str, "os.PathLike[AnyStr]"]
+) -> ElementIndex:
+    """Return the index written by :func:`build_element_index`.
+
+    .. versionadded:: 2.2
+
+    Parameters
+    ----------
+    index_path : str or PathLike
+        The path to the index sidecar file.
+
+    Returns
+    -------
+    ElementIndex
+        The index.
+
+    Raises
+    ------
+    ValueError
+        If the file isn't a valid index.
+    """
+    with open(path_from_pathlike(index_path), "rb") as f:
+        data = f.read()
+
+    if data[:8] != _INDEX_MAGIC or len(data) < _INDEX_HEADER.size:
+        raise ValueError(f"'{index_path}' is not a pydicom element index")
+
+    _, is_implicit_VR, is_little_endian, size, mtime_ns, nr_elements = (
+        _INDEX_HEADER.unpack_from(data)
+    )
+    if len(data) != _INDEX_HEADER.size + nr_elements * _INDEX_ENTRY.size:
+        raise ValueError(f"The element index '{index_path}' is truncated")
+
+    elements = {}
+    for tag, VR, length, value_tell in _INDEX_ENTRY.iter_unpack(
+        data[_INDEX_HEADER.size:]
+    ):
+        VR = VR.decode(default_encoding) if VR != b"\0\0" else None
+        elements[BaseTag(tag)] = (VR, length, value_tell)
+
+    return ElementIndex(
+        is_implicit_VR, is_little_endian, size, mtime_ns, elements
+    )
+
+
+def _read_indexed_dataset(fp, index, stop_when=None, defer_size=None,
+                          specific_tags=None, raw_sequences=False):
+    """Return a :class:`~pydicom.dataset.Dataset` containing the elements in
+    `index` read from `fp`.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like the index was built from.
+    index : ElementIndex
+        The index of the elements in `fp`.
+    stop_when : None, optional
+        See :func:`read_dataset` for parameter info.
+    defer_size : int, None, optional
+        See :func:`dcmread` for parameter info.
+    specific_tags : list or None
+        See :func:`dcmread` for parameter info.
+    raw_sequences : bool, optional
+        See :func:`dcmread` for parameter info.
+
+    Returns
+    -------
+    dataset.Dataset
+        The dataset containing the read elements.
+    """
+    is_implicit_VR = index.is_implicit_VR
+    is_little_endian = index.is_little_endian
+    tags = index.elements.keys()
+    if specific_tags:
+        tags = {Tag(tag) for tag in specific_tags} | {BaseTag(0x00080005)}
+        tags = tags.intersection(index.elements)
+
+    raw_data_elements = {}
+    encoding = default_encoding
+    try:
+        for tag in sorted(tags):
+            VR, length, value_tell = index.elements[tag]
+            offset = data_element_offset_to_value(is_implicit_VR, VR)
+            fp.seek(value_tell - offset)
+            elem_gen = data_element_generator(
+                fp, is_implicit_VR, is_little_endian, stop_when, defer_size,
+                encoding, raw_sequences=raw_sequences
+            )
+            raw_data_element = next(elem_gen, None)
+            if raw_data_element is None:
+                # Stopped by `stop_when`, so must be past all wanted elements
+                break
+
+            if raw_data_element.tag != tag:
+                raise ValueError(
+                    f"The element index doesn't match the file, expected "
+                    f"{tag} at offset {value_tell - offset} but found "
+                    f"{raw_data_element.tag}"
+                )
+
+            raw_data_elements[tag] = raw_data_element
+            if tag == 0x00080005:
+                char_set = DataElement_from_raw(raw_data_element).value
+                encoding = convert_encodings(char_set)
+    except EOFError as details:
+        if config.enforce_valid_values:
+            raise
+        msg = str(details) + " in file " + getattr(fp, "name", "<no filename>")
+        warnings.warn(msg, UserWarning)
+
+    ds = Dataset(raw_data_elements)
+    ds.set_original_encoding(is_implicit_VR, is_little_endian, encoding)
+    return ds
@@ -35,6 +35,10 @@ def absorb_delimiter_item(fp, is_little_endian, delimiter):
                      fp.tell() - 4, length)
 
 
+# The maximum number of bytes to read at a time when scanning for delimiters
+_MAX_READ_SIZE = 4 * 1024 * 1024
+
+
 def find_bytes(fp, bytes_to_find, read_size=128, rewind=True):
     """Read in the file until a specific byte sequence found.
 
@@ -45,7 +49,9 @@ def find_bytes(fp, bytes_to_find, read_size=128, rewind=True):
     bytes_to_find : str
         Contains the bytes to find. Must be in correct endian order already.
     read_size : int
-        Number of bytes to read at a time.
+        Number of bytes to read at first. The number read at a time is
+        doubled after each read, up to a maximum of 4 MiB, so that long
+        searches only take a few reads.
     rewind : bool
         Flag to rewind file reading position.
 
@@ -54,34 +60,22 @@ def find_bytes(fp, bytes_to_find, read_size=128, rewind=True):
     found_at : int or None
         Position where byte sequence was found, else ``None``.
     """
-
     data_start = fp.tell()
-    search_rewind = len(bytes_to_find) - 1
+    # Memory-mapped files can be searched without reading
+    find = getattr(fp, "find", None)
+    if find is not None:
+        found_at = find(bytes_to_find, data_start)
+        if found_at == -1:
+            found_at = None
+            fp.seek(0, os.SEEK_END)
+    else:
+        found_at = _scan_for_bytes(fp, bytes_to_find, read_size)
+
+    if found_at is None:
+        if rewind:
+            fp.seek(data_start)
+        return None
 
-    found = False
-    eof = False
-    while not found:
-        chunk_start = fp.tell()
-        bytes_read = fp.read(read_size)
-        if len(bytes_read) < read_size:
-            # try again - if still don't get required amount,
-            # this is the last block
-            new_bytes = fp.read(read_size - len(bytes_read))
-            bytes_read += new_bytes
-            if len(bytes_read) < read_size:
-                eof = True  # but will still check whatever we did get
-        index = bytes_read.find(bytes_to_find)
-        if index != -1:
-            found = True
-        elif eof:
-            if rewind:
-                fp.seek(data_start)
-            return None
-        else:
-            # rewind a bit in case delimiter crossed read_size boundary
-            fp.seek(fp.tell() - search_rewind)
-    # if get here then have found the byte string
-    found_at = chunk_start + index
     if rewind:
         fp.seek(data_start)
     else:
@@ -89,6 +83,66 @@ def find_bytes(fp, bytes_to_find, read_size=128, rewind=True):
     return found_at
 
 
+def _scan_for_bytes(fp, bytes_to_find, read_size, value=None,
+                    max_size=None):
+    """Read from `fp` until `bytes_to_find` is found.
+
+    Parameters
+    ----------
+    fp : file-like
+        The file-like to search, positioned at the start of the search.
+    bytes_to_find : bytes
+        The bytes to find.
+    read_size : int
+        The number of bytes to read at first, doubled after each read up to
+        a maximum of 4 MiB.
+    value : list, optional
+        If used then :class:`memoryview` instances of the bytes read before
+        `bytes_to_find` are appended to `value`.
+    max_size : int, optional
+        If used with `value` then `value` is cleared and no longer added to
+        once its total length is at least `max_size` bytes.
+
+    Returns
+    -------
+    int or None
+        The position of `bytes_to_find` in `fp` or ``None`` if the end of
+        the file was reached without finding it. The position of `fp` is
+        undefined afterwards.
+    """
+    search_rewind = len(bytes_to_find) - 1
+    read_size = max(read_size, len(bytes_to_find))
+    byte_count = 0
+    while True:
+        chunk_start = fp.tell()
+        chunk = fp.read(read_size)
+        while len(chunk) <= search_rewind:
+            # Too short to make progress, try again - if we don't get
+            # anything then this was the last block
+            new_bytes = fp.read(read_size)
+            if not new_bytes:
+                return None
+            chunk += new_bytes
+
+        index = chunk.find(bytes_to_find)
+        if index != -1:
+            if value is not None:
+                value.append(memoryview(chunk)[:index])
+            return chunk_start + index
+
+        # rewind a bit in case the bytes crossed the read boundary
+        fp.seek(chunk_start + len(chunk) - search_rewind)
+        if value is not None:
+            # accumulate the bytes read (not including the rewind)
+            value.append(memoryview(chunk)[:len(chunk) - search_rewind])
+            byte_count += len(chunk) - search_rewind
+            if max_size is not None and byte_count >= max_size:
+                value.clear()
+                value = None
+
+        read_size = min(2 * read_size, _MAX_READ_SIZE)
+
+
 def read_undefined_length_value(fp,
                                 is_little_endian,
                                 delimiter_tag,
@@ -111,12 +165,14 @@ def read_undefined_length_value(fp,
         Size to avoid loading large elements in memory. See
         :func:`~pydicom.filereader.dcmread` for more parameter info.
     read_size : int, optional
-        Number of bytes to read at one time.
+        Number of bytes to read at first when scanning for the delimiter,
+        see :func:`find_bytes`.
 
     Returns
     -------
-    delimiter : str or None
-        The file delimiter.
+    bytes or None
+        The value up to the delimiter or ``None`` if the value is larger
+        than `defer_size`.
 
     Raises
     ------
@@ -146,58 +202,50 @@ def read_undefined_length_value(fp,
         if was_value_found:
             return value
 
-    search_rewind = 3
-
     if is_little_endian:
         bytes_format = b"<HH"
     else:
         bytes_format = b">HH"
     bytes_to_find = pack(bytes_format, delimiter_tag.group, delimiter_tag.elem)
 
-    found = False
-    eof = False
-    value_chunks = []
-    byte_count = 0  # for defer_size checks
-    while not found:
-        chunk_start = fp.tell()
-        bytes_read = fp.read(read_size)
-        if len(bytes_read) < read_size:
-            # try again - if still don't get required amount,
-            # this is the last block
-            new_bytes = fp.read(read_size - len(bytes_read))
-            bytes_read += new_bytes
-            if len(bytes_read) < read_size:
-                eof = True  # but will still check whatever we did get
-        index = bytes_read.find(bytes_to_find)
-        if index != -1:
-            found = True
-            new_bytes = bytes_read[:index]
-            byte_count += len(new_bytes)
-            if defer_size is None or byte_count < defer_size:
-                value_chunks.append(new_bytes)
-            fp.seek(chunk_start + index + 4)  # rewind to end of delimiter
-            length = fp.read(4)
-            if length != b"\0\0\0\0":
-                msg = ("Expected 4 zero bytes after undefined length delimiter"
-                       " at pos {0:04x}")
-                logger.error(msg.format(fp.tell() - 4))
-        elif eof:
-            fp.seek(data_start)
-            raise EOFError("End of file reached before delimiter {0!r} found".
-                           format(delimiter_tag))
-        else:
-            # rewind a bit in case delimiter crossed read_size boundary
-            fp.seek(fp.tell() - search_rewind)
-            # accumulate the bytes read (not including the rewind)
-            new_bytes = bytes_read[:-search_rewind]
-            byte_count += len(new_bytes)
-            if defer_size is None or byte_count < defer_size:
-                value_chunks.append(new_bytes)
-    # if get here then have found the byte string
+    find = getattr(fp, "find", None)
+    if find is not None:
+        # Memory-mapped files can be searched without reading
+        found_at = find(bytes_to_find, data_start)
+        if found_at == -1:
+            found_at = None
+        value = None
+    else:
+        # Accumulate the value while searching unless it will be deferred
+        value = []
+        found_at = _scan_for_bytes(
+            fp, bytes_to_find, read_size, value, defer_size
+        )
+
+    if found_at is None:
+        fp.seek(data_start)
+        raise EOFError("End of file reached before delimiter {0!r} found".
+                       format(delimiter_tag))
+
+    fp.seek(found_at + 4)  # rewind to end of delimiter
+    length = fp.read(4)
+    if length != b"\0\0\0\0":
+        msg = ("Expected 4 zero bytes after undefined length delimiter"
+               " at pos {0:04x}")
+        logger.error(msg.format(fp.tell() - 4))
+
+    byte_count = found_at - data_start
     if defer_size is not None and byte_count >= defer_size:
         return None
-    else:
-        return b"".join(value_chunks)
+
+    if value is None:
+        position = fp.tell()
+        fp.seek(data_start)
+        value = fp.read(byte_count)
+        fp.seek(position)
+        return value
+
+    return b"".join(value)
 
 
 def _try_read_encapsulated_pixel_data(fp, is_little_endian, defer_size=None):
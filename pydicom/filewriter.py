@@ -3,29 +3,37 @@
 
 import os
 from struct import pack
-from typing import Union, BinaryIO, AnyStr
+from typing import (
+    Union, BinaryIO, AnyStr, Dict, Any, Iterable, Optional, List
+)
 import warnings
 import zlib
 
 from pydicom.charset import (
     default_encoding, text_VRs, convert_encodings, encode_string
 )
+from pydicom import config
 from pydicom.config import have_numpy
-from pydicom.dataelem import DataElement_from_raw
+from pydicom.datadict import dictionary_VR
+from pydicom.dataelem import DataElement, DataElement_from_raw, RawDataElement
 from pydicom.dataset import Dataset, validate_file_meta
 from pydicom.filebase import DicomFile, DicomFileLike, DicomBytesIO
+from pydicom.filereader import copy_deferred_data_element, dcmread
 from pydicom.fileutil import path_from_pathlike
 from pydicom.multival import MultiValue
 from pydicom.tag import (Tag, ItemTag, ItemDelimiterTag, SequenceDelimiterTag,
-                         tag_in_exception)
+                         tag_in_exception, TagType)
 from pydicom.uid import DeflatedExplicitVRLittleEndian
 from pydicom.valuerep import extra_length_VRs
-from pydicom.values import convert_numbers
+from pydicom.values import convert_numbers, _NUMPY_FORMATS
 
 
 if have_numpy:
     import numpy
 
+# The types of already converted integer values
+_INT_TYPES = (int, numpy.integer) if have_numpy else (int, )
+
 
 def _correct_ambiguous_vr_element(elem, ds, is_little_endian):
     """Implementation for `correct_ambiguous_vr_element`.
@@ -92,7 +100,7 @@ def _correct_ambiguous_vr_element(elem, ds, is_little_endian):
 
         # Need to handle type check for elements with VM > 1
         elem_value = elem.value if elem.VM == 1 else elem.value[0]
-        if not isinstance(elem_value, int):
+        if not isinstance(elem_value, _INT_TYPES):
             elem.value = convert_numbers(
                 elem.value, is_little_endian, byte_type
             )
@@ -122,7 +130,7 @@ def _correct_ambiguous_vr_element(elem, ds, is_little_endian):
                 return elem
 
             elem_value = elem.value if elem.VM == 1 else elem.value[0]
-            if not isinstance(elem_value, int):
+            if not isinstance(elem_value, _INT_TYPES):
                 elem.value = convert_numbers(elem.value, is_little_endian, 'H')
         else:
             elem.VR = 'OW'
@@ -232,6 +240,13 @@ def write_numbers(fp, data_element, struct_format):
     """
     endianChar = '><' [fp.is_little_endian]
     value = data_element.value
+    if have_numpy and isinstance(value, numpy.ndarray):
+        # Write the array's buffer directly, only copying if the dtype
+        #   doesn't match the encoding
+        dtype = endianChar + _NUMPY_FORMATS[struct_format]
+        fp.write(value.astype(dtype, copy=False).tobytes())
+        return
+
     if value == "":
         return  # don't need to write anything for empty string
 
@@ -453,6 +468,29 @@ def write_TM(fp, data_element):
         fp.write(val)
 
 
+def _write_value(fp, data_element, encodings=None):
+    """Write the encoded value of the converted `data_element` to `fp`."""
+    VR = data_element.VR
+    if VR not in writers:
+        raise NotImplementedError(
+            f"write_data_element: unknown Value Representation '{VR}'"
+        )
+
+    encodings = encodings or [default_encoding]
+    encodings = convert_encodings(encodings)
+    writer_function, writer_param = writers[VR]
+    if not data_element.is_empty:
+        if VR in text_VRs or VR in ('PN', 'SQ'):
+            writer_function(fp, data_element, encodings=encodings)
+        else:
+            # Many numeric types use the same writer but with
+            # numeric format parameter
+            if writer_param is not None:
+                writer_function(fp, data_element, writer_param)
+            else:
+                writer_function(fp, data_element)
+
+
 def write_data_element(fp, data_element, encodings=None):
     """Write the data_element to file fp according to
     dicom media storage rules.
@@ -460,11 +498,6 @@ def write_data_element(fp, data_element, encodings=None):
     # Write element's tag
     fp.write_tag(data_element.tag)
 
-    # write into a buffer to avoid seeking back which can be expansive
-    buffer = DicomBytesIO()
-    buffer.is_little_endian = fp.is_little_endian
-    buffer.is_implicit_VR = fp.is_implicit_VR
-
     VR = data_element.VR
     if not fp.is_implicit_VR and len(VR) != 2:
         msg = (
@@ -474,30 +507,28 @@ def write_data_element(fp, data_element, encodings=None):
         )
         raise ValueError(msg)
 
+    value = data_element.value
+    items = None
     if data_element.is_raw:
         # raw data element values can be written as they are
-        buffer.write(data_element.value)
         is_undefined_length = data_element.length == 0xFFFFFFFF
     else:
-        if VR not in writers:
-            raise NotImplementedError(
-                f"write_data_element: unknown Value Representation '{VR}'"
-            )
-
-        encodings = encodings or [default_encoding]
-        encodings = convert_encodings(encodings)
-        writer_function, writer_param = writers[VR]
         is_undefined_length = data_element.is_undefined_length
-        if not data_element.is_empty:
-            if VR in text_VRs or VR in ('PN', 'SQ'):
-                writer_function(buffer, data_element, encodings=encodings)
-            else:
-                # Many numeric types use the same writer but with
-                # numeric format parameter
-                if writer_param is not None:
-                    writer_function(buffer, data_element, writer_param)
-                else:
-                    writer_function(buffer, data_element)
+        if VR == 'SQ' and is_undefined_length:
+            # the sequence length isn't needed, so write each item once it's
+            #   been encoded rather than encoding the whole sequence first
+            items, value = value, b''
+        elif (
+            VR not in _DIRECT_WRITE_VRS
+            or not isinstance(value, (bytes, bytearray, memoryview))
+        ):
+            # write into a buffer to avoid seeking back which can be expansive
+            buffer = DicomBytesIO()
+            buffer.is_little_endian = fp.is_little_endian
+            buffer.is_implicit_VR = fp.is_implicit_VR
+            _write_value(buffer, data_element, encodings)
+            # use a view of the buffer rather than a copy
+            value = buffer.parent.getbuffer()
 
     # valid pixel data with undefined length shall contain encapsulated
     # data, e.g. sequence items - raise ValueError otherwise (see #238)
@@ -506,7 +537,7 @@ def write_data_element(fp, data_element, encodings=None):
         if not fp.is_little_endian:
             # Non-conformant endianness
             encap_item = b'\xff\xfe\xe0\x00'
-        if not data_element.value.startswith(encap_item):
+        if data_element.value[:4] != encap_item:
             raise ValueError(
                 "(7FE0,0010) Pixel Data has an undefined length indicating "
                 "that it's compressed, but the data isn't encapsulated as "
@@ -514,7 +545,12 @@ def write_data_element(fp, data_element, encodings=None):
                 "information"
             )
 
-    value_length = buffer.tell()
+    # bytes-like values are written directly, without copying them first
+    if isinstance(value, memoryview):
+        value_length = value.nbytes
+    else:
+        value_length = len(value)
+
     if (not fp.is_implicit_VR and VR not in extra_length_VRs and
             not is_undefined_length and value_length > 0xffff):
         # see PS 3.5, section 6.2.2 for handling of this case
@@ -542,7 +578,17 @@ def write_data_element(fp, data_element, encodings=None):
         # unless is SQ with undefined length.
         fp.write_UL(0xFFFFFFFF if is_undefined_length else value_length)
 
-    fp.write(buffer.getvalue())
+    if items is not None:
+        encodings = convert_encodings(encodings or [default_encoding])
+        for item in items:
+            buffer = DicomBytesIO()
+            buffer.is_little_endian = fp.is_little_endian
+            buffer.is_implicit_VR = fp.is_implicit_VR
+            write_sequence_item(buffer, item, encodings)
+            fp.write(buffer.parent.getbuffer())
+    else:
+        fp.write(value)
+
     if is_undefined_length:
         fp.write_tag(SequenceDelimiterTag)
         fp.write_UL(0)  # 4-byte 'length' of delimiter data item
@@ -567,18 +613,46 @@ def write_dataset(fp, dataset, parent_encoding=default_encoding):
 
     fpStart = fp.tell()
     # data_elements must be written in tag order
-    tags = sorted(dataset.keys())
-
-    for tag in tags:
+    for tag in dataset._sorted_tags():
         # do not write retired Group Length (see PS3.5, 7.2)
         if tag.element == 0 and tag.group > 6:
             continue
+        # use the element directly rather than through get_item(), which
+        #   copies any elements shared with a copy-on-write clone
+        elem = dataset._dict[tag]
         with tag_in_exception(tag):
-            write_data_element(fp, dataset.get_item(tag), dataset_encoding)
+            if elem.is_raw and elem.value is None:
+                # copy the encoded element from the original file
+                #   rather than reading the value into memory
+                if (
+                    elem.length != 0
+                    and _is_copyable(dataset, elem, fp)
+                    and copy_deferred_data_element(
+                        dataset.fileobj_type, dataset.filename,
+                        dataset.timestamp, elem, fp
+                    )
+                ):
+                    continue
+
+                elem = dataset.get_item(tag)
+
+            write_data_element(fp, elem, dataset_encoding)
 
     return fp.tell() - fpStart
 
 
+def _is_copyable(dataset, raw_elem, fp):
+    """Return ``True`` if the deferred `raw_elem` can be copied unchanged
+    from the file `dataset` was read from to `fp`.
+    """
+    return (
+        raw_elem.length != 0xFFFFFFFF
+        and raw_elem.is_implicit_VR == fp.is_implicit_VR
+        and raw_elem.is_little_endian == fp.is_little_endian
+        and getattr(dataset, 'filename', None) is not None
+    )
+
+
 def _harmonize_properties(dataset, fp):
     """Make sure the properties in the dataset and the file pointer are
     consistent, so the user can set both with the same effect.
@@ -761,6 +835,80 @@ def write_file_meta_info(fp, file_meta, enforce_standard=True):
     fp.write(buffer.getvalue())
 
 
+class _DeflatedFileLike:
+    """A write-only file-like that deflates the data written to it.
+
+    Used for datasets with the *Deflated Explicit VR Little Endian* transfer
+    syntax so the encoded dataset is compressed as it's written rather than
+    being encoded in memory first. Small writes are buffered so they're
+    compressed in larger chunks.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, fp: BinaryIO, level: int = -1) -> None:
+        """Create a new file-like.
+
+        Parameters
+        ----------
+        fp : file-like
+            The file-like to write the deflated data to.
+        level : int, optional
+            The :mod:`zlib` compression level, from ``0`` (no compression) to
+            ``9`` (most compression), or ``-1`` for the default.
+        """
+        self._fp = fp
+        # -MAX_WBITS for a raw deflate stream without header or checksum
+        self._compressor = zlib.compressobj(level, wbits=-zlib.MAX_WBITS)
+        self._buffer = bytearray()
+        self._position = 0
+        self._deflated_length = 0
+
+    def _write_deflated(self, data: bytes) -> None:
+        """Compress `data` and write any output to the deflated file-like."""
+        deflated = self._compressor.compress(data)
+        if deflated:
+            self._fp.write(deflated)
+            self._deflated_length += len(deflated)
+
+    def write(self, data: bytes) -> int:
+        """Write `data` and return the number of bytes written."""
+        length = memoryview(data).nbytes
+        buffer = self._buffer
+        if length >= self.chunk_size:
+            # compress large values directly rather than copying them
+            if buffer:
+                self._write_deflated(buffer)
+                buffer.clear()
+
+            self._write_deflated(data)
+        else:
+            buffer += data
+            if len(buffer) >= self.chunk_size:
+                self._write_deflated(buffer)
+                buffer.clear()
+
+        self._position += length
+        return length
+
+    def tell(self) -> int:
+        """Return the position in the uncompressed data."""
+        return self._position
+
+    def close(self) -> None:
+        """Write the remaining deflated data, padded to an even length. The
+        deflated file-like isn't closed.
+        """
+        self._write_deflated(self._buffer)
+        self._buffer.clear()
+        deflated = self._compressor.flush()
+        self._deflated_length += len(deflated)
+        if self._deflated_length % 2:
+            deflated += b'\x00'
+            self._deflated_length += 1
+
+        self._fp.write(deflated)
+
+
 def _write_dataset(fp, dataset, write_like_original):
     """Write the Data Set to a file-like. Assumes the file meta information,
     if any, has been written.
@@ -955,7 +1103,13 @@ def dcmwrite(
     try:
         tsyntax = dataset.file_meta.TransferSyntaxUID
         if not tsyntax.is_private:
-            dataset['PixelData'].is_undefined_length = tsyntax.is_compressed
+            # avoid converting (and reading the deferred value of) raw
+            #   pixel data that already has the correct type of length
+            elem = dataset._dict[0x7fe00010]
+            is_undefined_length = elem.is_raw and elem.length == 0xFFFFFFFF
+            if not elem.is_raw or is_undefined_length != tsyntax.is_compressed:
+                elem = dataset['PixelData']
+                elem.is_undefined_length = tsyntax.is_compressed
     except (AttributeError, KeyError):
         pass
 
@@ -1031,20 +1185,13 @@ def dcmwrite(
 
         if (tsyntax == DeflatedExplicitVRLittleEndian):
             # See PS3.5 section A.5
-            # when writing, the entire dataset following
-            #     the file metadata is prepared the normal way,
-            #     then "deflate" compression applied.
-            buffer = DicomBytesIO()
-            _write_dataset(buffer, dataset, write_like_original)
-
-            # Compress the encoded data and write to file
-            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
-            deflated = compressor.compress(buffer.parent.getvalue())
-            deflated += compressor.flush()
-            if len(deflated) % 2:
-                deflated += b'\x00'
-
-            fp.write(deflated)
+            # The dataset following the file metadata is compressed
+            #     with "deflate" as it's written
+            deflater = _DeflatedFileLike(fp, config.deflate_level)
+            _write_dataset(
+                DicomFileLike(deflater), dataset, write_like_original
+            )
+            deflater.close()
         else:
             _write_dataset(fp, dataset, write_like_original)
 
@@ -1055,6 +1202,311 @@ def dcmwrite(
 
 write_file = dcmwrite  # write_file before pydicom 1.0, kept for compatibility
 
+
+def patch_in_place(
+    filename: Union[str, "os.PathLike[AnyStr]"],
+    elements: Dict[TagType, Any]
+) -> None:
+    """Overwrite the values of existing elements in the DICOM file at
+    `filename` without rewriting the rest of the file.
+
+    .. versionadded:: 2.2
+
+    Only the headers of the top-level elements are read to find the
+    position of each value, and only the new values are written. Each new
+    value must encode to no more than the length of the existing value;
+    shorter string values are padded to the original length with trailing
+    spaces (or nulls for **UI**), while other values must have exactly the
+    same encoded length. No changes are made to the file unless all the
+    values can be written.
+
+    Parameters
+    ----------
+    filename : str or PathLike
+        The path to the DICOM file to modify.
+    elements : dict
+        The new values, keyed by the tag or keyword of the element to
+        change, e.g. ``{"PatientID": "Anonymous"}``.
+
+    Raises
+    ------
+    KeyError
+        If an element isn't in the top-level of the dataset.
+    ValueError
+        If an element is a sequence or has an undefined length, if its new
+        value doesn't fit the length of the existing value, or if the
+        dataset uses the *Deflated Explicit VR Little Endian* transfer
+        syntax.
+
+    Examples
+    --------
+
+    >>> patch_in_place("CT_small.dcm", {"PatientID": "12345678"})
+    """
+    filename = path_from_pathlike(filename)
+    # Defer all the values so only the element headers are read
+    ds = dcmread(filename, defer_size=0, force=True, raw_sequences=True)
+    if ds.file_meta.get("TransferSyntaxUID") == (
+        DeflatedExplicitVRLittleEndian
+    ):
+        raise ValueError(
+            "Unable to patch a dataset using the 'Deflated Explicit VR Little "
+            "Endian' transfer syntax"
+        )
+
+    patches = []
+    for key, value in elements.items():
+        tag = Tag(key)
+        raw = ds._dict.get(tag)
+        if raw is None or tag.group == 0x0002:
+            raise KeyError(f"{tag} is not in the dataset")
+
+        # raw elements read with implicit VR have no VR
+        VR = getattr(raw, 'VR', None)
+        if VR is None:
+            try:
+                VR = dictionary_VR(tag)
+            except KeyError:
+                VR = 'UN'
+
+        if (
+            not isinstance(raw, RawDataElement)
+            or VR == 'SQ'
+            or raw.length == 0xFFFFFFFF
+        ):
+            raise ValueError(
+                f"Unable to patch the element with tag {tag} as it's a "
+                "sequence or has an undefined length"
+            )
+
+        elem = DataElement(tag, VR, value)
+        elem = correct_ambiguous_vr_element(elem, ds, ds.is_little_endian)
+        buffer = DicomBytesIO()
+        buffer.is_little_endian = ds.is_little_endian
+        buffer.is_implicit_VR = ds.is_implicit_VR
+        _write_value(buffer, elem, ds._character_set)
+        encoded = buffer.getvalue()
+        if len(encoded) < raw.length and elem.VR in _PADDED_VRS:
+            padding = b'\x00' if elem.VR == 'UI' else b' '
+            encoded += padding * (raw.length - len(encoded))
+
+        if len(encoded) != raw.length:
+            raise ValueError(
+                f"Unable to patch the element with tag {tag} as its new "
+                f"value has an encoded length of {len(encoded)} bytes and "
+                f"the existing value is {raw.length} bytes long"
+            )
+
+        patches.append((raw.value_tell, encoded))
+
+    with open(filename, 'r+b') as f:
+        for offset, encoded in patches:
+            f.seek(offset)
+            f.write(encoded)
+
+
+class EncapsulatedFrameWriter:
+    """Write a dataset with encapsulated *Pixel Data* one frame at a time.
+
+    .. versionadded:: 2.2
+
+    The preamble, *File Meta Information* and the elements before *Pixel
+    Data* are written when the writer is created. Each frame passed to
+    :meth:`write_frame` is then written as a single item of the encapsulated
+    *Pixel Data*, so only one frame needs to be in memory at a time. When
+    the writer is closed the offsets of the frames are written to the Basic
+    Offset Table, or to the *Extended Offset Table* and *Extended Offset
+    Table Lengths* elements, followed by any elements after *Pixel Data*.
+
+    Examples
+    --------
+
+    >>> ds.NumberOfFrames = 1000
+    >>> with EncapsulatedFrameWriter("out.dcm", ds) as writer:
+    ...     writer.write_frames(encode(frame) for frame in frames)
+    """
+    def __init__(
+        self,
+        filename: Union[str, "os.PathLike[AnyStr]", BinaryIO],
+        dataset: Dataset,
+        nr_frames: Optional[int] = None,
+        extended_offset_table: bool = False,
+        write_like_original: bool = True
+    ) -> None:
+        """Create a new writer and write the elements before *Pixel Data*.
+
+        Parameters
+        ----------
+        filename : str, PathLike or file-like
+            The path to write to, or a seekable file-like opened for writing.
+        dataset : pydicom.dataset.Dataset
+            The dataset to write, with a compressed *Transfer Syntax UID* in
+            its *File Meta Information*. Any *Pixel Data*, *Extended Offset
+            Table* and *Extended Offset Table Lengths* elements in the
+            dataset are ignored.
+        nr_frames : int, optional
+            The number of frames that will be written, default the value of
+            *Number of Frames* in `dataset` or ``1`` if it's absent.
+        extended_offset_table : bool, optional
+            If ``True`` then write the frame offsets to the *Extended Offset
+            Table* and leave the Basic Offset Table empty, which is required
+            if the total length of the frames may exceed 2**32 - 1 bytes.
+            Default ``False``.
+        write_like_original : bool, optional
+            Passed to :func:`dcmwrite` when writing the elements before
+            *Pixel Data*, default ``True``.
+        """
+        file_meta = getattr(dataset, 'file_meta', Dataset())
+        tsyntax = file_meta.get('TransferSyntaxUID')
+        if tsyntax is None or not tsyntax.is_compressed:
+            raise ValueError(
+                "Unable to write encapsulated frames unless the dataset has a "
+                "compressed 'Transfer Syntax UID'"
+            )
+
+        if nr_frames is None:
+            nr_frames = int(dataset.get("NumberOfFrames", 1))
+
+        self.nr_frames = nr_frames
+        self.extended_offset_table = extended_offset_table
+        self._dataset = dataset
+        self._offsets: List[int] = []
+        self._lengths: List[int] = []
+        self._frames_length = 0
+
+        filename = path_from_pathlike(filename)
+        self._owns_file = isinstance(filename, str)
+        f = open(filename, 'wb') if self._owns_file else filename
+        try:
+            header = dataset[:0x7FE00001]
+            header.file_meta = dataset.file_meta
+            header.preamble = getattr(dataset, 'preamble', None)
+            dcmwrite(f, header, write_like_original)
+
+            self._fp = fp = DicomFileLike(f)
+            fp.is_little_endian = True
+            fp.is_implicit_VR = False
+            if extended_offset_table:
+                # Reserve the values of the Extended Offset Table elements
+                self._eot_tell = []
+                for tag in (0x7FE00001, 0x7FE00002):
+                    fp.write_tag(tag)
+                    fp.write(b'OV\x00\x00')
+                    fp.write_UL(8 * nr_frames)
+                    self._eot_tell.append(fp.tell())
+                    fp.write(b'\x00' * 8 * nr_frames)
+
+            # Pixel Data header with an undefined length
+            fp.write_tag(0x7FE00010)
+            fp.write(b'OB\x00\x00')
+            fp.write_UL(0xFFFFFFFF)
+            # Basic Offset Table item, reserving space for the offsets
+            fp.write_tag(ItemTag)
+            bot_length = 0 if extended_offset_table else 4 * nr_frames
+            fp.write_UL(bot_length)
+            self._bot_tell = fp.tell()
+            fp.write(b'\x00' * bot_length)
+        except Exception:
+            if self._owns_file:
+                f.close()
+
+            raise
+
+        self._file = f
+        self._closed = False
+
+    def write_frame(self, frame: bytes) -> None:
+        """Write the encoded `frame` as the next item of the *Pixel Data*.
+
+        Parameters
+        ----------
+        frame : bytes-like
+            The encoded frame data.
+        """
+        if len(self._offsets) == self.nr_frames:
+            raise ValueError(
+                f"Unable to write more than the expected {self.nr_frames} "
+                "frames"
+            )
+
+        offset = self._frames_length
+        if not self.extended_offset_table and offset > 0xFFFFFFFF:
+            raise ValueError(
+                f"The total length of the encapsulated frame data ({offset} "
+                "bytes) will be greater than the maximum allowed by the Basic "
+                f"Offset Table ({2**32 - 1} bytes), it's recommended that you "
+                "use the Extended Offset Table instead"
+            )
+
+        length = memoryview(frame).nbytes
+        self._fp.write_tag(ItemTag)
+        # Each item shall be an even number of bytes
+        self._fp.write_UL(length + length % 2)
+        self._fp.write(frame)
+        if length % 2:
+            self._fp.write(b'\x00')
+
+        self._offsets.append(offset)
+        self._lengths.append(length)
+        self._frames_length += 8 + length + length % 2
+
+    def write_frames(self, frames: Iterable[bytes]) -> None:
+        """Write each of the encoded `frames`, such as from a generator.
+
+        Parameters
+        ----------
+        frames : iterable of bytes-like
+            The encoded frame data.
+        """
+        for frame in frames:
+            self.write_frame(frame)
+
+    def close(self) -> None:
+        """Write the frame offsets and any elements after *Pixel Data*, then
+        close the file if it was opened by the writer.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        try:
+            if len(self._offsets) != self.nr_frames:
+                raise ValueError(
+                    f"Only {len(self._offsets)} of the expected "
+                    f"{self.nr_frames} frames have been written"
+                )
+
+            fp = self._fp
+            fp.write_tag(SequenceDelimiterTag)
+            fp.write_UL(0)
+            write_dataset(fp, self._dataset[0x7FE00011:])
+
+            end = fp.tell()
+            if self.extended_offset_table:
+                values = (self._offsets, self._lengths)
+                for tell, value in zip(self._eot_tell, values):
+                    fp.seek(tell)
+                    fp.write(pack(f"<{self.nr_frames}Q", *value))
+            else:
+                fp.seek(self._bot_tell)
+                fp.write(pack(f"<{self.nr_frames}L", *self._offsets))
+
+            fp.seek(end)
+        finally:
+            if self._owns_file:
+                self._file.close()
+
+    def __enter__(self) -> "EncapsulatedFrameWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        elif self._owns_file:
+            self._closed = True
+            self._file.close()
+
+
 # Map each VR to a function which can write it
 # for write_numbers, the Writer maps to a tuple (function, struct_format)
 #   (struct_format is python's struct module format)
@@ -1101,3 +1553,18 @@ writers = {
     'OB or OW': (write_OBvalue, None),
     'OW or OB': (write_OBvalue, None),
 }  # note OW/OB depends on other items, which we don't know at write time
+
+# The VRs whose values may be padded with trailing spaces (or nulls)
+_PADDED_VRS = {
+    VR for VR, (writer, _) in writers.items()
+    if writer in (
+        write_string, write_text, write_PN, write_UI, write_number_string,
+        write_DA, write_DT, write_TM
+    )
+}
+
+# The VRs whose bytes-like values are written unchanged
+_DIRECT_WRITE_VRS = {
+    VR for VR, (writer, _) in writers.items()
+    if writer in (write_OBvalue, write_OWvalue, write_UN)
+}
@@ -13,6 +13,7 @@ from pydicom.dataelem import (
     DataElement,
     RawDataElement,
     DataElement_from_raw,
+    HAVE_PICKLE_BUFFER,
 )
 from pydicom.dataset import Dataset
 from pydicom.errors import BytesLengthException
@@ -552,10 +553,96 @@ class TestDataElement:
         elem = DataElement(0x00080010, 'UN', None)
         assert not elem.is_private
 
+    def test_slots(self):
+        """Test the element attributes are stored in slots."""
+        elem = DataElement(0x00100010, 'PN', 'CITIZEN^Jan')
+        assert 'tag' in DataElement.__slots__
+        assert {} == elem.__dict__
+
+        # Other attributes can still be set on an instance
+        elem.showVR = False
+        assert {'showVR': False} == elem.__dict__
+        assert "(0010, 0010) Patient's Name" in str(elem)
+        assert 'PN' not in str(elem)
+        assert DataElement.showVR
+
+    def test_pickle(self):
+        """Test pickling and copying an element."""
+        import copy
+        import pickle
+
+        elem = DataElement(0x00100010, 'PN', 'CITIZEN^Jan', 128, True)
+        elem.private_creator = 'ACME'
+        elem.showVR = False
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(elem, protocol))
+            assert elem == unpickled
+            assert 128 == unpickled.file_tell
+            assert unpickled.is_undefined_length
+            assert 'ACME' == unpickled.private_creator
+            assert unpickled.parent is None
+            assert not unpickled.showVR
+
+        elem_copy = copy.deepcopy(elem)
+        assert elem == elem_copy
+        assert 128 == elem_copy.file_tell
+        assert not elem_copy.showVR
+
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_pickle_out_of_band(self):
+        """Test large binary values are pickled out-of-band."""
+        import pickle
+
+        elem = DataElement(0x7FE00010, 'OB', b'\x00\x01' * 1024)
+        buffers = []
+        s = pickle.dumps(elem, protocol=5, buffer_callback=buffers.append)
+        assert 1 == len(buffers)
+        unpickled = pickle.loads(s, buffers=buffers)
+        assert isinstance(unpickled.value, memoryview)
+        assert elem.value == unpickled.value
+        unpickled = pickle.loads(pickle.dumps(elem, protocol=5))
+        assert elem.value == unpickled.value
+        assert isinstance(unpickled.value, bytes)
+
+        # Small values and non-binary VRs are pickled in-band
+        for elem in (
+            DataElement(0x00020001, 'OB', b'\x00\x01'),
+            DataElement(0x00100010, 'PN', 'A' * 2048),
+        ):
+            buffers = []
+            s = pickle.dumps(elem, protocol=5, buffer_callback=buffers.append)
+            assert [] == buffers
+            assert elem == pickle.loads(s)
+
 
 class TestRawDataElement:
 
     """Tests for dataelem.RawDataElement."""
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_pickle_out_of_band(self):
+        """Test large binary values are pickled out-of-band."""
+        import pickle
+
+        value = b'\x00\x01' * 1024
+        # Implicit VR uses the dictionary VR
+        raw = RawDataElement(
+            Tag(0x7FE00010), None, len(value), value, 0, True, True
+        )
+        buffers = []
+        s = pickle.dumps(raw, protocol=5, buffer_callback=buffers.append)
+        assert 1 == len(buffers)
+        unpickled = pickle.loads(s, buffers=buffers)
+        assert isinstance(unpickled, RawDataElement)
+        assert isinstance(unpickled.value, memoryview)
+        assert raw == unpickled._replace(value=bytes(unpickled.value))
+
+        raw = raw._replace(tag=Tag(0x00100010), VR='PN')
+        buffers = []
+        s = pickle.dumps(raw, protocol=5, buffer_callback=buffers.append)
+        assert [] == buffers
+        assert raw == pickle.loads(s)
+        assert raw == pickle.loads(pickle.dumps(raw))
+
     def test_invalid_tag_warning(self, allow_invalid_values):
         """RawDataElement: conversion of unknown tag warns..."""
         raw = RawDataElement(Tag(0x88880088), None, 4, b'unknown',
@@ -2,7 +2,9 @@
 """Unit tests for the pydicom.dataset module."""
 
 import copy
+import os
 import pickle
+from struct import pack
 import weakref
 
 import pytest
@@ -11,7 +13,9 @@ import pydicom
 from pydicom import config
 from pydicom import dcmread
 from pydicom.data import get_testdata_file
-from pydicom.dataelem import DataElement, RawDataElement
+from pydicom.dataelem import (
+    DataElement, RawDataElement, HAVE_PICKLE_BUFFER
+)
 from pydicom.dataset import (
     Dataset, FileDataset, validate_file_meta, FileMetaDataset
 )
@@ -23,6 +27,7 @@ from pydicom.sequence import Sequence
 from pydicom.tag import Tag
 from pydicom.uid import (
     ImplicitVRLittleEndian,
+    ExplicitVRLittleEndian,
     ExplicitVRBigEndian,
     JPEGBaseline8Bit,
     PYDICOM_IMPLEMENTATION_UID
@@ -265,6 +270,282 @@ class TestDataset:
         with pytest.raises(KeyError):
             self.ds.popitem()
 
+    def test_sorted_tags(self):
+        """Test the sorted tags are kept up to date."""
+        ds = Dataset()
+        ds.PatientName = 'CITIZEN^Jan'
+        ds.CommandGroupLength = 100
+        tags = ds._sorted_tags()
+        assert [0x00000000, 0x00100010] == tags
+        assert tags is ds._sorted_tags()
+
+        # Replacing an element keeps the order
+        ds.PatientName = 'CITIZEN^Jane'
+        assert tags is ds._sorted_tags()
+
+        ds.add_new(0x00080005, 'CS', 'ISO_IR 100')
+        ds.PatientID = '12345'
+        assert [0x00000000, 0x00080005, 0x00100010, 0x00100020] == [
+            elem.tag for elem in ds
+        ]
+        assert [0x00000000, 0x00080005] == [
+            elem.tag for elem in ds[:0x00100000]
+        ]
+
+        del ds.PatientName
+        assert [0x00000000, 0x00080005, 0x00100020] == list(ds._sorted_tags())
+        del ds[0x00080005]
+        assert [0x00000000, 0x00100020] == list(ds._sorted_tags())
+        ds.pop(0x00000000)
+        assert [0x00100020] == list(ds._sorted_tags())
+        ds.popitem()
+        assert [] == list(ds._sorted_tags())
+        ds.PatientID = '12345'
+        ds.clear()
+        assert [] == list(ds._sorted_tags())
+
+    def test_sorted_tags_shallow_copy(self):
+        """Test the sorted tags after changes through a shallow copy."""
+        ds = Dataset()
+        ds.PatientName = 'CITIZEN^Jan'
+        assert [0x00100010] == [elem.tag for elem in ds]
+        ds_copy = ds.copy()
+        ds_copy.CommandGroupLength = 100
+        assert [0x00000000, 0x00100010] == [elem.tag for elem in ds]
+
+        # Same number of elements after a delete and an add
+        ds_copy.PatientID = '12345'
+        assert [0x00000000, 0x00100010, 0x00100020] == list(ds._sorted_tags())
+        del ds_copy.PatientName
+        ds_copy.StudyID = 'x'
+        assert [0x00000000, 0x00100020, 0x00200010] == [
+            elem.tag for elem in ds
+        ]
+
+    def test_sorted_tags_shared_dict(self):
+        """Test the sorted tags of datasets sharing the same element dict."""
+        ds = Dataset()
+        ds.PatientName = 'CITIZEN^Jan'
+        ds.PatientID = '12345'
+        assert [0x00100010, 0x00100020] == [elem.tag for elem in ds]
+        other = Dataset(ds)
+        del other.PatientName
+        other.StudyID = 'x'
+        assert [0x00100020, 0x00200010] == [elem.tag for elem in ds]
+        assert [0x00100020, 0x00200010] == [elem.tag for elem in other]
+
+        # A clone has its own element dict
+        clone = ds.clone()
+        del clone.PatientID
+        clone.PatientName = 'CITIZEN^Jan'
+        assert [0x00100020, 0x00200010] == [elem.tag for elem in ds]
+        assert [0x00100010, 0x00200010] == [elem.tag for elem in clone]
+
+    def test_keyword_access_raw(self):
+        """Test getting and setting raw elements by keyword."""
+        ds = Dataset()
+        ds[0x00100010] = RawDataElement(
+            Tag(0x00100010), 'PN', 11, b'CITIZEN^Jan', 0, False, True
+        )
+        assert 'CITIZEN^Jan' == ds.PatientName
+        assert isinstance(ds.get_item(0x00100010), DataElement)
+
+        ds[0x00100020] = RawDataElement(
+            Tag(0x00100020), 'LO', 6, b'123456', 0, False, True
+        )
+        ds.PatientID = '12345'
+        elem = ds.get_item(0x00100020)
+        assert isinstance(elem, DataElement)
+        assert '12345' == elem.value
+
+    def test_keyword_access_sequence(self):
+        """Test getting and setting sequences by keyword."""
+        ds = Dataset()
+        ds.BeamSequence = [Dataset()]
+        seq = ds.BeamSequence
+        assert ds is seq.parent()
+        ds.BeamSequence = [Dataset(), Dataset()]
+        assert seq is not ds.BeamSequence
+        assert 2 == len(ds.BeamSequence)
+        assert ds is ds.BeamSequence.parent()
+
+    def test_decode_all(self):
+        """Test converting all the raw elements."""
+        def raw_elements(ds):
+            for elem in ds._dict.values():
+                if isinstance(elem, RawDataElement):
+                    yield elem
+                elif elem.VR == 'SQ':
+                    for item in elem.value:
+                        yield from raw_elements(item)
+
+        path = get_testdata_file('rtplan.dcm')
+        ds = dcmread(path)
+        assert list(raw_elements(ds))
+        ds.decode_all()
+        assert [] == list(raw_elements(ds))
+        assert ds == dcmread(path)
+        assert ds is ds.BeamSequence.parent()
+        assert 'iso8859' == ds.read_encoding
+
+    def test_decode_all_non_recursive(self):
+        """Test converting only the top-level raw elements."""
+        ds = dcmread(get_testdata_file('rtplan.dcm'))
+        ds.decode_all(recursive=False)
+        assert all(isinstance(e, DataElement) for e in ds._dict.values())
+        item = ds.BeamSequence[0]
+        assert isinstance(item.get_item(0x300A00C0), RawDataElement)
+
+    def test_decode_all_ambiguous(self):
+        """Test ambiguous VRs are corrected when converting."""
+        ds = dcmread(get_testdata_file('MR_small_implicit.dcm'))
+        assert ds.get_item(0x00280106).VR is None
+        ds.decode_all()
+        assert 'SS' == ds.get_item(0x00280106).VR
+        assert 'OW' == ds.get_item(0x7FE00010).VR
+        ref = dcmread(get_testdata_file('MR_small_implicit.dcm'))
+        assert ref.SmallestImagePixelValue == ds.SmallestImagePixelValue
+
+    def test_decode_all_deferred(self):
+        """Test deferred elements are read when converting."""
+        path = get_testdata_file('MR_small.dcm')
+        ds = dcmread(path, defer_size=1024)
+        assert ds._dict[0x7FE00010].value is None
+        ds.decode_all()
+        assert isinstance(ds._dict[0x7FE00010], DataElement)
+        assert dcmread(path).PixelData == ds.PixelData
+
+    def test_clone(self):
+        """Test a copy-on-write clone."""
+        ds = dcmread(get_testdata_file('rtplan.dcm'))
+        ds.ImageType = ['ORIGINAL', 'PRIMARY']
+        ds.decode_all()
+        clone = ds.clone()
+        assert isinstance(clone, FileDataset)
+        for tag in ds.keys():
+            assert ds._dict[tag] is clone._dict[tag]
+
+        clone.PatientName = 'CITIZEN^Jan'
+        clone.ImageType[0] = 'DERIVED'
+        del clone.PatientID
+        clone.PatientComments = 'None'
+        assert 'Last^First^mid^pre' == ds.PatientName
+        assert 'CITIZEN^Jan' == clone.PatientName
+        assert ['ORIGINAL', 'PRIMARY'] == ds.ImageType
+        assert ['DERIVED', 'PRIMARY'] == clone.ImageType
+        assert 'PatientID' in ds
+        assert 'PatientID' not in clone
+        assert 'PatientComments' not in ds
+
+        # Changes to the original don't affect the clone
+        ds.StudyID = 'S1'
+        ds[0x00080020].value = '20210101'
+        assert 'S1' != clone.StudyID
+        assert '20210101' != clone.StudyDate
+
+        # Unchanged elements are still shared
+        assert ds._dict[0x00080016] is clone._dict[0x00080016]
+
+        clone.PatientName = 'Last^First^mid^pre'
+        clone.ImageType[0] = 'ORIGINAL'
+        clone.PatientID = ds.PatientID
+        del clone.PatientComments
+        ds.StudyID = clone.StudyID
+        ds.StudyDate = clone.StudyDate
+        assert ds == clone
+
+        # Pickling doesn't carry the shared state
+        unpickled = pickle.loads(pickle.dumps(clone))
+        assert clone == unpickled
+        assert not unpickled._shared
+
+    def test_clone_sequence(self):
+        """Test sequence items are cloned when changed."""
+        ds = dcmread(get_testdata_file('rtplan.dcm'))
+        ds.BeamSequence.append(copy.deepcopy(ds.BeamSequence[0]))
+        ds.BeamSequence[1].BeamName = 'Field 2'
+        clone = ds.clone()
+        clone.BeamSequence[0].BeamName = 'Beam 1'
+        assert 'Field 1' == ds.BeamSequence[0].BeamName
+        assert 'Beam 1' == clone.BeamSequence[0].BeamName
+        assert clone is clone.BeamSequence.parent()
+        assert ds is ds.BeamSequence.parent()
+
+        ds.BeamSequence[1].BeamName = 'Beam 2'
+        assert 'Field 2' == clone.BeamSequence[1].BeamName
+
+        del clone.BeamSequence[0]
+        assert 2 == len(ds.BeamSequence)
+        assert 1 == len(clone.BeamSequence)
+
+    def test_clone_file_meta(self):
+        """Test the file meta of a clone is also cloned."""
+        ds = dcmread(get_testdata_file('CT_small.dcm'))
+        clone = ds.clone()
+        clone.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+        assert ExplicitVRLittleEndian == ds.file_meta.TransferSyntaxUID
+
+    def test_clone_pop(self):
+        """Test elements popped from a clone are copies."""
+        ds = Dataset()
+        ds.PatientName = 'CITIZEN^Jan'
+        ds.PatientID = '12345'
+        clone = ds.clone()
+        elem = clone.pop('PatientName')
+        elem.value = 'CITIZEN^Jane'
+        assert 'CITIZEN^Jan' == ds.PatientName
+        tag, elem = clone.popitem()
+        elem.value = '54321'
+        assert '12345' == ds.PatientID
+        assert 0 == len(clone)
+
+    def test_clone_twice(self):
+        """Test cloning a dataset again doesn't copy its elements."""
+        ds = dcmread(get_testdata_file('rtplan.dcm'))
+        ds.decode_all()
+        elements = dict(ds._dict)
+        first = ds.clone()
+        second = ds.clone()
+        for tag, elem in elements.items():
+            assert elem is ds._dict[tag]
+            assert elem is first._dict[tag]
+            assert elem is second._dict[tag]
+
+        second.PatientName = 'CITIZEN^Jan'
+        assert 'Last^First^mid^pre' == ds.PatientName
+        assert 'Last^First^mid^pre' == first.PatientName
+
+    def test_clone_shared_dict(self):
+        """Test datasets sharing the element dict of a cloned dataset."""
+        ds = dcmread(get_testdata_file('CT_small.dcm'))
+        ds.decode_all()
+        clone = ds.clone()
+        Dataset(ds).PatientName = 'CITIZEN^Jan'
+        assert 'CITIZEN^Jan' == ds.PatientName
+        assert 'CompressedSamples^CT1' == clone.PatientName
+
+        FileDataset('test.dcm', ds).PatientID = '12345'
+        assert '12345' == ds.PatientID
+        assert '1CT1' == clone.PatientID
+
+        Dataset(clone).StudyID = 'S1'
+        assert 'S1' == clone.StudyID
+        assert 'S1' != ds.StudyID
+
+    def test_clone_write(self):
+        """Test writing a clone doesn't copy the shared elements."""
+        ds = dcmread(get_testdata_file('CT_small.dcm'))
+        ds.decode_all()
+        clone = ds.clone()
+        clone.PatientName = 'CITIZEN^Jan'
+        ds.PatientName = 'CITIZEN^Jan'
+        fp = DicomBytesIO()
+        fp_clone = DicomBytesIO()
+        ds.save_as(fp)
+        clone.save_as(fp_clone)
+        assert fp.getvalue() == fp_clone.getvalue()
+        assert ds._dict[0x00280010] is clone._dict[0x00280010]
+
     def test_setdefault(self):
         elem = self.ds.setdefault(0x300a00b2, 'foo')
         assert 'unit001' == elem.value
@@ -1269,6 +1550,213 @@ class TestDataset:
         assert ds.data_element('BeamSequence') == next(elem_gen)
         assert ds.BeamSequence[0].data_element('PatientName') == next(elem_gen)
 
+    def test_traverse(self):
+        """Test Dataset.traverse with filters."""
+        ds = Dataset()
+        ds.CommandGroupLength = 120
+        ds.PatientName = 'CITIZEN^Jan'
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[0].PatientName = 'ANON'
+        ds.BeamSequence[0].BeamName = 'Beam 1'
+        ds.BeamSequence[1].ControlPointSequence = [Dataset()]
+        item = ds.BeamSequence[1].ControlPointSequence[0]
+        item.PatientName = 'ANON^2'
+
+        assert [e.tag for e in ds.iterall()] == [
+            e.tag for _, e in ds.traverse()
+        ]
+
+        result = list(ds.traverse(VRs=['PN']))
+        assert [
+            (ds, 0x00100010),
+            (ds.BeamSequence[0], 0x00100010),
+            (item, 0x00100010),
+        ] == [(d, e.tag) for d, e in result]
+
+        result = list(ds.traverse(tags=['BeamName', 0x00000000]))
+        assert [0x00000000, 0x300A00C2] == [e.tag for _, e in result]
+
+        result = list(
+            ds.traverse(predicate=lambda d, e: e.value == 'ANON^2')
+        )
+        assert [(item, 0x00100010)] == [(d, e.tag) for d, e in result]
+
+        # Pruned sequences aren't traversed
+        def prune(d, e):
+            return e.tag == 0x300A0111
+
+        result = list(ds.traverse(VRs=['PN'], prune=prune))
+        assert 2 == len(result)
+
+        # Elements may be deleted while traversing
+        for d, elem in ds.traverse(VRs=['PN', 'SQ']):
+            if elem.VR == 'SQ':
+                del d[elem.tag]
+
+        assert [0x00000000, 0x00100010] == [e.tag for e in ds.iterall()]
+
+    def test_traverse_un_sequence(self):
+        """Test Dataset.traverse with a sequence encoded as UN."""
+        item = b'\x0a\x30\xc2\x00SH\x06\x00Beam 1'
+        item = b'\xfe\xff\x00\xe0' + pack('<L', len(item)) + item
+        fp = DicomBytesIO(
+            b'\x10\x00\x10\x00PN\x04\x00ANON'
+            b'\x0a\x30\xb0\x00UN\x00\x00\xff\xff\xff\xff'
+            + item + b'\xfe\xff\xdd\xe0\x00\x00\x00\x00'
+        )
+        fp.is_little_endian = True
+        fp.is_implicit_VR = False
+        ds = dcmread(fp, force=True)
+        assert 'UN' == ds._dict[0x300A00B0].VR
+
+        result = list(ds.traverse(VRs=['SH'], convert=False))
+        assert [0x300A00C2] == [e.tag for _, e in result]
+        assert 'SQ' == ds._dict[0x300A00B0].VR
+        assert 'Beam 1' == ds.BeamSequence[0].BeamName
+
+        fp.seek(0)
+        ds = dcmread(fp, force=True)
+        assert [0x00100010, 0x300A00B0, 0x300A00C2] == [
+            e.tag for e in ds.iterall()
+        ]
+
+    def test_traverse_raw(self):
+        """Test Dataset.traverse with raw elements."""
+        ds = dcmread(get_testdata_file('rtplan.dcm'))
+        result = list(ds.traverse(VRs=['PN', 'DA', 'UI'], convert=False))
+        assert result
+        for d, elem in result:
+            assert isinstance(elem, RawDataElement)
+            assert elem is d._dict[elem.tag]
+
+        # Only the sequences were converted
+        for elem in ds._dict.values():
+            assert isinstance(elem, RawDataElement) or elem.VR == 'SQ'
+
+        result = list(ds.traverse(VRs=['PN', 'DA', 'UI']))
+        assert 'Last^First^mid^pre' in [
+            e.value for _, e in result if e.VR == 'PN'
+        ]
+        for _, elem in result:
+            assert isinstance(elem, DataElement)
+
+        assert isinstance(ds.get_item(0x00100010), DataElement)
+        assert isinstance(ds.get_item(0x00100020), RawDataElement)
+
+    def test_digest(self):
+        """Test Dataset.digest with raw and converted elements."""
+        path = get_testdata_file('rtplan.dcm')
+        ds = dcmread(path)
+        digest = ds.digest()
+        assert 64 == len(digest)
+        assert digest == ds.digest()
+        assert digest == dcmread(path).digest('sha256')
+        assert digest != ds.digest('md5')
+        assert 32 == len(ds.digest('md5'))
+
+        # Converting the elements doesn't change the digest
+        ds.decode_all()
+        assert digest == ds.digest()
+
+        ds.PatientName = 'Citizen^Jan'
+        assert digest != ds.digest()
+
+        # Changing a value in a sequence item changes the digest
+        ds = dcmread(path)
+        ds.BeamSequence[0].BeamName = 'Changed'
+        assert digest != ds.digest()
+
+    def test_digest_include_exclude(self):
+        """Test Dataset.digest with include and exclude."""
+        ds = dcmread(get_testdata_file('CT_small.dcm'))
+        digest = ds.digest(exclude=['PixelData'])
+        assert digest != ds.digest()
+        assert digest == ds.digest(exclude=[0x7FE00010])
+
+        ds.PixelData = b'\x00' * len(ds.PixelData)
+        assert digest == ds.digest(exclude=['PixelData'])
+
+        include = ds.digest(include=['PatientName', (0x0010, 0x0020)])
+        ds.PatientSex = 'O'
+        assert include == ds.digest(include=['PatientName', 'PatientID'])
+        ds.PatientID = 'Changed'
+        assert include != ds.digest(include=['PatientName', 'PatientID'])
+
+    def test_digest_deferred(self):
+        """Test Dataset.digest with deferred elements."""
+        path = get_testdata_file('CT_small.dcm')
+        digest = dcmread(path).digest()
+
+        ds = dcmread(path, defer_size=256)
+        assert ds._dict[0x7FE00010].value is None
+        assert digest == ds.digest()
+        # The deferred value isn't read into the dataset
+        assert ds._dict[0x7FE00010].value is None
+
+        with open(path, 'rb') as f:
+            ds = dcmread(f, defer_size=256)
+            assert digest == ds.digest()
+
+        ds = dcmread(path, defer_size=256)
+        ds.filename = None
+        with pytest.raises(IOError, match='original filename not stored'):
+            ds.digest()
+
+        # Values past the end of a truncated file
+        path = get_testdata_file('rtplan_truncated.dcm')
+        digest = dcmread(path, force=True).digest()
+        assert digest == dcmread(path, force=True, defer_size=64).digest()
+
+    def test_digest_accessed(self):
+        """Test Dataset.digest is the same after accessing elements."""
+        for name in ('CT_small.dcm', 'rtplan.dcm', 'rtplan_truncated.dcm'):
+            ds = dcmread(get_testdata_file(name), force=True)
+            digest = ds.digest()
+            # The raw elements aren't converted
+            assert isinstance(ds._dict[0x00100010], RawDataElement)
+            ds.decode_all()
+            assert digest == ds.digest()
+
+        # Non-standard padding and a sequence encoded as 'UN'
+        ds = Dataset()
+        ds.is_little_endian = True
+        ds.is_implicit_VR = False
+        ds[0x00080060] = RawDataElement(
+            Tag(0x00080060), 'CS', 3, b'MR\x00', 0, False, True
+        )
+        item = b'\x0a\x30\xb2\x00SH\x04\x00BEAM'
+        value = (
+            b'\xfe\xff\x00\xe0' + pack('<L', len(item)) + item
+            + b'\xfe\xff\xdd\xe0\x00\x00\x00\x00'
+        )
+        ds[0x300A00B0] = RawDataElement(
+            Tag(0x300A00B0), 'UN', len(value), value, 0, False, True
+        )
+        digest = ds.digest()
+        assert 'MR' == ds.Modality
+        assert 'BEAM' == ds.BeamSequence[0].TreatmentMachineName
+        assert digest == ds.digest()
+
+    def test_digest_deferred_changed_file_raises(self, tmp_path):
+        """Test Dataset.digest if the original file has changed."""
+        path = get_testdata_file('CT_small.dcm')
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        path = os.fspath(tmp_path / 'in.dcm')
+        with open(path, 'wb') as f:
+            f.write(data)
+
+        ds = dcmread(path, defer_size=256)
+        offset = ds._dict[0x7FE00010].value_tell - 12
+        with open(path, 'wb') as f:
+            f.write(data[:offset] + b'\x00' * 4 + data[offset + 4:])
+
+        msg = "Deferred read tag .* does not match original"
+        with pytest.warns(UserWarning, match="modification time"):
+            with pytest.raises(ValueError, match=msg):
+                ds.digest()
+
     def test_save_as(self):
         """Test Dataset.save_as"""
         fp = DicomBytesIO()
@@ -1770,6 +2258,44 @@ class TestFileDataset:
         ds1.PixelSpacing.insert(1, 2)
         assert [1, 2, 1] == ds1.PixelSpacing
 
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_pickle_out_of_band(self):
+        """Test pickling bulk binary values out-of-band."""
+        ds = pydicom.dcmread(get_testdata_file('CT_small.dcm'))
+        buffers = []
+        s = pickle.dumps(ds, protocol=5, buffer_callback=buffers.append)
+        assert 2 == len(buffers)
+        assert len(s) < len(pickle.dumps(ds, protocol=4))
+        ds1 = pickle.loads(s, buffers=buffers)
+        assert ds == ds1
+        assert isinstance(ds1.get_item(0x7FE00010).value, memoryview)
+        assert ds.PixelData == ds1.PixelData
+
+        # Converted elements and in-band buffers
+        ds.decode_all()
+        buffers = []
+        s = pickle.dumps(ds, protocol=5, buffer_callback=buffers.append)
+        assert 2 == len(buffers)
+        ds1 = pickle.loads(s, buffers=buffers)
+        assert ds == ds1
+        assert isinstance(ds1.PixelData, memoryview)
+        ds1 = pickle.loads(pickle.dumps(ds, protocol=5))
+        assert ds == ds1
+        assert isinstance(ds1.PixelData, bytes)
+
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_pickle_out_of_band_mmap(self):
+        """Test pickling a memory-mapped dataset."""
+        path = get_testdata_file('CT_small.dcm')
+        ds = pydicom.dcmread(path, mmap=True)
+        assert isinstance(ds.get_item(0x7FE00010).value, memoryview)
+        buffers = []
+        s = pickle.dumps(ds, protocol=5, buffer_callback=buffers.append)
+        ds1 = pickle.loads(s, buffers=buffers)
+        assert pydicom.dcmread(path).PixelData == ds1.PixelData
+        ds1 = pickle.loads(pickle.dumps(ds, protocol=5))
+        assert pydicom.dcmread(path).PixelData == ds1.PixelData
+
     def test_equality_file_meta(self):
         """Dataset: equality returns correct value if with metadata"""
         d = dcmread(self.test_file)
@@ -67,6 +67,8 @@ class TestDict:
         ds = Dataset()
         ds.TestOne = 'test'
         ds.TestTwo = ['1', '2', '3']
+        assert 'test' == ds.TestOne
+        assert 0x10021001 in ds
 
     def test_add_entry_raises_for_private_tag(self):
         with pytest.raises(ValueError,
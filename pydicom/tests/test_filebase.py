@@ -5,8 +5,13 @@ from io import BytesIO
 
 import pytest
 
+from pydicom import dcmread
 from pydicom.data import get_testdata_file
-from pydicom.filebase import DicomIO, DicomFileLike, DicomFile, DicomBytesIO
+from pydicom.dataset import Dataset
+from pydicom.filebase import (
+    DicomIO, DicomFileLike, DicomFile, DicomBytesIO, DicomMemoryMap,
+    DicomBufferedReader
+)
 from pydicom.tag import Tag
 
 
@@ -264,3 +269,157 @@ class TestDicomFile:
             #   lowercase file path on Windows
             assert "ct_small.dcm" in fp.name.lower()
             assert fp.read(2) == b'\x49\x49'
+
+
+class TestDicomMemoryMap:
+    """Test filebase.DicomMemoryMap class"""
+    def test_read(self):
+        """Test reading behaves like a normal file"""
+        with open(TEST_FILE, 'rb') as f:
+            data = f.read()
+
+        with DicomMemoryMap(TEST_FILE) as fp:
+            assert fp.name == TEST_FILE
+            assert fp.read(2) == b'\x49\x49'
+            assert fp.tell() == 2
+            fp.seek(128)
+            assert fp.read(4) == b'DICM'
+            fp.seek(0)
+            assert fp.read() == data
+
+    def test_read_view(self):
+        """Test read_view returns a view of the mapping"""
+        fp = DicomMemoryMap(TEST_FILE)
+        fp.seek(128)
+        view = fp.read_view(4)
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view == b'DICM'
+        assert fp.tell() == 132
+
+        # Closing doesn't invalidate existing views
+        fp.close()
+        assert view == b'DICM'
+
+    def test_read_view_eof(self):
+        """Test read_view at the end of the file"""
+        with DicomMemoryMap(TEST_FILE) as fp:
+            fp.seek(-2, 2)
+            view = fp.read_view(4)
+            assert len(view) == 2
+            assert fp.read_view(4) == b''
+
+    def test_empty_file(self, tmp_path):
+        """Test mapping an empty file"""
+        path = tmp_path / 'empty'
+        path.touch()
+        with DicomMemoryMap(str(path)) as fp:
+            assert fp.read(8) == b''
+            assert fp.read_view(8) == b''
+
+    def test_mode_raises(self):
+        """Test only 'rb' is allowed"""
+        msg = r"DicomMemoryMap only supports the mode 'rb'"
+        with pytest.raises(ValueError, match=msg):
+            DicomMemoryMap(TEST_FILE, 'wb')
+
+
+class TestDicomBufferedReader:
+    """Test filebase.DicomBufferedReader class"""
+    def test_read(self):
+        """Test reading behaves like a normal file"""
+        with open(TEST_FILE, 'rb') as f:
+            data = f.read()
+
+        with DicomBufferedReader(TEST_FILE, block_size=16) as fp:
+            assert fp.name == TEST_FILE
+            assert fp.read(2) == b'\x49\x49'
+            assert fp.tell() == 2
+            fp.seek(128)
+            assert fp.read(4) == b'DICM'
+            assert fp.tell() == 132
+            fp.seek(-4, 1)
+            assert fp.read(8) == data[128:136]
+            fp.seek(-2, 2)
+            assert fp.read(4) == data[-2:]
+            assert fp.read(4) == b''
+            assert fp.tell() == len(data)
+            fp.seek(0)
+            assert fp.read() == data
+
+    def test_read_ahead(self):
+        """Test small reads are served from the block"""
+        fp = DicomBufferedReader(BytesIO(b'\x00\x01' * 100), block_size=64)
+        assert fp.read(4) == b'\x00\x01\x00\x01'
+        assert fp.read_calls == 1
+        assert fp.bytes_read == 64
+        fp.read(59)
+        assert fp.read_calls == 1
+        fp.read(2)
+        assert fp.read_calls == 2
+        assert fp.bytes_read == 128
+        assert fp.tell() == 65
+
+    def test_large_read(self):
+        """Test reads of at least a block are passed on directly"""
+        fp = DicomBufferedReader(BytesIO(bytes(range(200))), block_size=64)
+        assert fp.read(2) == b'\x00\x01'
+        assert fp.read(150) == bytes(range(2, 152))
+        assert fp.read_calls == 2
+        assert fp.bytes_read == 152
+        assert fp.tell() == 152
+
+    def test_seek(self):
+        """Test seeking within the block doesn't discard it"""
+        fp = DicomBufferedReader(BytesIO(bytes(range(200))), block_size=64)
+        fp.read(10)
+        assert fp.seek(2) == 2
+        assert fp.seek(60) == 60
+        assert fp.seek(-50, 1) == 10
+        assert fp.read(1) == b'\x0a'
+        assert fp.read_calls == 1
+
+        # Seeking outside the block discards it
+        assert fp.seek(100) == 100
+        assert fp.read(1) == b'\x64'
+        assert fp.read_calls == 2
+        assert fp.seek(2) == 2
+        assert fp.read(1) == b'\x02'
+        assert fp.read_calls == 3
+
+    def test_dcmread(self):
+        """Test reading a dataset using fewer reads"""
+        ref = dcmread(TEST_FILE)
+        with open(TEST_FILE, 'rb', buffering=0) as f:
+            fp = DicomBufferedReader(f, block_size=4096)
+            ds = dcmread(fp, stop_before_pixels=True)
+
+        assert 'PixelData' not in ds
+        assert ref.PatientName == ds.PatientName
+        assert fp.read_calls == 2
+
+    def test_deferred_read(self):
+        """Test deferred reads reopen the file"""
+        ref = dcmread(TEST_FILE)
+        with DicomBufferedReader(TEST_FILE) as fp:
+            ds = dcmread(fp, defer_size=1024)
+
+        assert ds._dict[0x7FE00010].value is None
+        assert Dataset.__eq__(ref, ds)
+
+    def test_write_raises(self):
+        """Test writing raises an exception"""
+        fp = DicomBufferedReader(BytesIO())
+        msg = r"This DicomFileLike object has no write\(\) method"
+        with pytest.raises(IOError, match=msg):
+            fp.write(b'\x00')
+
+    def test_invalid_raises(self):
+        """Test invalid arguments raise exceptions"""
+        msg = r"DicomBufferedReader only supports the mode 'rb'"
+        with pytest.raises(ValueError, match=msg):
+            DicomBufferedReader(TEST_FILE, 'wb')
+
+        msg = r"'block_size' must be greater than 0"
+        with pytest.raises(ValueError, match=msg):
+            DicomBufferedReader(BytesIO(), block_size=0)
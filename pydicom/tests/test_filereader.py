@@ -2,15 +2,19 @@
 # -*- coding: utf-8 -*-
 """Unit tests for the pydicom.filereader module."""
 
+import asyncio
+import copy
 import gzip
 import io
 from io import BytesIO
 import os
+import pickle
 import shutil
 from pathlib import Path
 from struct import unpack
 import sys
 import tempfile
+import zlib
 
 import pytest
 
@@ -20,10 +24,17 @@ from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
 from pydicom.data import get_testdata_file
 from pydicom.datadict import add_dict_entries
 from pydicom.filereader import dcmread, read_dataset, read_dicomdir
-from pydicom.dataelem import DataElement, DataElement_from_raw
+from pydicom.dataelem import (
+    DataElement, DataElement_from_raw, HAVE_PICKLE_BUFFER
+)
 from pydicom.errors import InvalidDicomError
 from pydicom.filebase import DicomBytesIO
-from pydicom.filereader import data_element_generator
+from pydicom.filewriter import write_dataset
+from pydicom.filereader import (
+    data_element_generator, build_element_index, read_element_index,
+    ElementIndex, dcmread_many, clear_deferred_read_cache, _InflatedFileLike,
+    IncrementalParser, dcmread_async
+)
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
 from pydicom.tag import Tag, TupleTag
@@ -273,6 +284,34 @@ class TestReader:
         ds = dcmread(deflate_name)
         assert "WSD" == ds.ConversionType
 
+    def test_deflate_partial(self):
+        """Test only the needed part of a deflated dataset is inflated"""
+        ref = dcmread(deflate_name)
+        ds = dcmread(deflate_name, stop_before_pixels=True)
+        assert 'PixelData' not in ds
+        assert ref.ConversionType == ds.ConversionType
+        nr_inflated = len(ds.filename._buffer)
+        assert nr_inflated < len(ref.PixelData)
+
+        ds = dcmread(deflate_name, specific_tags=['ConversionType'])
+        assert ref.ConversionType == ds.ConversionType
+        assert len(ds.filename._buffer) <= nr_inflated
+
+    def test_deflate_deferred(self):
+        """Test deferred reads of a deflated dataset"""
+        ref = dcmread(deflate_name)
+        ds = dcmread(deflate_name, defer_size=100)
+        assert ds._dict[0x7FE00010].value is None
+        assert ds._dict[0x00204000].value is None
+        assert ref.PixelData == ds.PixelData
+        assert ref.ImageComments == ds.ImageComments
+
+    def test_deflate_pickle(self):
+        """Test pickling a deflated dataset"""
+        ds = dcmread(deflate_name, defer_size=1024)
+        ds2 = pickle.loads(pickle.dumps(ds))
+        assert dcmread(deflate_name).PixelData == ds2.PixelData
+
     def test_bad_sequence(self):
         """Test that automatic UN conversion can be switched off."""
         replace_un_with_known_vr = config.replace_un_with_known_vr
@@ -332,6 +371,85 @@ class TestReader:
         tags = sorted(tags.keys())
         assert [] == tags
 
+    def test_specific_tags_stops_early(self):
+        """Reading stops once the last specific tag has been passed."""
+        elem = dcmread(ct_name).get_item('PatientID')
+        with open(ct_name, 'rb') as f:
+            ds = dcmread(f, specific_tags=['PatientName'])
+            # Positioned at the start of the first unwanted element
+            assert elem.value_tell - 8 == f.tell()
+
+        assert [Tag(0x0008, 0x0005), Tag(0x0010, 0x0010)] == sorted(ds.keys())
+
+    def test_specific_tags_skips_unknown_length_SQ(self, monkeypatch):
+        """Unwanted undefined length SQs are skipped without parsing."""
+        liver_name = get_testdata_file("liver_1frame.dcm")
+        reportsi_name = get_testdata_file("reportsi.dcm")
+        expected = {
+            liver_name: dcmread(liver_name).PixelData,
+            reportsi_name: dcmread(reportsi_name).VerificationFlag,
+            nested_priv_SQ_name: dcmread(nested_priv_SQ_name).PixelData,
+        }
+
+        def read_sequence(*args, **kwargs):
+            raise RuntimeError("read_sequence() should not be called")
+
+        monkeypatch.setattr(
+            pydicom.filereader, "read_sequence", read_sequence
+        )
+        ds = dcmread(liver_name, specific_tags=['PixelData'])
+        assert expected[liver_name] == ds.PixelData
+        ds = dcmread(reportsi_name, specific_tags=['VerificationFlag'])
+        assert expected[reportsi_name] == ds.VerificationFlag
+        ds = dcmread(nested_priv_SQ_name, specific_tags=['PixelData'])
+        assert expected[nested_priv_SQ_name] == ds.PixelData
+
+    def test_specific_tags_unknown_length_SQ_values(self):
+        """Elements after skipped SQs are the same as a full read."""
+        for name in ("liver_1frame.dcm", "reportsi.dcm", "JPEG2000.dcm"):
+            fname = get_testdata_file(name)
+            ds = dcmread(fname)
+            for elem in ds:
+                ds_specific = dcmread(fname, specific_tags=[elem.tag])
+                assert elem == ds_specific[elem.tag]
+
+    def test_raw_sequences(self, monkeypatch):
+        """Undefined length SQs are kept encoded with raw_sequences."""
+        for name in (
+            "liver_1frame.dcm", "reportsi.dcm", "rtstruct.dcm",
+            "nested_priv_SQ.dcm", "priv_SQ.dcm"
+        ):
+            fname = get_testdata_file(name)
+            ds = dcmread(fname, force=True)
+            with monkeypatch.context() as m:
+                m.setattr(pydicom.filereader, "read_sequence", None)
+                ds_raw = dcmread(fname, force=True, raw_sequences=True)
+
+            raw = [
+                elem for elem in ds_raw._dict.values()
+                if elem.is_raw and elem.length == 0xFFFFFFFF
+            ]
+            assert raw
+            delimiter = b'\xfe\xff\xdd\xe0\x00\x00\x00\x00'
+            for elem in raw:
+                # The Sequence Delimitation Item isn't included
+                assert delimiter != elem.value[-8:]
+
+            assert ds == ds_raw
+            for elem in raw:
+                assert ds_raw[elem.tag].is_undefined_length
+
+    def test_raw_sequences_deferred(self):
+        """Undefined length SQs can be deferred with raw_sequences."""
+        ds = dcmread(rtstruct_name, force=True)
+        ds_raw = dcmread(
+            rtstruct_name, force=True, raw_sequences=True, defer_size=256
+        )
+        elem = ds_raw._dict[0x30060039]  # ROIContourSequence
+        assert elem.value is None
+        assert 0xFFFFFFFF == elem.length
+        assert ds.ROIContourSequence == ds_raw.ROIContourSequence
+
     def test_specific_tags_with_unknown_length_tag(self):
         """Returns only tags specified by user."""
         unknown_len_tag = Tag(0x7FE0, 0x0010)  # Pixel Data
@@ -805,6 +923,26 @@ class TestReader:
             assert elem.VR == "SS"
             assert elem.value == [62720, -2048, 16]
 
+    @pytest.mark.skipif(not have_numpy, reason="Numpy not installed")
+    def test_lut_descriptor_numbers_numpy(self):
+        """Test LUT Descriptor with use_numbers_numpy"""
+        original = config.use_numbers_numpy
+        config.use_numbers_numpy = True
+        try:
+            for VR, value in ((b"US", b"\x00\x01"), (b"SS", b"\x00\xf5")):
+                bs = DicomBytesIO(
+                    b"\x28\x00\x02\x30" + VR + b"\x06\x00"
+                    + value + b"\x00\x00\x10\x00"
+                )
+                bs.is_little_endian = True
+                bs.is_implicit_VR = False
+                ds = dcmread(bs, force=True)
+                elem = ds[0x00283002]
+                assert elem.VR == VR.decode()
+                assert [unpack("<H", value)[0], 0, 16] == elem.value
+        finally:
+            config.use_numbers_numpy = original
+
     def test_lut_descriptor_empty(self):
         """Regression test for #1049: LUT empty raises."""
         bs = DicomBytesIO(b"\x28\x00\x01\x11\x53\x53\x00\x00")
@@ -1378,6 +1516,28 @@ class TestDSISnumpy:
         with pytest.raises(ValueError):
             values.convert_IS_string(b"123b", True)
 
+        msg = r"IS: char\(s\) not in repertoire: 'ex'"
+        with pytest.raises(ValueError, match=msg):
+            values.convert_IS_string(b"1\\1e2\\x", True)
+
+    @pytest.mark.skipif(not have_numpy, reason="numpy not installed")
+    def test_DS_IS_numpy_values(self):
+        """Test parsing multiple values with padding and exponents."""
+        config.DS_numpy(True)
+        config.use_IS_numpy = True
+        value = values.convert_DS_string(b" 1.5\\-2.25E1\\+3e-1 ", True)
+        assert isinstance(value, numpy.ndarray)
+        assert [1.5, -22.5, 0.3] == value.tolist()
+
+        value = values.convert_IS_string(b"1\\ -20\\+300 ", True)
+        assert isinstance(value, numpy.ndarray)
+        assert [1, -20, 300] == value.tolist()
+
+        contour = b"\\".join([b"%.4f" % (ii / 7) for ii in range(10000)])
+        value = values.convert_DS_string(contour, True)
+        assert 10000 == len(value)
+        assert numpy.allclose(numpy.arange(10000) / 7, value, atol=1e-4)
+
     @pytest.mark.skipif(have_numpy, reason="testing numpy ImportError")
     def test_numpy_import_warning(self):
         config.DS_numpy(True)
@@ -1388,6 +1548,54 @@ class TestDSISnumpy:
             values.convert_IS_string(b"123", True)
 
 
+class TestInflatedFileLike:
+    """Test the file-like used for deflated datasets"""
+    data = bytes(range(256)) * 1024
+
+    def fp(self):
+        """Return an _InflatedFileLike for `data`"""
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        deflated = compressor.compress(self.data) + compressor.flush()
+        return _InflatedFileLike(BytesIO(deflated))
+
+    def test_read(self):
+        """Test reading the inflated data"""
+        fp = self.fp()
+        assert self.data[:8] == fp.read(8)
+        assert 8 == fp.tell()
+        assert len(fp._buffer) < len(self.data)
+        assert self.data[8:100000] == fp.read(99992)
+        assert self.data[100000:] == fp.read()
+        assert b'' == fp.read(8)
+        assert len(self.data) == fp.tell()
+
+        fp = self.fp()
+        assert self.data == fp.read(None)
+
+    def test_seek(self):
+        """Test seeking in the inflated data"""
+        fp = self.fp()
+        assert 100 == fp.seek(100)
+        assert 100 == fp.tell()
+        assert self.data[100:108] == fp.read(8)
+        assert 104 == fp.seek(-4, 1)
+        assert self.data[104:108] == fp.read(4)
+        assert len(self.data) - 8 == fp.seek(-8, 2)
+        assert self.data[-8:] == fp.read()
+
+        with pytest.raises(ValueError, match=r"Negative seek position -1"):
+            fp.seek(-1)
+
+    def test_truncated(self):
+        """Test reading a truncated stream"""
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        deflated = compressor.compress(self.data) + compressor.flush()
+        fp = _InflatedFileLike(BytesIO(deflated[:-100]))
+        data = fp.read()
+        assert 0 < len(data) < len(self.data)
+        assert self.data.startswith(data)
+
+
 class TestDeferredRead:
     """Test that deferred data element reading (for large size)
     works as expected
@@ -1453,6 +1661,671 @@ class TestDeferredRead:
         assert 32768 == len(dataset.PixelData)
 
 
+class TestDeferredReadCache:
+    """Test caching the files used for deferred reads"""
+    @pytest.fixture(autouse=True)
+    def setup_cache(self):
+        """Enable the deferred read cache"""
+        original = config.deferred_read_cache_size
+        config.deferred_read_cache_size = 2
+        self.opened = []
+        yield
+        clear_deferred_read_cache()
+        config.deferred_read_cache_size = original
+
+    def fileobj_type(self, filename, mode):
+        """Open `filename` and keep track of the opened files"""
+        fp = open(filename, mode)
+        self.opened.append(fp)
+        return fp
+
+    def read(self, fname):
+        """Return a deferred read dataset using `fileobj_type`"""
+        ds = dcmread(fname, defer_size=0)
+        ds.fileobj_type = self.fileobj_type
+        return ds
+
+    def test_file_reused(self):
+        """Test the file is only opened once"""
+        ds = self.read(ct_name)
+        ref = dcmread(ct_name)
+        assert ref.PatientName == ds.PatientName
+        assert ref.PixelData == ds.PixelData
+        assert ref.ImageType == ds.ImageType
+        assert 1 == len(self.opened)
+        assert not self.opened[0].closed
+
+        clear_deferred_read_cache()
+        assert self.opened[0].closed
+
+    def test_lru(self):
+        """Test the least recently used file is closed"""
+        datasets = [self.read(fname) for fname in (ct_name, mr_name)]
+        datasets.append(self.read(rtplan_name))
+        for ds in datasets:
+            ds.PatientName
+
+        datasets[1].PatientID  # mr_name
+        datasets[0].PatientID  # ct_name reopened, rtplan_name closed
+        assert 4 == len(self.opened)
+        assert [True, False, True, False] == [f.closed for f in self.opened]
+
+    def test_modified_file(self, tmp_path):
+        """Test the file is reopened if modified"""
+        fname = os.fspath(tmp_path / "CT_small.dcm")
+        shutil.copyfile(ct_name, fname)
+        ds = self.read(fname)
+        ds.PatientName
+
+        os.utime(fname, (0, 0))
+        msg = r"Deferred read warning -- file modification time has changed"
+        with pytest.warns(UserWarning, match=msg):
+            ds.PatientID
+
+        assert 2 == len(self.opened)
+        assert self.opened[0].closed
+        assert not self.opened[1].closed
+
+    def test_disabled(self):
+        """Test files aren't cached if the cache size is 0"""
+        config.deferred_read_cache_size = 0
+        ds = self.read(ct_name)
+        ds.PatientName
+        ds.PatientID
+        assert 2 == len(self.opened)
+        assert all(f.closed for f in self.opened)
+
+    def test_memory_map(self):
+        """Test caching memory-mapped files"""
+        ds = dcmread(ct_name, mmap=True, defer_size=1024)
+        assert isinstance(ds.PixelData, memoryview)
+        assert dcmread(ct_name).PixelData == ds.PixelData
+
+        clear_deferred_read_cache()
+        assert 32768 == len(ds.PixelData)
+
+
+class TestElementIndex:
+    """Test reading using an element index"""
+    @pytest.fixture
+    def ct_copy(self, tmp_path):
+        """Return the path to a copy of CT_small.dcm"""
+        path = tmp_path / "CT_small.dcm"
+        shutil.copyfile(ct_name, path)
+        return path
+
+    def test_build(self, ct_copy):
+        """Test building and reading back an index"""
+        index = build_element_index(ct_copy)
+        assert isinstance(index, ElementIndex)
+        assert not index.is_implicit_VR
+        assert index.is_little_endian
+        assert os.path.getsize(ct_copy) == index.file_size
+
+        elem = dcmread(ct_copy).get_item('PatientName')
+        assert ('PN', elem.length, elem.value_tell) == (
+            index.elements[0x00100010]
+        )
+        assert index == read_element_index(f"{ct_copy}.idx")
+
+    def test_build_index_path(self, ct_copy, tmp_path):
+        """Test writing the index to a custom path"""
+        index_path = tmp_path / "index"
+        index = build_element_index(str(ct_copy), index_path)
+        assert not os.path.exists(f"{ct_copy}.idx")
+        assert index == read_element_index(index_path)
+
+    def test_build_deflated_raises(self, tmp_path):
+        """Test indexing a deflated dataset raises an exception"""
+        msg = r"Unable to index a dataset using the 'Deflated Explicit"
+        with pytest.raises(ValueError, match=msg):
+            build_element_index(deflate_name, tmp_path / "index")
+
+    def test_read_invalid_raises(self, ct_copy):
+        """Test reading an invalid index raises an exception"""
+        msg = r"is not a pydicom element index"
+        with pytest.raises(ValueError, match=msg):
+            read_element_index(ct_copy)
+
+        build_element_index(ct_copy)
+        with open(f"{ct_copy}.idx", "r+b") as f:
+            f.truncate(100)
+
+        msg = r"The element index '.*' is truncated"
+        with pytest.raises(ValueError, match=msg):
+            read_element_index(f"{ct_copy}.idx")
+
+    def test_dcmread_specific_tags(self, ct_copy):
+        """Test reading specific tags using the index"""
+        build_element_index(ct_copy)
+        tags = ['PatientName', 'ImageType', 'ViewName', 0x7FE00010]
+        ds = dcmread(ct_copy, specific_tags=tags, index=f"{ct_copy}.idx")
+        ref = dcmread(ct_copy, specific_tags=tags)
+        assert ref == ds
+        assert [0x00080005, 0x00080008, 0x00100010, 0x7FE00010] == list(
+            ds.keys()
+        )
+        assert ref.file_meta == ds.file_meta
+
+    @pytest.mark.parametrize(
+        "name",
+        ["CT_small.dcm", "MR_small_bigendian.dcm", "MR_small_implicit.dcm",
+         "liver_1frame.dcm", "reportsi.dcm", "JPEG2000.dcm"]
+    )
+    def test_dcmread_all(self, name, tmp_path):
+        """Test reading the whole dataset using the index"""
+        fname = get_testdata_file(name)
+        index = build_element_index(fname, tmp_path / "index")
+        ds = dcmread(fname, index=index)
+        ref = dcmread(fname)
+        assert ref == ds
+        assert ref.is_implicit_VR == ds.is_implicit_VR
+        assert ref.is_little_endian == ds.is_little_endian
+
+        ds = dcmread(fname, index=index, stop_before_pixels=True)
+        assert 'PixelData' not in ds
+        assert dcmread(fname, stop_before_pixels=True) == ds
+
+    def test_dcmread_defer_size(self, ct_copy):
+        """Test deferred reading with the index"""
+        index = build_element_index(ct_copy)
+        ds = dcmread(ct_copy, defer_size=1024, index=index)
+        assert ds._dict[0x7FE00010].value is None
+        assert dcmread(ct_copy).PixelData == ds.PixelData
+
+    def test_dcmread_changed_file(self, ct_copy):
+        """Test the index isn't used if the file has changed"""
+        index = build_element_index(ct_copy)
+        with open(ct_copy, "ab") as f:
+            f.write(b"\x00" * 8)
+
+        msg = r"has changed since its element index was built"
+        with pytest.warns(UserWarning, match=msg):
+            ds = dcmread(ct_copy, specific_tags=['PatientName'], index=index)
+
+        assert 'CompressedSamples^CT1' == ds.PatientName
+
+    def test_dcmread_mismatch_raises(self, ct_copy):
+        """Test an index for a different file-like raises an exception"""
+        index = build_element_index(ct_copy)
+        msg = r"The element index doesn't match the file"
+        with open(mr_name, 'rb') as f:
+            with pytest.raises(ValueError, match=msg):
+                dcmread(f, specific_tags=['PatientName'], index=index)
+
+
+class TestDcmreadMany:
+    """Test reading files in parallel with dcmread_many()"""
+    paths = [ct_name, mr_name, rtplan_name, jpeg2000_name, ct_name]
+
+    @pytest.mark.parametrize("executor", ['process', 'thread'])
+    def test_ordered(self, executor):
+        """Test the datasets are returned in order"""
+        datasets = list(dcmread_many(self.paths, 2, executor))
+        assert len(self.paths) == len(datasets)
+        for path, ds in zip(self.paths, datasets):
+            ref = dcmread(path)
+            assert ref == ds
+            assert ref.file_meta == ds.file_meta
+            assert path == ds.filename
+
+    @pytest.mark.parametrize("executor", ['process', 'thread'])
+    def test_unordered(self, executor):
+        """Test the datasets are returned as completed"""
+        datasets = list(
+            dcmread_many(self.paths, 2, executor, ordered=False)
+        )
+        assert sorted(self.paths) == sorted(ds.filename for ds in datasets)
+
+    def test_kwargs(self):
+        """Test keyword arguments are passed to dcmread()"""
+        for ds in dcmread_many(self.paths, stop_before_pixels=True):
+            assert 'PixelData' not in ds
+
+        for ds in dcmread_many(self.paths, 2, specific_tags=['PatientName']):
+            assert 0x00100010 in ds
+            assert 0x00100020 not in ds
+
+    @pytest.mark.parametrize("executor", ['process', 'thread'])
+    def test_pixel_data(self, executor):
+        """Test the pixel data values are returned correctly"""
+        ref = dcmread(ct_name)
+        for ds in dcmread_many([ct_name] * 3, 2, executor):
+            assert isinstance(ds.PixelData, bytes)
+            assert ref.PixelData == ds.PixelData
+
+        ref = dcmread(mr_name, defer_size=100)
+        for ds in dcmread_many([mr_name], 1, executor, defer_size=100):
+            assert ref.PixelData == ds.PixelData
+
+    def test_close_early(self):
+        """Test closing the generator before all the files are read"""
+        gen = dcmread_many(self.paths * 2, 2)
+        assert dcmread(ct_name) == next(gen)
+        gen.close()
+
+    def test_exception(self, tmp_path):
+        """Test exceptions raised while reading are re-raised"""
+        path = tmp_path / "invalid.dcm"
+        path.write_bytes(b"\x00" * 256)
+        gen = dcmread_many([ct_name, path], 2, 'thread')
+        assert dcmread(ct_name) == next(gen)
+        with pytest.raises(InvalidDicomError):
+            next(gen)
+
+    def test_invalid_executor_raises(self):
+        """Test an unknown executor raises an exception"""
+        msg = r"Invalid 'executor' value 'foo', must be 'process' or 'thread'"
+        with pytest.raises(ValueError, match=msg):
+            next(dcmread_many(self.paths, executor='foo'))
+
+    def test_mmap_process_raises(self):
+        """Test using mmap with worker processes raises an exception"""
+        msg = r"'mmap' can't be used with the 'process' executor"
+        with pytest.raises(ValueError, match=msg):
+            next(dcmread_many(self.paths, mmap=True))
+
+    def test_mmap_thread(self):
+        """Test using mmap with worker threads"""
+        for ds in dcmread_many([ct_name], executor='thread', mmap=True):
+            assert isinstance(ds.PixelData, memoryview)
+
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_shared(self):
+        """Test returning the bulk binary values in shared memory"""
+        datasets = list(dcmread_many(self.paths, 2, shared=True))
+        for path, ds in zip(self.paths, datasets):
+            ref = dcmread(path)
+            assert list(ref) == list(ds)
+            assert ref.file_meta == ds.file_meta
+
+        assert isinstance(datasets[0].PixelData, memoryview)
+        assert datasets[0].PixelData.readonly
+        assert 'CompressedSamples^CT1' == datasets[0].PatientName
+        assert hasattr(datasets[0], 'shared_memory')
+        # No bulk binary values
+        assert not hasattr(datasets[2], 'shared_memory')
+
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_shared_close(self):
+        """Test closing the shared memory of a dataset"""
+        ds = next(dcmread_many([ct_name], shared=True))
+        arr = ds.PixelData
+        shm = ds.shared_memory
+        with pytest.raises(BufferError):
+            shm.close()
+
+        del ds, arr
+        shm.close()
+
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_shared_views_outlive_dataset(self):
+        """Test the shared values remain valid after the dataset is freed"""
+        ds = next(dcmread_many([ct_name], shared=True))
+        value = ds.PixelData
+        del ds
+        assert dcmread(ct_name).PixelData == value
+
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_shared_copy_and_pickle(self):
+        """Test copying and pickling a dataset using shared memory"""
+        ds = next(dcmread_many([ct_name], shared=True))
+        for other in (
+            copy.deepcopy(ds),
+            pickle.loads(pickle.dumps(ds, 4)),
+            pickle.loads(pickle.dumps(ds, 5)),
+        ):
+            assert list(ds) == list(other)
+            assert not hasattr(other, 'shared_memory')
+
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_shared_close_early(self):
+        """Test closing the generator with shared memory"""
+        gen = dcmread_many(self.paths * 2, 2, shared=True)
+        assert list(dcmread(ct_name)) == list(next(gen))
+        gen.close()
+
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_shared_exception(self, tmp_path):
+        """Test exceptions raised while reading with shared memory"""
+        path = tmp_path / "invalid.dcm"
+        path.write_bytes(b"\x00" * 256)
+        gen = dcmread_many([path, ct_name], 2, shared=True)
+        with pytest.raises(InvalidDicomError):
+            next(gen)
+
+    def test_shared_thread(self):
+        """Test shared is ignored with worker threads"""
+        ds = next(dcmread_many([ct_name], executor='thread', shared=True))
+        assert isinstance(ds.PixelData, bytes)
+        assert not hasattr(ds, 'shared_memory')
+
+
+class TestMemoryMappedRead:
+    """Test reading with dcmread(mmap=True)"""
+    def test_bulk_values_are_views(self):
+        """Test bulk binary values are views and others are bytes"""
+        ds = dcmread(ct_name, mmap=True)
+        assert isinstance(ds.PixelData, memoryview)
+        assert 1 == ds['PixelData'].VM
+        assert isinstance(ds.get_item('PatientName').value, bytes)
+        assert ds.PatientName == 'CompressedSamples^CT1'
+
+    def test_values_identical(self):
+        """Test mapped values match a normal read"""
+        for fname in (ct_name, mr_name, rtplan_name, jpeg2000_name):
+            ds_norm = dcmread(fname)
+            ds_map = dcmread(fname, mmap=True)
+            assert Dataset.__eq__(ds_norm, ds_map)
+
+    def test_implicit_vr(self):
+        """Test implicit VR uses the dictionary VR for zero-copy values"""
+        ds = dcmread(get_testdata_file("MR_small_implicit.dcm"), mmap=True)
+        assert isinstance(ds.PixelData, memoryview)
+
+    def test_deferred(self):
+        """Test deferred reads also use the mapping"""
+        ds = dcmread(ct_name, mmap=True, defer_size=1024)
+        assert isinstance(ds.PixelData, memoryview)
+        assert 32768 == len(ds.PixelData)
+
+    def test_write(self):
+        """Test writing a mapped dataset is identical to the original"""
+        ds = dcmread(ct_name, mmap=True)
+        fp = BytesIO()
+        ds.save_as(fp)
+        with open(ct_name, 'rb') as f:
+            assert f.read() == fp.getvalue()
+
+    def test_copy_and_pickle(self):
+        """Test deep copying and pickling a mapped dataset"""
+        ref = dcmread(ct_name)
+        ds = dcmread(ct_name, mmap=True)
+        copied = copy.deepcopy(ds)
+        assert isinstance(copied.get_item('PixelData').value, bytes)
+        assert list(ref) == list(copied)
+
+        ds = dcmread(ct_name, mmap=True)
+        for protocol in (2, 4, pickle.HIGHEST_PROTOCOL):
+            unpickled = pickle.loads(pickle.dumps(ds, protocol=protocol))
+            assert list(ref) == list(unpickled)
+
+        # Converted elements
+        assert isinstance(ds.PixelData, memoryview)
+        assert isinstance(copy.deepcopy(ds).PixelData, bytes)
+        unpickled = pickle.loads(pickle.dumps(ds, protocol=4))
+        assert isinstance(unpickled.PixelData, bytes)
+        assert ref.PixelData == unpickled.PixelData
+
+    @pytest.mark.skipif(not have_numpy, reason="Numpy not available")
+    def test_pixel_array(self):
+        """Test the pixel data can be used without copying"""
+        from pydicom.pixel_data_handlers.numpy_handler import get_pixeldata
+
+        ds = dcmread(ct_name, mmap=True)
+        arr = get_pixeldata(ds, read_only=True)
+        assert not arr.flags.writeable
+        assert numpy.array_equal(
+            dcmread(ct_name).pixel_array, arr.reshape(128, 128)
+        )
+        assert numpy.array_equal(ds.pixel_array, arr.reshape(128, 128))
+
+    def test_filelike_raises(self):
+        """Test mmap with a file-like raises an exception"""
+        msg = r"'mmap' can only be used when 'fp' is a file path"
+        with open(ct_name, 'rb') as f:
+            with pytest.raises(ValueError, match=msg):
+                dcmread(f, mmap=True)
+
+
+class TestIncrementalParser:
+    """Test filereader.IncrementalParser"""
+    @staticmethod
+    def parse(data, size, **kwargs):
+        """Return the parser and elements after feeding `data` in chunks"""
+        parser = IncrementalParser(**kwargs)
+        elements = []
+        for offset in range(0, len(data), size):
+            elements.extend(parser.feed(data[offset:offset + size]))
+
+        elements.extend(parser.close())
+        return parser, elements
+
+    @staticmethod
+    def assert_matches(elements, ds):
+        """Assert the parsed elements match those read by dcmread()"""
+        assert list(ds._dict) == [elem.tag for elem in elements]
+        for elem in elements:
+            ref = ds._dict[elem.tag]
+            if isinstance(elem, DataElement):
+                assert str(ref.value) == str(elem.value)
+            elif isinstance(ref, DataElement):
+                # Undefined length sequences and converted elements
+                assert ref.VR == elem.VR
+                assert str(ref.value) == str(DataElement_from_raw(elem).value)
+            else:
+                assert ref == elem
+
+    @pytest.mark.parametrize("size", [1, 7, 4096])
+    def test_files(self, size):
+        """Test parsing files fed in chunks of different sizes"""
+        fnames = [
+            ct_name, rtplan_name, jpeg2000_name, deflate_name,
+            nested_priv_SQ_name, get_testdata_file("MR_small_bigendian.dcm"),
+            get_testdata_file("liver_1frame.dcm"),
+            get_testdata_file("reportsi.dcm"),
+        ]
+        for fname in fnames:
+            with open(fname, 'rb') as f:
+                data = f.read()
+
+            ds = dcmread(fname)
+            parser, elements = self.parse(data, size)
+            assert ds.preamble == parser.preamble
+            assert ds.file_meta == parser.file_meta
+            assert ds.is_implicit_VR == parser.is_implicit_VR
+            assert ds.is_little_endian == parser.is_little_endian
+            self.assert_matches(elements, ds)
+
+    def test_elements_returned_when_complete(self):
+        """Test elements are returned as soon as they're complete"""
+        ds = Dataset()
+        ds.PatientName = "Citizen^Jan"
+        ds.PatientID = "1234"
+        ds.BeamSequence = [Dataset(), Dataset()]
+        ds.BeamSequence[1].PatientID = "12345678"
+        ds['BeamSequence'].is_undefined_length = True
+        fp = DicomBytesIO()
+        fp.is_implicit_VR = False
+        fp.is_little_endian = True
+        write_dataset(fp, ds)
+        data = fp.getvalue()
+
+        parser = IncrementalParser(False, True)
+        # PatientName header and all but the last byte of the value
+        assert [] == parser.feed(data[:19])
+        elements = parser.feed(data[19:20])
+        assert [0x00100010] == [elem.tag for elem in elements]
+        assert 8 == elements[0].value_tell
+        # All but the last byte of the sequence delimiter
+        elements = parser.feed(data[20:-1])
+        assert [0x00100020] == [elem.tag for elem in elements]
+        assert 28 == elements[0].value_tell
+        elements = parser.feed(data[-1:])
+        assert [0x300A00B0] == [elem.tag for elem in elements]
+        assert "12345678" == elements[0].value[1].PatientID
+        assert [] == parser.close()
+
+    def test_dataset_only(self):
+        """Test parsing an encoded dataset without file meta"""
+        fname = get_testdata_file("MR_small_implicit.dcm")
+        ds = dcmread(fname)
+        fp = DicomBytesIO()
+        fp.is_implicit_VR = True
+        fp.is_little_endian = True
+        write_dataset(fp, ds)
+
+        parser, elements = self.parse(fp.getvalue(), 100, is_implicit_VR=True,
+                                      is_little_endian=True)
+        assert parser.preamble is None
+        assert 0 == len(parser.file_meta)
+        assert list(ds.keys()) == [elem.tag for elem in elements]
+
+    def test_encoding_arguments_raises(self):
+        """Test only one of the encoding arguments raises an exception"""
+        msg = (
+            r"'is_implicit_VR' and 'is_little_endian' must either both be "
+            r"used or both be None"
+        )
+        with pytest.raises(ValueError, match=msg):
+            IncrementalParser(is_implicit_VR=True)
+
+    def test_no_preamble(self):
+        """Test parsing data with no preamble"""
+        with open(explicit_vr_be_no_meta, 'rb') as f:
+            data = f.read()
+
+        msg = r"File is missing DICOM File Meta Information header"
+        with pytest.raises(InvalidDicomError, match=msg):
+            self.parse(data, 256)
+
+        ds = dcmread(explicit_vr_be_no_meta, force=True)
+        parser, elements = self.parse(data, 256, force=True)
+        assert parser.preamble is None
+        assert ds.is_implicit_VR == parser.is_implicit_VR
+        assert list(ds.keys()) == [elem.tag for elem in elements]
+
+    def test_specific_character_set(self):
+        """Test the character set is used for later elements"""
+        ds = Dataset()
+        ds.SpecificCharacterSet = "ISO_IR 192"
+        ds.ContentSequence = [Dataset()]
+        ds.ContentSequence[0].PatientName = "Buc^J\u00e9r\u00f4me"
+        ds['ContentSequence'].is_undefined_length = True
+        fp = DicomBytesIO()
+        fp.is_implicit_VR = True
+        fp.is_little_endian = True
+        write_dataset(fp, ds)
+
+        parser, elements = self.parse(fp.getvalue(), 3, is_implicit_VR=True,
+                                      is_little_endian=True)
+        assert "Buc^J\u00e9r\u00f4me" == elements[1].value[0].PatientName
+
+    def test_truncated_warns(self):
+        """Test a warning is issued for an incomplete element"""
+        with open(ct_name, 'rb') as f:
+            data = f.read()[:-1000]
+
+        msg = (
+            r"End of data reached with 31918 bytes of an incomplete element "
+            r"at position 6288"
+        )
+        parser = IncrementalParser()
+        elements = parser.feed(data)
+        with pytest.warns(UserWarning, match=msg):
+            assert [] == parser.close()
+
+        assert 0x0043104E == elements[-1].tag
+
+    def test_truncated_raises(self, enforce_valid_values):
+        """Test an exception is raised for an incomplete element"""
+        with open(ct_name, 'rb') as f:
+            data = f.read()[:-1000]
+
+        parser = IncrementalParser()
+        parser.feed(data)
+        msg = (
+            r"End of data reached with 31918 bytes of an incomplete element "
+            r"at position 6288"
+        )
+        with pytest.raises(EOFError, match=msg):
+            parser.close()
+
+
+class ChunkedStream:
+    """Minimal asynchronous stream that returns data in small chunks"""
+    def __init__(self, data, size):
+        self.data = data
+        self.size = size
+        self.position = 0
+
+    async def read(self, n=-1):
+        n = self.size if n < 0 else min(n, self.size)
+        data = self.data[self.position:self.position + n]
+        self.position += len(data)
+        return data
+
+
+class TestDcmreadAsync:
+    """Test filereader.dcmread_async"""
+    @staticmethod
+    def read(fname, **kwargs):
+        """Return the dataset read from `fname` using a StreamReader"""
+        with open(fname, 'rb') as f:
+            data = f.read()
+
+        async def _read():
+            stream = asyncio.StreamReader()
+            stream.feed_data(data)
+            stream.feed_eof()
+            return await dcmread_async(stream, **kwargs)
+
+        return asyncio.run(_read())
+
+    def test_read(self):
+        """Test reading matches dcmread()"""
+        fnames = [
+            ct_name, rtplan_name, deflate_name, nested_priv_SQ_name,
+            get_testdata_file("MR_small_bigendian.dcm"),
+        ]
+        for fname in fnames:
+            ref = dcmread(fname)
+            ds = self.read(fname, chunk_size=100)
+            assert Dataset.__eq__(ref, ds)
+            assert ref.file_meta == ds.file_meta
+            assert ref.preamble == ds.preamble
+            assert ref.is_implicit_VR == ds.is_implicit_VR
+            assert ref.is_little_endian == ds.is_little_endian
+            assert ref.read_encoding == ds.read_encoding
+
+    def test_stop_before_pixels(self):
+        """Test the stream isn't read past the start of the pixel data"""
+        with open(ct_name, 'rb') as f:
+            stream = ChunkedStream(f.read(), 1000)
+
+        ds = asyncio.run(dcmread_async(stream, stop_before_pixels=True))
+        assert 'PixelData' not in ds
+        assert Dataset.__eq__(dcmread(ct_name, stop_before_pixels=True), ds)
+        assert 7000 == stream.position
+
+    def test_specific_tags(self):
+        """Test reading stops after the last wanted element"""
+        with open(ct_name, 'rb') as f:
+            stream = ChunkedStream(f.read(), 1000)
+
+        tags = ["PatientName", 0x00100020]
+        ds = asyncio.run(dcmread_async(stream, specific_tags=tags))
+        assert [0x00080005, 0x00100010, 0x00100020] == list(ds.keys())
+        assert Dataset.__eq__(dcmread(ct_name, specific_tags=tags), ds)
+        assert 1000 == stream.position
+
+    def test_no_preamble_raises(self):
+        """Test reading non-conformant data requires force"""
+        msg = r"File is missing DICOM File Meta Information header"
+        with pytest.raises(InvalidDicomError, match=msg):
+            self.read(explicit_vr_be_no_meta)
+
+        ds = self.read(explicit_vr_be_no_meta, force=True)
+        ref = dcmread(explicit_vr_be_no_meta, force=True)
+        assert Dataset.__eq__(ref, ds)
+
+    def test_empty(self):
+        """Test reading an empty stream"""
+        ds = asyncio.run(dcmread_async(ChunkedStream(b"", 1), force=True))
+        assert 0 == len(ds)
+        assert ds.preamble is None
+
+
 class TestReadTruncatedFile:
     def testReadFileWithMissingPixelData(self):
         mr = dcmread(truncated_mr_name)
@@ -5,7 +5,11 @@ from pathlib import Path
 
 import pytest
 
-from pydicom.fileutil import path_from_pathlike
+from pydicom.filebase import DicomMemoryMap
+from pydicom.fileutil import (
+    path_from_pathlike, find_bytes, read_undefined_length_value
+)
+from pydicom.tag import SequenceDelimiterTag, ItemDelimiterTag
 
 
 class PathLike:
@@ -32,3 +36,123 @@ class TestPathFromPathLike:
 
     def test_path_like(self):
         assert 'test.dcm' == path_from_pathlike(PathLike('test.dcm'))
+
+
+# Little endian (FFFE,E0DD) Sequence Delimitation Item and its length
+DELIMITER = b"\xFE\xFF\xDD\xE0\x00\x00\x00\x00"
+
+
+class TestFindBytes:
+    """Test fileutil.find_bytes"""
+    @pytest.mark.parametrize("read_size", [1, 2, 3, 128])
+    def test_found(self, read_size):
+        """Test finding bytes across read boundaries"""
+        for length in range(20):
+            fp = BytesIO(b"\x01" * length + b"\xFE\xFF\xDD\xE0" + b"\x00")
+            assert length == find_bytes(fp, b"\xFE\xFF\xDD\xE0", read_size)
+            assert 0 == fp.tell()
+
+            assert length == find_bytes(
+                fp, b"\xFE\xFF\xDD\xE0", read_size, rewind=False
+            )
+            assert length + 4 == fp.tell()
+
+    def test_not_found(self):
+        """Test not finding the bytes"""
+        fp = BytesIO(b"\x00" * 1000)
+        fp.seek(10)
+        assert find_bytes(fp, b"\xFE\xFF") is None
+        assert 10 == fp.tell()
+        assert find_bytes(fp, b"\xFE\xFF", rewind=False) is None
+        assert 1000 == fp.tell()
+
+    def test_large(self):
+        """Test the read size grows for large searches"""
+        fp = BytesIO(b"\x00" * 10_000_000 + b"\xFE\xFF")
+        reads = []
+        fp_read = fp.read
+        fp.read = lambda size: reads.append(size) or fp_read(size)
+        assert 10_000_000 == find_bytes(fp, b"\xFE\xFF")
+        assert len(reads) < 25
+        assert 4 * 1024 * 1024 == max(reads)
+
+    def test_memory_map(self, tmp_path):
+        """Test searching a memory-mapped file"""
+        path = tmp_path / "test"
+        path.write_bytes(b"\x00" * 1000 + b"\xFE\xFF")
+        with DicomMemoryMap(str(path)) as fp:
+            fp.seek(10)
+            assert 1000 == find_bytes(fp, b"\xFE\xFF")
+            assert 10 == fp.tell()
+            assert find_bytes(fp, b"\xFF\xFE", rewind=False) is None
+            assert 1002 == fp.tell()
+
+
+class TestReadUndefinedLengthValue:
+    """Test fileutil.read_undefined_length_value"""
+    @pytest.mark.parametrize("read_size", [1, 3, 8192])
+    def test_read(self, read_size):
+        """Test reading values across read boundaries"""
+        for length in (0, 1, 7, 8, 9, 100_000):
+            value = b"\x01\xFE\xFF" * length
+            fp = BytesIO(b"\x00" + value + DELIMITER + b"\x02")
+            fp.seek(1)
+            assert value == read_undefined_length_value(
+                fp, True, SequenceDelimiterTag, read_size=read_size
+            )
+            assert len(value) + 9 == fp.tell()
+
+    def test_big_endian(self):
+        """Test reading a big endian value"""
+        fp = BytesIO(b"\x01" * 10 + b"\xFF\xFE\xE0\xDD\x00\x00\x00\x00")
+        assert b"\x01" * 10 == read_undefined_length_value(
+            fp, False, SequenceDelimiterTag
+        )
+        assert 18 == fp.tell()
+
+    def test_defer_size(self):
+        """Test values at least `defer_size` long aren't read"""
+        value = b"\x01" * 100_000
+        fp = BytesIO(value + DELIMITER)
+        assert read_undefined_length_value(
+            fp, True, SequenceDelimiterTag, defer_size=100_000, read_size=8
+        ) is None
+        assert 100_008 == fp.tell()
+
+        fp.seek(0)
+        assert value == read_undefined_length_value(
+            fp, True, SequenceDelimiterTag, defer_size=100_001, read_size=8
+        )
+
+    def test_no_delimiter_raises(self):
+        """Test an exception is raised if there's no delimiter"""
+        fp = BytesIO(b"\x01" * 100)
+        fp.seek(10)
+        msg = r"End of file reached before delimiter \(fffe, e00d\) found"
+        with pytest.raises(EOFError, match=msg):
+            read_undefined_length_value(fp, True, ItemDelimiterTag)
+
+        assert 10 == fp.tell()
+
+    def test_memory_map(self, tmp_path):
+        """Test reading from a memory-mapped file"""
+        path = tmp_path / "test"
+        value = b"\x01\xFE\xFF" * 1000
+        path.write_bytes(b"\x00" + value + DELIMITER + b"\x02")
+        with DicomMemoryMap(str(path)) as fp:
+            fp.seek(1)
+            assert value == read_undefined_length_value(
+                fp, True, SequenceDelimiterTag
+            )
+            assert len(value) + 9 == fp.tell()
+
+            fp.seek(1)
+            assert read_undefined_length_value(
+                fp, True, SequenceDelimiterTag, defer_size=100
+            ) is None
+            assert len(value) + 9 == fp.tell()
+
+            fp.seek(len(value) + 1)
+            msg = r"End of file reached before delimiter"
+            with pytest.raises(EOFError, match=msg):
+                read_undefined_length_value(fp, True, ItemDelimiterTag)
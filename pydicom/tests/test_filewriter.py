@@ -15,20 +15,27 @@ import zlib
 
 import pytest
 
+import pydicom
 from pydicom._storage_sopclass_uids import CTImageStorage
 from pydicom import config, __version_info__, uid
+from pydicom.config import have_numpy
 from pydicom.data import get_testdata_file, get_charset_files
 from pydicom.dataset import Dataset, FileDataset, FileMetaDataset
+from pydicom.encaps import (
+    encapsulate, encapsulate_extended, generate_pixel_data_frame
+)
 from pydicom.dataelem import DataElement, RawDataElement
-from pydicom.filebase import DicomBytesIO
+from pydicom.filebase import DicomBytesIO, DicomFileLike
 from pydicom.filereader import dcmread, read_dataset, read_file
 from pydicom.filewriter import (
     write_data_element, write_dataset, correct_ambiguous_vr,
     write_file_meta_info, correct_ambiguous_vr_element, write_numbers,
-    write_PN, _format_DT, write_text, write_OWvalue
+    write_PN, _format_DT, write_text, write_OWvalue, patch_in_place,
+    EncapsulatedFrameWriter
 )
 from pydicom.multival import MultiValue
 from pydicom.sequence import Sequence
+from pydicom.tag import Tag
 from pydicom.uid import (ImplicitVRLittleEndian, ExplicitVRBigEndian,
                          PYDICOM_IMPLEMENTATION_UID)
 from pydicom.util.hexutil import hex2bytes
@@ -36,6 +43,9 @@ from pydicom.valuerep import DA, DT, TM
 from pydicom.values import convert_text
 from ._write_stds import impl_LE_deflen_std_hex
 
+if have_numpy:
+    import numpy
+
 rtplan_name = get_testdata_file("rtplan.dcm")
 rtdose_name = get_testdata_file("rtdose.dcm")
 ct_name = get_testdata_file("CT_small.dcm")
@@ -43,6 +53,8 @@ mr_name = get_testdata_file("MR_small.dcm")
 mr_implicit_name = get_testdata_file("MR_small_implicit.dcm")
 mr_bigendian_name = get_testdata_file("MR_small_bigendian.dcm")
 jpeg_name = get_testdata_file("JPEG2000.dcm")
+rtstruct_name = get_testdata_file("rtstruct.dcm")
+rle_name = get_testdata_file("SC_rgb_rle_2frame.dcm")
 no_ts = get_testdata_file("meta_missing_tsyntax.dcm")
 color_pl_name = get_testdata_file("color-pl.dcm")
 sc_rgb_name = get_testdata_file("SC_rgb.dcm")
@@ -727,6 +739,51 @@ class TestWriteDataElement:
                                  "Representation 'ZZ'"):
             write_data_element(fp, elem)
 
+    def test_write_bytes_not_copied(self):
+        """Test bytes-like values are written without being copied"""
+        written = []
+
+        class Writer(BytesIO):
+            def write(self, b):
+                written.append(b)
+                return super().write(b)
+
+        for value in (b'\x00\x01' * 8, memoryview(b'\x00\x01' * 8)):
+            for elem in (
+                DataElement(0x7fe00010, 'OW', value),
+                RawDataElement(
+                    Tag(0x7fe00010), 'OW', 16, value, 0, False, True
+                ),
+            ):
+                written.clear()
+                fp = DicomFileLike(Writer())
+                fp.is_little_endian = True
+                fp.is_implicit_VR = False
+                write_data_element(fp, elem)
+                assert value is written[-1]
+                assert (
+                    b'\xe0\x7f\x10\x00OW\x00\x00\x10\x00\x00\x00'
+                    + b'\x00\x01' * 8
+                ) == fp.parent.getvalue()
+
+    def test_write_sequence_nested(self):
+        """Test writing nested sequences"""
+        ds = Dataset()
+        ds.BeamSequence = [Dataset()]
+        item = ds.BeamSequence[0]
+        item.BeamName = 'Beam'
+        item.ControlPointSequence = [Dataset(), Dataset()]
+        item.ControlPointSequence[0].NominalBeamEnergy = 6
+        item.ControlPointSequence[1].EncapsulatedDocument = b'\x00\x01'
+        elem = ds['BeamSequence']
+        elem.is_undefined_length = False
+        encoded = self.encode_element(elem, False, True)
+        fp = DicomBytesIO(encoded)
+        fp.is_little_endian = True
+        fp.is_implicit_VR = False
+        assert ds == read_dataset(fp, False, True)
+        assert len(encoded) - 12 == unpack('<L', encoded[8:12])[0]
+
 
 class TestCorrectAmbiguousVR:
     """Test correct_ambiguous_vr."""
@@ -2339,6 +2396,42 @@ class TestWriteNumbers:
         write_numbers(fp, elem, fmt)
         assert fp.getvalue() == b'\x00\x01'
 
+    @pytest.mark.skipif(not have_numpy, reason="numpy not installed")
+    def test_write_ndarray(self):
+        """Test writing an element value that's an ndarray"""
+        elem = DataElement(0x00280106, 'US', numpy.asarray([1, 2, 3]))
+        fp = DicomBytesIO()
+        fp.is_little_endian = True
+        write_numbers(fp, elem, 'H')
+        assert fp.getvalue() == b'\x01\x00\x02\x00\x03\x00'
+
+        fp = DicomBytesIO()
+        fp.is_little_endian = False
+        write_numbers(fp, elem, 'H')
+        assert fp.getvalue() == b'\x00\x01\x00\x02\x00\x03'
+
+    @pytest.mark.skipif(not have_numpy, reason="numpy not installed")
+    def test_write_numbers_numpy(self):
+        """Test writing values read with use_numbers_numpy"""
+        original = config.use_numbers_numpy
+        config.use_numbers_numpy = True
+        try:
+            ds = dcmread(get_testdata_file('CT_small.dcm'))
+            ds.decode_all()
+        finally:
+            config.use_numbers_numpy = original
+
+        assert any(
+            isinstance(elem.value, numpy.ndarray) for elem in ds.iterall()
+        )
+        fp = DicomBytesIO()
+        ds.save_as(fp, write_like_original=True)
+        ref = DicomBytesIO()
+        dcmread(get_testdata_file('CT_small.dcm')).save_as(
+            ref, write_like_original=True
+        )
+        assert ref.getvalue() == fp.getvalue()
+
 
 class TestWriteOtherVRs:
     """Tests for writing the 'O' VRs like OB, OW, OF, etc."""
@@ -2713,3 +2806,362 @@ class TestWriteUndefinedLengthPixelData:
         self.fp.seek(0)
         ds = read_dataset(self.fp, False, False)
         assert 'UN' == ds[0x30040058].VR
+
+
+class TestWriteUnchangedElements:
+    """Tests for writing deferred elements and raw sequences unchanged."""
+    def write(self, ds, path=None):
+        """Return `ds` written like the original to `path` or a buffer."""
+        if path is None:
+            fp = DicomBytesIO()
+            ds.save_as(fp, write_like_original=True)
+            return fp.getvalue()
+
+        ds.save_as(path, write_like_original=True)
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_deferred_copied(self, tmp_path):
+        """Test deferred elements are copied from the original file."""
+        ds = dcmread(ct_name)
+        ds.PatientName = 'Citizen^Jan'
+        expected = self.write(ds)
+
+        ds = dcmread(ct_name, defer_size=1024)
+        ds.PatientName = 'Citizen^Jan'
+        assert expected == self.write(ds, os.fspath(tmp_path / 'out.dcm'))
+        assert expected == self.write(ds)
+        # The deferred value wasn't read into the dataset
+        assert ds._dict[0x7fe00010].value is None
+
+    def test_deferred_copied_in_chunks(self, tmp_path, monkeypatch):
+        """Test copying deferred elements without os.copy_file_range()."""
+        monkeypatch.delattr(os, 'copy_file_range', raising=False)
+        monkeypatch.setattr(pydicom.filereader, '_COPY_CHUNK_SIZE', 1000)
+        expected = self.write(dcmread(ct_name))
+        ds = dcmread(ct_name, defer_size=1024)
+        assert expected == self.write(ds, os.fspath(tmp_path / 'out.dcm'))
+        assert ds._dict[0x7fe00010].value is None
+
+    def test_deferred_different_encoding(self):
+        """Test deferred elements are read if the encoding has changed."""
+        ds = dcmread(ct_name, defer_size=1024)
+        ds.is_implicit_VR = True
+        ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+        ds = dcmread(DicomBytesIO(self.write(ds)))
+        assert dcmread(ct_name).PixelData == ds.PixelData
+        assert ds.is_implicit_VR
+
+    def test_deferred_truncated(self, tmp_path):
+        """Test deferred values past the end of the file are read."""
+        names = ('MR_truncated.dcm', 'rtplan_truncated.dcm', 'no_meta.dcm')
+        for name in names:
+            name = get_testdata_file(name)
+            # Read the deferred values the same way as when writing
+            ds = dcmread(name, force=True, defer_size=64)
+            for tag in ds.keys():
+                ds.get_item(tag)
+
+            expected = self.write(ds)
+            ds = dcmread(name, force=True, defer_size=64)
+            path = os.fspath(tmp_path / 'out.dcm')
+            assert expected == self.write(ds, path)
+            assert expected == self.write(ds)
+
+    def test_deferred_changed_file_raises(self, tmp_path):
+        """Test an exception is raised if the original file has changed."""
+        path = os.fspath(tmp_path / 'in.dcm')
+        with open(ct_name, 'rb') as f:
+            data = f.read()
+
+        with open(path, 'wb') as f:
+            f.write(data)
+
+        ds = dcmread(path, defer_size=1024)
+        offset = ds._dict[0x7fe00010].value_tell - 12
+        with open(path, 'wb') as f:
+            f.write(data[:offset] + b'\x00' * 4 + data[offset + 4:])
+
+        msg = "Deferred read tag .* does not match original"
+        with pytest.warns(UserWarning, match="modification time"):
+            with pytest.raises(ValueError, match=msg):
+                self.write(ds)
+
+    def test_raw_sequences(self, monkeypatch):
+        """Test undefined length sequences are written unchanged."""
+        for name in (rtstruct_name, get_testdata_file("reportsi.dcm")):
+            ds = dcmread(name, force=True)
+            ds.PatientID = 'Anonymous'
+            expected = self.write(ds)
+
+            ds = dcmread(name, force=True, raw_sequences=True)
+            ds.PatientID = 'Anonymous'
+            with monkeypatch.context() as m:
+                m.setitem(pydicom.filewriter.writers, 'SQ', None)
+                assert expected == self.write(ds)
+
+            ds = dcmread(name, force=True, raw_sequences=True)
+            ds.PatientID = 'Anonymous'
+            ds.decode_all()
+            assert expected == self.write(ds)
+
+
+class TestPatchInPlace:
+    """Tests for patch_in_place()."""
+    def copy(self, src, tmp_path):
+        """Return the path to a copy of `src` and its original contents."""
+        path = os.fspath(tmp_path / 'patched.dcm')
+        with open(src, 'rb') as f:
+            data = f.read()
+
+        with open(path, 'wb') as f:
+            f.write(data)
+
+        return path, data
+
+    def test_patch(self, tmp_path):
+        """Test patching elements in an explicit VR file."""
+        path, original = self.copy(ct_name, tmp_path)
+        patch_in_place(path, {
+            'PatientID': 'ANON',
+            0x00100010: 'Citizen^Jan',
+            'SOPInstanceUID': '1.2.3',
+            'Rows': 64,
+        })
+        ds = dcmread(path)
+        assert 'ANON' == ds.PatientID
+        assert 'Citizen^Jan' == ds.PatientName
+        assert '1.2.3' == ds.SOPInstanceUID
+        assert 64 == ds.Rows
+
+        # Only the patched values have changed
+        with open(path, 'rb') as f:
+            patched = bytearray(f.read())
+
+        assert len(original) == len(patched)
+        ds = dcmread(ct_name, defer_size=0)
+        for tag in (0x00100020, 0x00100010, 0x00080018, 0x00280010):
+            elem = ds._dict[tag]
+            start = elem.value_tell
+            patched[start:start + elem.length] = (
+                original[start:start + elem.length]
+            )
+
+        assert original == patched
+
+    def test_patch_implicit(self, tmp_path):
+        """Test patching elements in an implicit VR file."""
+        path, original = self.copy(rtplan_name, tmp_path)
+        patch_in_place(path, {'PatientID': 'anon', 'PatientName': ''})
+        ds = dcmread(path)
+        assert 'anon' == ds.PatientID
+        assert '' == ds.PatientName
+        assert dcmread(rtplan_name).RTPlanLabel == ds.RTPlanLabel
+
+        # Sequences in implicit VR datasets have no VR until converted
+        with open(path, 'rb') as f:
+            original = f.read()
+
+        msg = r"tag \(300a, 00b0\) as it's a sequence"
+        with pytest.raises(ValueError, match=msg):
+            patch_in_place(path, {'BeamSequence': b'\x00' * 8})
+
+        with open(path, 'rb') as f:
+            assert original == f.read()
+
+    def test_patch_too_long_raises(self, tmp_path):
+        """Test the file is unchanged if a value doesn't fit."""
+        path, original = self.copy(ct_name, tmp_path)
+        msg = (
+            r"Unable to patch the element with tag \(0010, 0020\) as its new "
+            r"value has an encoded length of 10 bytes and the existing value "
+            r"is 4 bytes long"
+        )
+        with pytest.raises(ValueError, match=msg):
+            patch_in_place(
+                path, {'PatientName': 'A', 'PatientID': 'ABCDEFGHIJ'}
+            )
+
+        msg = r"its new value has an encoded length of 4 bytes"
+        with pytest.raises(ValueError, match=msg):
+            patch_in_place(path, {'Rows': [1, 2]})
+
+        with open(path, 'rb') as f:
+            assert original == f.read()
+
+    def test_patch_invalid_element_raises(self, tmp_path):
+        """Test patching missing elements and sequences raises."""
+        path, original = self.copy(ct_name, tmp_path)
+        with pytest.raises(KeyError, match=r"\(0010, 4000\) is not in"):
+            patch_in_place(path, {'PatientComments': 'None'})
+
+        with pytest.raises(KeyError, match=r"\(0002, 0010\) is not in"):
+            patch_in_place(path, {'TransferSyntaxUID': '1.2'})
+
+        msg = r"tag \(0010, 1002\) as it's a sequence"
+        with pytest.raises(ValueError, match=msg):
+            patch_in_place(path, {'OtherPatientIDsSequence': []})
+
+        with open(path, 'rb') as f:
+            assert original == f.read()
+
+    def test_patch_deflated_raises(self, tmp_path):
+        """Test patching a deflated dataset raises."""
+        path, original = self.copy(deflate_name, tmp_path)
+        with pytest.raises(ValueError, match="Unable to patch a dataset"):
+            patch_in_place(path, {'PatientID': 'A'})
+
+
+class TestEncapsulatedFrameWriter:
+    """Tests for EncapsulatedFrameWriter."""
+    def setup_method(self):
+        self.ds = dcmread(rle_name)
+        self.frames = list(generate_pixel_data_frame(self.ds.PixelData, 2))
+        del self.ds.PixelData
+
+    def reference(self, ds):
+        """Return `ds` written like the original."""
+        fp = DicomBytesIO()
+        ds.save_as(fp, write_like_original=True)
+        return fp.getvalue()
+
+    def test_basic_offset_table(self, tmp_path):
+        """Test writing frames with the Basic Offset Table."""
+        path = os.fspath(tmp_path / 'out.dcm')
+        with EncapsulatedFrameWriter(path, self.ds) as writer:
+            writer.write_frames(frame for frame in self.frames)
+
+        self.ds.add_new('PixelData', 'OB', encapsulate(self.frames))
+        with open(path, 'rb') as f:
+            assert self.reference(self.ds) == f.read()
+
+    def test_extended_offset_table(self):
+        """Test writing frames with the Extended Offset Table."""
+        fp = DicomBytesIO()
+        writer = EncapsulatedFrameWriter(
+            fp, self.ds, extended_offset_table=True
+        )
+        for frame in self.frames:
+            writer.write_frame(frame)
+
+        writer.close()
+        pixel_data, offsets, lengths = encapsulate_extended(self.frames)
+        self.ds.add_new('PixelData', 'OB', pixel_data)
+        self.ds.ExtendedOffsetTable = offsets
+        self.ds.ExtendedOffsetTableLengths = lengths
+        assert self.reference(self.ds) == fp.getvalue()
+
+        ds = dcmread(BytesIO(fp.getvalue()))
+        assert offsets == ds.ExtendedOffsetTable
+        assert lengths == ds.ExtendedOffsetTableLengths
+
+    def test_odd_length_and_trailing_elements(self):
+        """Test odd length frames are padded and elements after Pixel Data
+        are written.
+        """
+        self.ds.NumberOfFrames = 3
+        self.ds.DataSetTrailingPadding = b'\x00' * 4
+        frames = [b'\x01\x02\x03', b'\x04', b'\x05\x06']
+        fp = DicomBytesIO()
+        with EncapsulatedFrameWriter(fp, self.ds) as writer:
+            writer.write_frames(iter(frames))
+
+        ds = dcmread(BytesIO(fp.getvalue()))
+        assert b'\x00' * 4 == ds.DataSetTrailingPadding
+        assert [b'\x01\x02\x03\x00', b'\x04\x00', b'\x05\x06'] == list(
+            generate_pixel_data_frame(ds.PixelData, 3)
+        )
+        assert 'DataSetTrailingPadding' in self.ds
+
+    def test_wrong_number_of_frames_raises(self):
+        """Test writing the wrong number of frames raises."""
+        writer = EncapsulatedFrameWriter(DicomBytesIO(), self.ds, nr_frames=1)
+        writer.write_frame(self.frames[0])
+        msg = "Unable to write more than the expected 1 frames"
+        with pytest.raises(ValueError, match=msg):
+            writer.write_frame(self.frames[1])
+
+        writer = EncapsulatedFrameWriter(DicomBytesIO(), self.ds)
+        writer.write_frame(self.frames[0])
+        msg = "Only 1 of the expected 2 frames have been written"
+        with pytest.raises(ValueError, match=msg):
+            writer.close()
+
+    def test_uncompressed_raises(self):
+        """Test an uncompressed transfer syntax raises."""
+        self.ds.file_meta.TransferSyntaxUID = ImplicitVRLittleEndian
+        msg = "Unable to write encapsulated frames unless the dataset has a"
+        with pytest.raises(ValueError, match=msg):
+            EncapsulatedFrameWriter(DicomBytesIO(), self.ds)
+
+
+class TestWriteDeflated:
+    """Tests for streaming the deflated dataset as it's written."""
+    def write(self, ds):
+        """Return the deflated part of `ds` written like the original."""
+        fp = BytesIO()
+        ds.save_as(fp, write_like_original=True)
+        return fp.getvalue()[0x14e:]
+
+    def test_streamed(self, monkeypatch):
+        """Test the dataset is deflated as it's written."""
+        ds = dcmread(deflate_name)
+        with open(deflate_name, 'rb') as f:
+            f.seek(0x14e)
+            expected = zlib.decompress(f.read(), -zlib.MAX_WBITS)
+
+        # Data is compressed in chunks rather than all at once
+        deflater = pydicom.filewriter._DeflatedFileLike
+        compressed = []
+        original = deflater._write_deflated
+
+        def write_deflated(self, data):
+            compressed.append(memoryview(data).nbytes)
+            original(self, data)
+
+        monkeypatch.setattr(deflater, '_write_deflated', write_deflated)
+        monkeypatch.setattr(deflater, 'chunk_size', 64)
+        deflated = self.write(ds)
+        assert expected == zlib.decompress(deflated, -zlib.MAX_WBITS)
+        assert 0 == len(deflated) % 2
+        assert len(expected) == sum(compressed)
+        assert len(compressed) > 2
+        assert max(compressed) < len(ds.PixelData) + 64
+
+    def test_deflate_level(self, monkeypatch):
+        """Test setting the compression level."""
+        ds = dcmread(deflate_name)
+        monkeypatch.setattr(config, 'deflate_level', 9)
+        best = self.write(ds)
+        monkeypatch.setattr(config, 'deflate_level', 0)
+        stored = self.write(ds)
+        assert len(stored) > len(best)
+        assert zlib.decompress(best, -zlib.MAX_WBITS) == (
+            zlib.decompress(stored, -zlib.MAX_WBITS)
+        )
+
+    def test_sequence_items_streamed(self, monkeypatch):
+        """Test undefined length sequences are written an item at a time."""
+        ds = dcmread(deflate_name)
+        ds.ReferencedImageSequence = [Dataset() for _ in range(3)]
+        for ii, item in enumerate(ds.ReferencedImageSequence):
+            item.ReferencedSOPInstanceUID = f'1.2.3.{ii}' * 50
+
+        ds['ReferencedImageSequence'].is_undefined_length = True
+        deflater = pydicom.filewriter._DeflatedFileLike
+        written = []
+        original = deflater.write
+
+        def write(self, data):
+            written.append(memoryview(data).nbytes)
+            return original(self, data)
+
+        monkeypatch.setattr(deflater, 'write', write)
+        fp = BytesIO()
+        ds.save_as(fp, write_like_original=True)
+        fp.seek(0)
+        assert ds.ReferencedImageSequence == (
+            dcmread(fp).ReferencedImageSequence
+        )
+        # 8 byte item header, 8 byte element header and 350 byte value
+        assert 3 == written.count(366)
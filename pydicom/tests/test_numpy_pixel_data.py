@@ -26,9 +26,12 @@ There are the following possibilities:
 * PlanarConfiguration
 """
 
+import pickle
+
 import pytest
 
 from pydicom import config
+from pydicom.dataelem import HAVE_PICKLE_BUFFER
 from pydicom.data import get_testdata_file
 from pydicom.dataset import Dataset, FileMetaDataset
 from pydicom.filereader import dcmread
@@ -1085,6 +1088,19 @@ class TestNumpy_NumpyHandler:
         assert 0 == arr[0, 0]
         assert arr.flags.writeable
 
+    @pytest.mark.skipif(not HAVE_PICKLE_BUFFER, reason="Python < 3.8")
+    def test_pickle_out_of_band(self):
+        """Test pickling the pixel data and array out-of-band."""
+        ds = dcmread(EXPL_16_1_1F)
+        arr = ds.pixel_array
+        buffers = []
+        s = pickle.dumps(ds, protocol=5, buffer_callback=buffers.append)
+        assert arr.nbytes < len(s) + sum(len(b.raw()) for b in buffers)
+        assert len(s) < arr.nbytes
+        ds1 = pickle.loads(s, buffers=buffers)
+        assert np.array_equal(arr, ds1._pixel_array)
+        assert np.array_equal(arr, ds1.pixel_array)
+
 
 # Tests for numpy_handler module with Numpy available
 @pytest.mark.skipif(not HAVE_NP, reason='Numpy is not available')
@@ -4,12 +4,17 @@
 
 import pytest
 
+from pydicom import config
+from pydicom.config import have_numpy
 from pydicom.tag import Tag
 from pydicom.values import (
     convert_value, converters, convert_tag, convert_ATvalue, convert_DA_string,
-    convert_text, convert_single_string, convert_AE_string
+    convert_text, convert_single_string, convert_AE_string, convert_numbers
 )
 
+if have_numpy:
+    import numpy
+
 
 class TestConvertTag:
     def test_big_endian(self):
@@ -201,3 +206,57 @@ class TestConvertOValues:
         """Test converting OF."""
         fp = b'\x00\x01\x02\x03'
         assert b'\x00\x01\x02\x03' == converters['OF'](fp, True)
+
+
+class TestConvertNumbers:
+    """Test converting the binary numeric VRs."""
+    @pytest.fixture(autouse=True)
+    def restore_config_values(self):
+        original = config.use_numbers_numpy
+        yield
+        config.use_numbers_numpy = original
+
+    def test_convert_numbers(self):
+        """Test the default conversion to Python numbers."""
+        config.use_numbers_numpy = False
+        assert '' == convert_numbers(b'', True, 'H')
+        assert 1 == convert_numbers(b'\x01\x00', True, 'H')
+        assert [1, 2] == convert_numbers(b'\x00\x01\x00\x02', False, 'H')
+        assert [-1, 2] == convert_numbers(
+            b'\xff\xff\xff\xff\x02\x00\x00\x00', True, 'l'
+        )
+
+    @pytest.mark.skipif(not have_numpy, reason="numpy not installed")
+    def test_convert_numbers_numpy(self):
+        """Test conversion to numpy views with use_numbers_numpy."""
+        config.use_numbers_numpy = True
+        # Single values aren't returned as arrays
+        value = convert_numbers(b'\x01\x00', True, 'H')
+        assert 1 == value
+        assert isinstance(value, int)
+
+        byte_string = b'\x00\x01\x00\x02'
+        value = convert_numbers(byte_string, False, 'H')
+        assert isinstance(value, numpy.ndarray)
+        assert [1, 2] == value.tolist()
+        assert not value.flags.writeable
+        # The array is a view of the encoded value
+        assert value.base is byte_string
+
+        value = convert_numbers(bytearray(byte_string), True, 'H')
+        assert [256, 512] == value.tolist()
+        assert not value.flags.writeable
+
+        for fmt, dtype in (('l', 'int32'), ('L', 'uint32'), ('d', 'float64')):
+            value = convert_numbers(b'\x00' * 16, True, fmt)
+            assert dtype == value.dtype
+            assert 16 // value.itemsize == len(value)
+
+    @pytest.mark.skipif(have_numpy, reason="Testing import error")
+    def test_convert_numbers_numpy_import_error(self):
+        """Test use_numbers_numpy without numpy raises an exception."""
+        config.use_numbers_numpy = True
+        assert 1 == convert_numbers(b'\x01\x00', True, 'H')
+        msg = "use_numbers_numpy set but numpy not installed"
+        with pytest.raises(ImportError, match=msg):
+            convert_numbers(b'\x00\x01\x00\x02', False, 'H')
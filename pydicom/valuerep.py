@@ -35,7 +35,10 @@ default_encoding = "iso8859"
 # For reading/writing data elements,
 # these ones have longer explicit VR format
 # Taken from PS3.5 Section 7.1.2
-extra_length_VRs = ('OB', 'OD', 'OF', 'OL', 'OW', 'SQ', 'UC', 'UN', 'UR', 'UT')
+extra_length_VRs = (
+    'OB', 'OD', 'OF', 'OL', 'OV', 'OW', 'SQ', 'SV', 'UC', 'UN', 'UR', 'UT',
+    'UV'
+)
 
 # VRs that can be affected by character repertoire
 # in (0008,0005) Specific Character Set
@@ -3,7 +3,6 @@
    data elements to proper python types
 """
 
-import re
 from io import BytesIO
 from struct import (unpack, calcsize)
 from typing import Optional, Union, List, Tuple, Dict, Callable
@@ -170,6 +169,50 @@ def convert_DA_string(
     return convert_string(byte_string, is_little_endian, struct_format)
 
 
+# The characters allowed in encoded DS and IS values, numpy ignores many
+_DS_CHARACTERS = b' \\0123456789.+-eE'
+_IS_CHARACTERS = b' \\0123456789.+-'
+
+
+def _parse_numpy(
+    byte_string: bytes, VR: str, dtype: str, characters: bytes
+) -> Union["numpy.number", "numpy.ndarray"]:
+    """Return the encoded 'DS' or 'IS' value parsed as a :class:`numpy.number`
+    or :class:`numpy.ndarray` of them.
+
+    All the values are parsed in one pass over `byte_string` without decoding
+    it or splitting it into separate strings first.
+
+    Parameters
+    ----------
+    byte_string : bytes
+        The encoded 'DS' or 'IS' element value.
+    VR : str
+        The element's VR, used in the exception message.
+    dtype : str
+        The dtype of the parsed values.
+    characters : bytes
+        The characters allowed in `byte_string`.
+
+    Raises
+    ------
+    ValueError
+        If `byte_string` contains characters not in `characters`.
+    """
+    invalid = byte_string.translate(None, characters)
+    if invalid:
+        raise ValueError(
+            f"{VR}: char(s) not in repertoire: "
+            f"'{invalid.decode(default_encoding)}'"
+        )
+
+    value = numpy.fromstring(byte_string, dtype=dtype, sep='\\')
+    if len(value) == 1:  # Don't use array for one number
+        return value[0]
+
+    return value
+
+
 def convert_DS_string(
     byte_string: bytes,
     is_little_endian: bool,
@@ -213,27 +256,17 @@ def convert_DS_string(
         If :data:`~pydicom.config.use_DS_numpy` is ``True`` and numpy is not
         available
     """
+    if config.use_DS_numpy:
+        if not have_numpy:
+            raise ImportError("use_DS_numpy set but numpy not installed")
+
+        return _parse_numpy(byte_string, 'DS', 'f8', _DS_CHARACTERS)
+
     num_string = byte_string.decode(default_encoding)
     # Below, go directly to DS class instance
     # rather than factory DS, but need to
     # ensure last string doesn't have
     # blank padding (use strip())
-    if config.use_DS_numpy:
-        if not have_numpy:
-            raise ImportError("use_DS_numpy set but numpy not installed")
-        # Check for valid characters. Numpy ignores many
-        regex = r'[ \\0-9\.+eE-]*\Z'
-        if re.match(regex, num_string) is None:
-            raise ValueError(
-                "DS: char(s) not in repertoire: '{}'".format(
-                    re.sub(regex[:-2], '', num_string)
-                )
-            )
-        value = numpy.fromstring(num_string, dtype='f8', sep="\\")
-        if len(value) == 1:  # Don't use array for one number
-            value = value[0]
-        return value
-
     return MultiString(num_string.strip(), valtype=pydicom.valuerep.DSclass)
 
 
@@ -319,32 +352,28 @@ def convert_IS_string(
         If :data:`~pydicom.config.use_IS_numpy` is ``True`` and numpy is not
         available
     """
-    num_string = byte_string.decode(default_encoding)
-
     if config.use_IS_numpy:
         if not have_numpy:
             raise ImportError("use_IS_numpy set but numpy not installed")
-        # Check for valid characters. Numpy ignores many
-        regex = r'[ \\0-9\.+-]*\Z'
-        if re.match(regex, num_string) is None:
-            raise ValueError(
-                "IS: char(s) not in repertoire: '{}'".format(
-                    re.sub(regex[:-2], '', num_string)
-                )
-            )
-        value = numpy.fromstring(num_string, dtype='i8', sep=chr(92))  # 92:'\'
-        if len(value) == 1:  # Don't use array for one number
-            value = value[0]
-        return value
 
+        return _parse_numpy(byte_string, 'IS', 'i8', _IS_CHARACTERS)
+
+    num_string = byte_string.decode(default_encoding)
     return MultiString(num_string, valtype=pydicom.valuerep.IS)
 
 
+# The numpy dtype characters for the standard sizes of the struct formats
+_NUMPY_FORMATS = {
+    'd': 'f8', 'f': 'f4', 'h': 'i2', 'H': 'u2', 'l': 'i4', 'L': 'u4',
+    'q': 'i8', 'Q': 'u8',
+}
+
+
 def convert_numbers(
     byte_string: bytes,
     is_little_endian: bool,
     struct_format: str
-) -> Union[str, int, float, List[Union[int, float]]]:
+) -> Union[str, int, float, List[Union[int, float]], "numpy.ndarray"]:
     """Return a decoded numerical VR value.
 
     Given an encoded DICOM Element value, use `struct_format` and the
@@ -367,9 +396,17 @@ def convert_numbers(
         be returned.
     value
         If `byte_string` encodes a single value then it will be returned.
-    list
+    list or numpy.ndarray
         If `byte_string` encodes multiple values then a list of the decoded
-        values will be returned.
+        values will be returned, or if
+        :data:`~pydicom.config.use_numbers_numpy` is ``True`` a read-only
+        :class:`~numpy.ndarray` view of `byte_string`.
+
+    Raises
+    ------
+    ImportError
+        If :data:`~pydicom.config.use_numbers_numpy` is ``True`` and numpy is
+        not available
     """
     endianChar = '><'[is_little_endian]
 
@@ -385,6 +422,17 @@ def convert_numbers(
             f"of {bytes_per_value}."
         )
 
+    if config.use_numbers_numpy and length > bytes_per_value:
+        if not have_numpy:
+            raise ImportError("use_numbers_numpy set but numpy not installed")
+
+        # A view of the encoded values rather than a copy
+        value = numpy.frombuffer(
+            byte_string, dtype=endianChar + _NUMPY_FORMATS[struct_format]
+        )
+        value.flags.writeable = False
+        return value
+
     format_string = f"{endianChar}{length // bytes_per_value}{struct_format}"
     value: Union[Tuple[int, ...], Tuple[float, ...]] = (
         unpack(format_string, byte_string)